@@ -0,0 +1,172 @@
+"""
+File: SMAsync.py
+Created Date: Sunday, October 18th 2026, 7:26:51 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: asyncio wrapper
+"""  # noqa
+
+from .SharedMemory import SharedMemory
+from concurrent.futures import Executor
+from functools import partial
+import asyncio
+import time
+
+
+class AsyncSharedMemory:
+    """Asyncio wrapper of a SharedMemory instance.
+
+    Semaphore waits, encoding and decoding run in an executor so that the event loop never blocks, changes are
+    detected by polling the generation counter of the header so that a single loop can watch many shared spaces.
+    """
+
+    def __init__(self, memory: SharedMemory, executor: Executor = None) -> None:
+        """Class constructor.
+
+        Args:
+            memory (SharedMemory): client or server instance to wrap
+            executor (Executor, optional): executor running the blocking calls, None uses the loop default one. Defaults to None.
+
+        """
+        self.__memory = memory
+        self.__executor = executor
+
+    @property
+    def memory(self) -> SharedMemory:
+        """Return the wrapped instance.
+
+        Returns:
+            SharedMemory: wrapped instance
+
+        """
+        return self.__memory
+
+    async def getValue(self) -> any:
+        """Return the shared memory value.
+
+        Returns:
+            any: return data from the shared space
+
+        """
+        return await self.__run(self.__memory.getValue)
+
+    async def setValue(self, value: any) -> bool:
+        """Set the shared memory value.
+
+        Args:
+            value (any): data to add to the shared memory
+
+        Returns:
+            bool: return if value has been updated
+
+        """
+        return await self.__run(self.__memory.setValue, value)
+
+    async def getItem(self, key: any) -> any:
+        """Get item value from the shared data.
+
+        Args:
+            key (any): key
+
+        Returns:
+            any: item value
+
+        """
+        return await self.__run(self.__memory.__getitem__, key)
+
+    async def setItem(self, key: any, value: any) -> None:
+        """Update data of the shared space.
+
+        Args:
+            key (any): key
+            value (any): new key value
+
+        """
+        await self.__run(self.__memory.__setitem__, key, value)
+
+    async def waitForChange(self, generation: int, timeout: float = None, interval: float = 0.01) -> int:
+        """Wait until the shared value is written after a given generation.
+
+        Args:
+            generation (int): last generation seen by the caller
+            timeout (float, optional): maximum waiting time in seconds, None waits forever. Defaults to None.
+            interval (float, optional): polling period in seconds. Defaults to 0.01.
+
+        Returns:
+            int: current generation, equal to the given one when the timeout expired or None when the shared space is closed
+
+        """
+        _deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self.__memory.getAvailability():
+            _current = self.__memory.getGeneration()
+
+            if _current != generation or _deadline is not None and time.monotonic() >= _deadline:
+                return _current
+
+            await asyncio.sleep(interval if _deadline is None else min(interval, max(_deadline - time.monotonic(), 0)))
+
+        return None
+
+    async def changes(self, interval: float = 0.01) -> any:
+        """Iterate over the new values of the shared space until it is closed.
+
+        Writes happening between two polls are merged, only the latest value is given.
+
+        Args:
+            interval (float, optional): polling period in seconds. Defaults to 0.01.
+
+        Yields:
+            any: new shared value
+
+        """
+        _generation = self.__memory.getGeneration()
+
+        while True:
+            _generation = await self.waitForChange(_generation, interval=interval)
+
+            if _generation is None:
+                return
+
+            yield await self.getValue()
+
+    async def __run(self, function: callable, *args) -> any:
+        """Run a blocking call in the executor.
+
+        Args:
+            function (callable): blocking call
+            *args: call arguments
+
+        Returns:
+            any: call result
+
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, partial(function, *args))
@@ -0,0 +1,594 @@
+"""
+File: SMCache.py
+Created Date: Sunday, October 18th 2026, 11:59:59 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: memoization cache shared between processes
+2026-10-18	Zen	Defaulting to the native serializer and refusing foreign shared spaces
+"""  # noqa
+
+from .SMError import SMNameLength, SMAlreadyExist, SMUnsafeSerializer
+from .SharedMemory import _SHM_NAME_PREFIX, _SEM_NAME_PREFIX, _MAX_LEN, _MODE
+from .SMSerializer import getSerializer
+import functools
+import posix_ipc
+import hashlib
+import struct
+import pickle
+import time
+import mmap
+import os
+
+_MAGIC = b"PSMC"
+_VERSION = 1
+
+_HEADER = struct.Struct("=4sBB2xQQQQQQQQQQQ")
+_HEADER_SIZE = 128
+
+_HDR_USED = 24
+_HDR_TICK = 48
+_HDR_MISSES = 64
+
+_WORD = struct.Struct("=Q")
+_TICK_HITS = struct.Struct("=QQ")
+
+_SLOT = struct.Struct("=B7x16sQQQd8x")
+_SLOT_SIZE = _SLOT.size
+
+_EMPTY = 0
+_USED = 1
+_DELETED = 2
+
+_MAX_LOAD = 0.75
+_LOW_WATER = 0.75
+
+_MISSING = object()
+
+
+class SharedCache:
+    """Memoization cache shared by every process opening the same name, with LRU and TTL eviction.
+
+    Keys are hashed into a 128-bit digest kept in an open addressing table, values are encoded with a serializer into
+    a data area filled from its start. When the data area or the table is full, expired entries then the least
+    recently used ones are evicted down to 75% of the budget and the remaining values are packed at the start of the
+    data area, so the cost of an eviction is shared by the insertions that follow it. Every operation runs under one
+    semaphore, values are decoded once it is released. Hit, miss and eviction counters live in the shared header.
+    """
+
+    def __init__(self, name: str, capacity: int = 1 << 24, entries: int = 4096, ttl: float = None, serializer: any = "native", silent: bool = False) -> None:
+        """Class constructor, open the cache or create it when missing.
+
+        Args:
+            name (str): desired name for the shared cache
+            capacity (int, optional): size in bytes of the encoded values, only used on creation. Defaults to 1 << 24.
+            entries (int, optional): number of slots of the table, rounded up to a power of two, only used on creation. Defaults to 4096.
+            ttl (float, optional): time to live in seconds of the values set by this instance, None keeps them until evicted. Defaults to None.
+            serializer (any, optional): "native", "pickle", "marshal" or an SMSerializer instance, it must match the one of an existing cache. Defaults to "native".
+            silent (bool, optional): silent mode. Defaults to False.
+
+        Raises:
+            SMNameLength: raise an error when the name is too long
+            SMAlreadyExist: raise an error when a shared space of this name exists and isn't a cache
+            SMUnsafeSerializer: raise an error when an existing cache uses pickle and pickle wasn't given
+            ValueError: raise an error when an existing cache uses another serializer
+
+        """
+        self.__name_memory = _SHM_NAME_PREFIX + name
+        self.__name_semaphore = _SEM_NAME_PREFIX + name
+        self.__ttl = ttl
+        self.__silent = silent
+        self.__mapfile = None
+
+        if len(self.__name_memory) > _MAX_LEN:
+            raise SMNameLength(name, len(self.__name_memory) - len(_SHM_NAME_PREFIX))
+
+        _slots = 1 << max(entries - 1, 1).bit_length()
+        _serializer = getSerializer(serializer)
+
+        self.__semaphore = posix_ipc.Semaphore(self.__name_semaphore, posix_ipc.O_CREAT, _MODE, initial_value=1)
+        _memory = posix_ipc.SharedMemory(self.__name_memory, posix_ipc.O_CREAT, _MODE)
+
+        self.__semaphore.acquire()
+
+        try:
+            _size = os.fstat(_memory.fd).st_size
+            _created = _size == 0
+
+            if _created:
+                _size = _HEADER_SIZE + _slots * _SLOT_SIZE + capacity
+                os.ftruncate(_memory.fd, _size)
+
+            if _size >= _HEADER_SIZE:
+                self.__mapfile = mmap.mmap(_memory.fd, _size)
+
+            if _created:
+                _HEADER.pack_into(self.__mapfile, 0, _MAGIC, _VERSION, _serializer.ID, _slots, capacity, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        finally:
+            self.__semaphore.release()
+            _memory.close_fd()
+
+        _header = None if self.__mapfile is None else _HEADER.unpack_from(self.__mapfile)
+
+        if _header is None or _header[:2] != (_MAGIC, _VERSION) or _HEADER_SIZE + _header[3] * _SLOT_SIZE + _header[4] > _size:
+            _error = SMAlreadyExist(name, "shared memory called '" + name + "' already exist and isn't a shared cache.")
+        elif _header[2] == getSerializer("pickle").ID and _serializer.ID != _header[2]:
+            _error = SMUnsafeSerializer(name, "pickle")
+        elif _header[2] != _serializer.ID:
+            _error = ValueError("serializer " + str(_serializer.name) + " doesn't match the one of the shared cache.")
+        else:
+            _error = None
+
+        if _error is not None:
+            if self.__mapfile is not None:
+                self.__mapfile.close()
+                self.__mapfile = None
+
+            self.__semaphore.close()
+            raise _error
+
+        self.__serializer = _serializer
+        self.__slots = _header[3]
+        self.__capacity = _header[4]
+        self.__data = _HEADER_SIZE + self.__slots * _SLOT_SIZE
+
+    def get(self, key: any, default: any = None) -> any:
+        """Return the value of a key, counting a hit or a miss.
+
+        Args:
+            key (any): key, hashed from its pickle encoding
+            default (any, optional): value returned on a miss. Defaults to None.
+
+        Returns:
+            any: cached value or default
+
+        """
+        _data = self.__lookup(SharedCache.digest(key))
+
+        return default if _data is None else self.__serializer.decode(memoryview(_data))
+
+    def set(self, key: any, value: any, ttl: float = None) -> bool:
+        """Store the value of a key, evicting older values when the cache is full.
+
+        Args:
+            key (any): key, hashed from its pickle encoding
+            value (any): value to store
+            ttl (float, optional): time to live in seconds, None uses the one of the instance. Defaults to None.
+
+        Returns:
+            bool: the value is stored, False when it is larger than the capacity
+
+        """
+        _buffer = bytearray()
+        _size = self.__serializer.encodeInto(_buffer, value)
+        _ttl = self.__ttl if ttl is None else ttl
+
+        return self.__insert(SharedCache.digest(key), bytes(_buffer[:_size]), time.time() + _ttl if _ttl is not None else 0.0)
+
+    def delete(self, key: any) -> bool:
+        """Remove a key.
+
+        Args:
+            key (any): key
+
+        Returns:
+            bool: the key was cached
+
+        """
+        _digest = SharedCache.digest(key)
+
+        with self:
+            _position = self.__find(_digest)
+
+            if _position is not None:
+                self.__remove(_position)
+
+        return _position is not None
+
+    def clear(self) -> None:
+        """Remove every value and reset the counters."""
+        with self:
+            self.__mapfile[_HEADER_SIZE : self.__data] = bytes(self.__data - _HEADER_SIZE)
+            _HEADER.pack_into(self.__mapfile, 0, _MAGIC, _VERSION, self.__serializer.ID, self.__slots, self.__capacity, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    def stats(self) -> dict:
+        """Return the counters shared by every process.
+
+        Returns:
+            dict: hits, misses, hit ratio, evictions, expirations, number of entries, bytes used and capacity
+
+        """
+        with self:
+            _header = _HEADER.unpack_from(self.__mapfile)
+
+        _used, _count, _deleted, _tick, _hits, _misses, _evictions, _expirations, _live = _header[5:14]
+
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "hit_ratio": _hits / (_hits + _misses) if _hits + _misses else 0.0,
+            "evictions": _evictions,
+            "expirations": _expirations,
+            "entries": _count,
+            "bytes": _live,
+            "capacity": self.__capacity,
+        }
+
+    def close(self, remove: bool = False) -> None:
+        """Close the shared cache.
+
+        Args:
+            remove (bool, optional): also remove it, processes still using it keep their mapping. Defaults to False.
+
+        """
+        if self.__mapfile is None:
+            return
+
+        if remove:
+            for _unlink, _name in ((posix_ipc.unlink_semaphore, self.__name_semaphore), (posix_ipc.unlink_shared_memory, self.__name_memory)):
+                try:
+                    _unlink(_name)
+                except posix_ipc.ExistentialError:
+                    pass
+
+        self.__semaphore.close()
+        self.__mapfile.close()
+        self.__mapfile = None
+
+    def __enter__(self) -> "SharedCache":
+        """Acquire the cache.
+
+        Returns:
+            SharedCache: cache
+
+        """
+        self.__semaphore.acquire()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Release the cache."""
+        self.__semaphore.release()
+
+    def __contains__(self, key: any) -> bool:
+        """Check if a key is cached and not expired, without counting a hit or a miss.
+
+        Args:
+            key (any): key
+
+        Returns:
+            bool: the key is cached
+
+        """
+        _digest = SharedCache.digest(key)
+
+        with self:
+            _position = self.__find(_digest)
+
+            return _position is not None and not SharedCache.__expired(_SLOT.unpack_from(self.__mapfile, _position)[5], time.time())
+
+    def __getitem__(self, key: any) -> any:
+        """Return the value of a key.
+
+        Args:
+            key (any): key
+
+        Raises:
+            KeyError: raise an error when the key isn't cached
+
+        Returns:
+            any: cached value
+
+        """
+        _value = self.get(key, _MISSING)
+
+        if _value is _MISSING:
+            raise KeyError(key)
+
+        return _value
+
+    def __setitem__(self, key: any, value: any) -> None:
+        """Store the value of a key.
+
+        Args:
+            key (any): key
+            value (any): value to store
+
+        """
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        """Return the number of entries, expired ones included until they are evicted.
+
+        Returns:
+            int: number of entries
+
+        """
+        with self:
+            return _HEADER.unpack_from(self.__mapfile)[6]
+
+    def __repr__(self) -> str:
+        """Redefine the print method.
+
+        Returns:
+            str: printable value of SharedCache instance
+
+        """
+        return "SharedCache: " + self.__name_memory[len(_SHM_NAME_PREFIX) :] + "\n\tStats: " + self.stats().__repr__()
+
+    @staticmethod
+    def digest(key: any) -> bytes:
+        """Hash a key from its pickle encoding, equal keys built the same way give the same digest in every process.
+
+        Args:
+            key (any): picklable key
+
+        Returns:
+            bytes: 128-bit digest
+
+        """
+        return hashlib.blake2b(pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).digest()
+
+    @staticmethod
+    def __expired(expires: float, now: float) -> bool:
+        """Check an expiry time.
+
+        Args:
+            expires (float): expiry time, 0 for none
+            now (float): current time
+
+        Returns:
+            bool: the time has passed
+
+        """
+        return expires != 0.0 and expires <= now
+
+    def __lookup(self, digest: bytes) -> bytes:
+        """Copy the encoded value of a digest out of the cache, marking it as recently used.
+
+        Args:
+            digest (bytes): key digest
+
+        Returns:
+            bytes: encoded value, None on a miss
+
+        """
+        with self:
+            _position = self.__find(digest)
+
+            if _position is not None:
+                _state, _digest, _offset, _length, _tick, _expires = _SLOT.unpack_from(self.__mapfile, _position)
+
+                if not _expires or _expires > time.time():
+                    _tick, _hits = _TICK_HITS.unpack_from(self.__mapfile, _HDR_TICK)
+                    _TICK_HITS.pack_into(self.__mapfile, _HDR_TICK, _tick + 1, _hits + 1)
+                    _WORD.pack_into(self.__mapfile, _position + 40, _tick + 1)
+                    _offset += self.__data
+
+                    return self.__mapfile[_offset : _offset + _length]
+
+                self.__remove(_position)
+                self.__count(expirations=1)
+
+            _WORD.pack_into(self.__mapfile, _HDR_MISSES, _WORD.unpack_from(self.__mapfile, _HDR_MISSES)[0] + 1)
+
+        return None
+
+    def __insert(self, digest: bytes, data: bytes, expires: float) -> bool:
+        """Store an encoded value.
+
+        Args:
+            digest (bytes): key digest
+            data (bytes): encoded value
+            expires (float): expiry time, 0 for none
+
+        Returns:
+            bool: the value is stored
+
+        """
+        if len(data) > self.__capacity:
+            if not self.__silent:
+                print("WARNING: value of " + str(len(data)) + " bytes is larger than the shared cache.")
+
+            return False
+
+        with self:
+            _position = self.__find(digest)
+
+            if _position is not None:
+                self.__remove(_position)
+
+            _header = _HEADER.unpack_from(self.__mapfile)
+
+            if _header[5] + len(data) > self.__capacity or _header[6] + _header[7] + 1 > self.__slots * _MAX_LOAD:
+                self.__evict(len(data))
+                _header = _HEADER.unpack_from(self.__mapfile)
+
+            _used, _tick = _header[5], _header[8] + 1
+            self.__mapfile[self.__data + _used : self.__data + _used + len(data)] = data
+            _position = self.__free(digest)
+            _deleted = self.__mapfile[_position] == _DELETED
+            _SLOT.pack_into(self.__mapfile, _position, _USED, digest, _used, len(data), _tick, expires)
+            _WORD.pack_into(self.__mapfile, _HDR_USED, _used + len(data))
+            _WORD.pack_into(self.__mapfile, _HDR_TICK, _tick)
+            self.__count(entries=1, live=len(data), deleted=-1 if _deleted else 0)
+
+        return True
+
+    def __evict(self, size: int) -> None:
+        """Evict expired then least recently used values and pack the others, the semaphore must be held.
+
+        Args:
+            size (int): size of the value about to be stored
+
+        """
+        _now = time.time()
+        _table = self.__mapfile[_HEADER_SIZE : self.__data]
+        _live = [_slot for _slot in _SLOT.iter_unpack(_table) if _slot[0] == _USED]
+        _kept = sorted((_slot for _slot in _live if not SharedCache.__expired(_slot[5], _now)), key=lambda _slot: _slot[4])
+        _expirations = len(_live) - len(_kept)
+
+        _budget = self.__capacity * _LOW_WATER - size
+        _room = self.__slots * _MAX_LOAD * _LOW_WATER - 1
+        _bytes = sum(_slot[3] for _slot in _kept)
+        _first = 0
+
+        while _first < len(_kept) and (_bytes > _budget or len(_kept) - _first > _room):
+            _bytes -= _kept[_first][3]
+            _first += 1
+
+        _kept = sorted(_kept[_first:], key=lambda _slot: _slot[2])
+        _values = [self.__mapfile[self.__data + _slot[2] : self.__data + _slot[2] + _slot[3]] for _slot in _kept]
+
+        self.__mapfile[_HEADER_SIZE : self.__data] = bytes(self.__data - _HEADER_SIZE)
+        _used = 0
+
+        for _slot, _value in zip(_kept, _values):
+            self.__mapfile[self.__data + _used : self.__data + _used + len(_value)] = _value
+            _SLOT.pack_into(self.__mapfile, self.__free(_slot[1]), _USED, _slot[1], _used, _slot[3], _slot[4], _slot[5])
+            _used += len(_value)
+
+        _header = list(_HEADER.unpack_from(self.__mapfile))
+        _header[5:8] = _used, len(_kept), 0
+        _header[11] += _first
+        _header[12] += _expirations
+        _header[13] = _used
+        _HEADER.pack_into(self.__mapfile, 0, *_header)
+
+    def __count(self, entries: int = 0, deleted: int = 0, live: int = 0, expirations: int = 0) -> None:
+        """Update the header counters, the semaphore must be held.
+
+        Args:
+            entries (int, optional): entries added. Defaults to 0.
+            deleted (int, optional): deleted slots added. Defaults to 0.
+            live (int, optional): bytes of the entries added. Defaults to 0.
+            expirations (int, optional): expired entries removed. Defaults to 0.
+
+        """
+        _header = list(_HEADER.unpack_from(self.__mapfile))
+        _header[6] += entries
+        _header[7] += deleted
+        _header[12] += expirations
+        _header[13] += live
+        _HEADER.pack_into(self.__mapfile, 0, *_header)
+
+    def __remove(self, position: int) -> None:
+        """Delete the entry of a slot, its bytes are reclaimed by the next eviction, the semaphore must be held.
+
+        Args:
+            position (int): slot position
+
+        """
+        _length = _SLOT.unpack_from(self.__mapfile, position)[3]
+        self.__mapfile[position] = _DELETED
+        self.__count(entries=-1, deleted=1, live=-_length)
+
+    def __find(self, digest: bytes) -> int:
+        """Return the position of a digest, the semaphore must be held.
+
+        Args:
+            digest (bytes): key digest
+
+        Returns:
+            int: slot position, None when missing
+
+        """
+        _mask = self.__slots - 1
+        _index = int.from_bytes(digest[:8], "little") & _mask
+
+        while True:
+            _position = _HEADER_SIZE + _index * _SLOT_SIZE
+            _state = self.__mapfile[_position]
+
+            if _state == _EMPTY:
+                return None
+
+            if _state == _USED and self.__mapfile[_position + 8 : _position + 24] == digest:
+                return _position
+
+            _index = (_index + 1) & _mask
+
+    def __free(self, digest: bytes) -> int:
+        """Return the position of the first empty or deleted slot for a digest, the semaphore must be held.
+
+        Args:
+            digest (bytes): key digest
+
+        Returns:
+            int: slot position
+
+        """
+        _mask = self.__slots - 1
+        _index = int.from_bytes(digest[:8], "little") & _mask
+
+        while self.__mapfile[_HEADER_SIZE + _index * _SLOT_SIZE] == _USED:
+            _index = (_index + 1) & _mask
+
+        return _HEADER_SIZE + _index * _SLOT_SIZE
+
+
+def sharedCache(name: str, capacity: int = 1 << 24, ttl: float = None, entries: int = 4096, serializer: any = "native", silent: bool = False) -> callable:
+    """Memoize a function in a cache shared between processes, the function is keyed by its module and qualified name.
+
+    The wrapper exposes the cache as its cache attribute.
+
+    Args:
+        name (str): name of the shared cache
+        capacity (int, optional): size in bytes of the encoded results. Defaults to 1 << 24.
+        ttl (float, optional): time to live in seconds of the results, None keeps them until evicted. Defaults to None.
+        entries (int, optional): number of slots of the table. Defaults to 4096.
+        serializer (any, optional): serializer of the results, "pickle" for results the native codec doesn't accept. Defaults to "native".
+        silent (bool, optional): silent mode. Defaults to False.
+
+    Returns:
+        callable: decorator
+
+    """
+
+    def decorator(function: callable) -> callable:
+        _cache = SharedCache(name, capacity=capacity, entries=entries, ttl=ttl, serializer=serializer, silent=silent)
+        _function = function.__module__ + "." + function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) -> any:
+            _key = (_function, args, kwargs) if kwargs else (_function, args)
+            _value = _cache.get(_key, _MISSING)
+
+            if _value is _MISSING:
+                _value = function(*args, **kwargs)
+                _cache.set(_key, _value)
+
+            return _value
+
+        wrapper.cache = _cache
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,818 @@
+"""
+File: SMCodec.py
+Created Date: Sunday, October 18th 2026, 10:12:31 am
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: single pass encoder
+2026-10-18	Zen	Adding offset cursor decoder
+2026-10-18	Zen	Adding slotted layout for dict and list
+2026-10-18	Zen	Adding hash index and lazy access to slotted frames
+2026-10-18	Zen	Moving the closed state to the segment header
+2026-10-18	Zen	Adding compact wire format, legacy frames stay readable
+2026-10-18	Zen	Adding type id of values encoded by another serializer
+2026-10-18	Zen	Importing numpy on first use
+2026-10-18	Zen	Adding structured dtypes
+2026-10-18	Zen	Widening the dtype size of compact arrays
+"""  # noqa
+
+from .SMError import SMTypeError, SMEncoding
+import struct
+import zlib
+import sys
+
+numpy = None
+
+_BEGIN = b"\xaa"
+_END = b"\xbb"
+_COMPACT = b"\xac"
+
+_INT = b"\x00"
+_FLOAT = b"\x01"
+_BOOL = b"\x02"
+_COMPLEX = b"\x03"
+_STR = b"\x04"
+_LIST = b"\x05"
+_DICT = b"\x06"
+_TUPLE = b"\x07"
+_NPARRAY = b"\x08"
+_SLOTLIST = b"\x09"
+_SLOTDICT = b"\x0a"
+_FALSE = b"\x0b"
+_TRUE = b"\x0c"
+_OBJECT = b"\x0d"
+
+_SLOTTED = (_SLOTLIST, _SLOTDICT)
+_ARRAY_FIELDS = 24
+_VALUE_TYPES = {_INT[0]: int, _FLOAT[0]: float, _BOOL[0]: bool, _COMPLEX[0]: complex, _STR[0]: str, _LIST[0]: list, _DICT[0]: dict, _TUPLE[0]: tuple, _SLOTLIST[0]: list, _SLOTDICT[0]: dict}
+
+_SMALL = 0x80
+_SMALL_BIAS = 0xA0
+_SMALL_MIN = _SMALL - _SMALL_BIAS
+_SMALL_MAX = 0x100 - _SMALL_BIAS
+
+_BYTES = [bytes((i,)) for i in range(0x100)]
+_TYPE_IDS = bytes(_INT[0] if i >= _SMALL else _BOOL[0] if i in (_FALSE[0], _TRUE[0]) else i for i in range(0x100))
+
+
+def encode(value: any) -> bytes:
+    """Encode value.
+
+    Args:
+        value (any): data to encode
+
+    Returns:
+        bytes: encoded data
+
+    """
+    _buffer = bytearray()
+    _size = encodeInto(_buffer, value)
+
+    return bytes(_buffer[:_size])
+
+
+def encodeInto(buffer: bytearray, value: any, offset: int = 0) -> int:
+    """Encode value into a buffer in a single pass.
+
+    The buffer grows when it is too small and is never shrunk, so it can be reused between calls.
+    The value is written in the compact format: a marker byte then the tagged value, lengths and counts are varints,
+    ints between -32 and 95, True and False take a single byte, and container elements have no framing bytes.
+
+    Args:
+        buffer (bytearray): destination buffer
+        value (any): data to encode
+        offset (int, optional): position of the first encoded byte. Defaults to 0.
+
+    Raises:
+        SMTypeError: raise an error when the value type is not supported
+
+    Returns:
+        int: position right after the last encoded byte
+
+    """
+    buffer[offset : offset + 1] = _COMPACT
+
+    try:
+        return _encodeElement(buffer, offset + 1, value)
+    except SMTypeError:
+        if numpy is not None or "numpy" not in sys.modules:
+            raise
+
+    _importNumpy()
+
+    return _encodeElement(buffer, offset + 1, value)
+
+
+def encodeSlotted(buffer: bytearray, value: any, slack: int, offset: int = 0) -> int:
+    """Encode a dict or a list with every entry stored in its own slot.
+
+    A slot keeps spare bytes after the entry so that a value of the same size or slightly bigger can be rewritten in place.
+    The frame holds the number of entries and the position of every slot, followed for a dict by an open addressing
+    index of the key hashes.
+
+    Args:
+        buffer (bytearray): destination buffer
+        value (any): dict or list to encode
+        slack (int): spare bytes reserved in every slot
+        offset (int, optional): position of the first encoded byte. Defaults to 0.
+
+    Raises:
+        SMTypeError: raise an error when the value is neither a dict nor a list
+
+    Returns:
+        int: position right after the last encoded byte
+
+    """
+    if type(value) is dict:
+        _tag, _items = _SLOTDICT, value.items()
+        _buckets = 1 << (2 * len(value) - 1).bit_length() if value else 0
+    elif type(value) is list:
+        _tag, _items = _SLOTLIST, ((None, e) for e in value)
+        _buckets = 0
+    else:
+        raise SMTypeError(type(value))
+
+    _table = offset + 26
+    _index = _table + 8 * len(value)
+    _entry = _index + 8 * _buckets
+
+    buffer[offset:_entry] = _COMPACT + _tag + bytes(_entry - offset - 2)
+    buffer[offset + 10 : _table] = len(value).to_bytes(8, byteorder="big") + _buckets.to_bytes(8, byteorder="big")
+
+    for i, (k, v) in enumerate(_items):
+        buffer[_entry : _entry + 4] = bytes(4)
+
+        if _tag == _SLOTDICT:
+            _end = encodeInto(buffer, k, _entry + 4)
+            _hash = zlib.crc32(buffer[_entry + 4 : _end])
+            _bucket = _hash & (_buckets - 1)
+
+            while buffer[_index + 8 * _bucket + 4 : _index + 8 * _bucket + 8] != bytes(4):
+                _bucket = (_bucket + 1) & (_buckets - 1)
+
+            struct.pack_into(">II", buffer, _index + 8 * _bucket, _hash, i + 1)
+        else:
+            _end = _entry + 4
+
+        _end = encodeInto(buffer, v, _end)
+        _capacity = _end - _entry - 4 + slack
+
+        buffer[_end : _entry + 4 + _capacity] = bytes(slack)
+        buffer[_entry : _entry + 4] = _capacity.to_bytes(4, byteorder="big")
+        buffer[_table + 8 * i : _table + 8 * i + 8] = (_entry - offset).to_bytes(8, byteorder="big")
+
+        _entry += 4 + _capacity
+
+    buffer[offset + 2 : offset + 10] = (_entry - offset - 10).to_bytes(8, byteorder="big")
+
+    return _entry
+
+
+def slotCount(view: memoryview, offset: int = 0) -> int:
+    """Return the number of entries of a slotted frame.
+
+    Args:
+        view (memoryview): encoded data
+        offset (int, optional): position of the slotted frame. Defaults to 0.
+
+    Returns:
+        int: number of entries
+
+    """
+    return int.from_bytes(view[offset + 10 : offset + 18], "big")
+
+
+def locateSlot(view: memoryview, key: any, offset: int = 0) -> tuple:
+    """Locate the slot of a list index or of a dict key in a slotted frame.
+
+    Args:
+        view (memoryview): encoded data
+        key (any): list index or dict key
+        offset (int, optional): position of the slotted frame. Defaults to 0.
+
+    Raises:
+        IndexError: raise an error when the list index is out of range
+
+    Returns:
+        tuple: position of the stored element (value for a dict) and end of its slot, None when the key is missing
+
+    """
+    _count = slotCount(view, offset)
+    _table = offset + 26
+
+    if view[offset + 1] == _SLOTLIST[0]:
+        _index = key + _count if key < 0 else key
+
+        if not 0 <= _index < _count:
+            raise IndexError("list index out of range")
+
+        _entry = offset + int.from_bytes(view[_table + 8 * _index : _table + 8 * _index + 8], "big")
+
+        return _entry + 4, _entry + 4 + int.from_bytes(view[_entry : _entry + 4], "big")
+
+    _buckets = int.from_bytes(view[offset + 18 : offset + 26], "big")
+
+    if _buckets == 0:
+        return None
+
+    _key = encode(key)
+    _hash = zlib.crc32(_key)
+    _index = _table + 8 * _count
+    _bucket = _hash & (_buckets - 1)
+
+    while True:
+        _stored_hash, _slot = struct.unpack_from(">II", view, _index + 8 * _bucket)
+
+        if _slot == 0:
+            return None
+
+        if _stored_hash == _hash:
+            _entry = offset + int.from_bytes(view[_table + 8 * _slot - 8 : _table + 8 * _slot], "big")
+
+            if view[_entry + 4 : _entry + 4 + len(_key)] == _key:
+                return _entry + 4 + len(_key), _entry + 4 + int.from_bytes(view[_entry : _entry + 4], "big")
+
+        _bucket = (_bucket + 1) & (_buckets - 1)
+
+
+def decodeSlot(view: memoryview, key: any, offset: int = 0) -> any:
+    """Decode only the entry of a list index or of a dict key in a slotted frame.
+
+    Args:
+        view (memoryview): encoded data
+        key (any): list index or dict key
+        offset (int, optional): position of the slotted frame. Defaults to 0.
+
+    Raises:
+        KeyError: raise an error when the dict key is missing
+        IndexError: raise an error when the list index is out of range
+
+    Returns:
+        any: decoded entry
+
+    """
+    _slot = locateSlot(view, key, offset)
+
+    if _slot is None:
+        raise KeyError(key)
+
+    return decode(view[_slot[0] : _slot[1]].tobytes())
+
+
+def slotKeys(view: memoryview, offset: int = 0) -> list:
+    """Decode only the keys of a slotted dict frame.
+
+    Args:
+        view (memoryview): encoded data
+        offset (int, optional): position of the slotted frame. Defaults to 0.
+
+    Returns:
+        list: dict keys
+
+    """
+    _table = offset + 26
+
+    return [decodeFrom(view, offset + int.from_bytes(view[_table + 8 * i : _table + 8 * i + 8], "big") + 4)[0] for i in range(slotCount(view, offset))]
+
+
+def _encodeElement(buffer: bytearray, offset: int, value: any) -> int:
+    """Encode a tagged value without marker."""
+    try:
+        _encoder = _ENCODERS[type(value)]
+    except KeyError:
+        raise SMTypeError(type(value)) from None
+
+    return _encoder(buffer, offset, value)
+
+
+def _encodeVarint(buffer: bytearray, offset: int, value: int) -> int:
+    """Encode a non-negative int on 7 bits per byte, the high bit marking that another byte follows."""
+    if value < 0x80:
+        buffer[offset : offset + 1] = _BYTES[value]
+
+        return offset + 1
+
+    _data = bytearray()
+
+    while value >= 0x80:
+        _data.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    _data.append(value)
+    buffer[offset : offset + len(_data)] = _data
+
+    return offset + len(_data)
+
+
+def _encodeInt(buffer: bytearray, offset: int, value: int) -> int:
+    """Encode an int, on a single byte when small, otherwise on as many bytes as needed."""
+    if _SMALL_MIN <= value < _SMALL_MAX:
+        buffer[offset : offset + 1] = _BYTES[value + _SMALL_BIAS]
+
+        return offset + 1
+
+    _length = (value.bit_length() + 8) // 8
+    buffer[offset : offset + 1] = _INT
+    offset = _encodeVarint(buffer, offset + 1, _length)
+    buffer[offset : offset + _length] = value.to_bytes(_length, "big", signed=True)
+
+    return offset + _length
+
+
+def _encodeFloat(buffer: bytearray, offset: int, value: float) -> int:
+    """Encode a float."""
+    buffer[offset : offset + 9] = _FLOAT + struct.pack(">d", value)
+
+    return offset + 9
+
+
+def _encodeComplex(buffer: bytearray, offset: int, value: complex) -> int:
+    """Encode a complex number."""
+    buffer[offset : offset + 17] = _COMPLEX + struct.pack(">dd", value.real, value.imag)
+
+    return offset + 17
+
+
+def _encodeBool(buffer: bytearray, offset: int, value: bool) -> int:
+    """Encode a boolean."""
+    buffer[offset : offset + 1] = _TRUE if value else _FALSE
+
+    return offset + 1
+
+
+def _encodeStr(buffer: bytearray, offset: int, value: str) -> int:
+    """Encode a string."""
+    _str_encoded = value.encode("utf-8")
+
+    if len(_str_encoded) < 0x80:
+        _end = offset + 2 + len(_str_encoded)
+        buffer[offset:_end] = _STR + _BYTES[len(_str_encoded)] + _str_encoded
+
+        return _end
+
+    buffer[offset : offset + 1] = _STR
+    offset = _encodeVarint(buffer, offset + 1, len(_str_encoded))
+    buffer[offset : offset + len(_str_encoded)] = _str_encoded
+
+    return offset + len(_str_encoded)
+
+
+def _encodeSequence(buffer: bytearray, offset: int, value: list, tag: bytes) -> int:
+    """Encode a list or a tuple as its number of elements followed by the elements."""
+    buffer[offset : offset + 1] = tag
+    offset = _encodeVarint(buffer, offset + 1, len(value))
+
+    try:
+        for e in value:
+            offset = _ENCODERS[type(e)](buffer, offset, e)
+    except KeyError:
+        raise SMTypeError(type(e)) from None
+
+    return offset
+
+
+def _encodeList(buffer: bytearray, offset: int, value: list) -> int:
+    """Encode a list."""
+    return _encodeSequence(buffer, offset, value, _LIST)
+
+
+def _encodeTuple(buffer: bytearray, offset: int, value: tuple) -> int:
+    """Encode a tuple."""
+    return _encodeSequence(buffer, offset, value, _TUPLE)
+
+
+def _encodeDict(buffer: bytearray, offset: int, value: dict) -> int:
+    """Encode a dict or the value described by a JSON template."""
+    _first = next(iter(value), None)
+
+    if _first == "_LIST":
+        return _encodeList(buffer, offset, [0] * value[_first])
+    elif _first == "_NPARRAY":
+        return _encodeArray(buffer, offset, _importNumpy().zeros(value[_first][0], dtype=value[_first][1]))
+
+    buffer[offset : offset + 1] = _DICT
+    offset = _encodeVarint(buffer, offset + 1, len(value))
+
+    try:
+        for k, v in value.items():
+            offset = _ENCODERS[type(k)](buffer, offset, k)
+            offset = _ENCODERS[type(v)](buffer, offset, v)
+    except KeyError:
+        raise SMTypeError(type(k) if type(k) not in _ENCODERS else type(v)) from None
+
+    return offset
+
+
+def _encodeArray(buffer: bytearray, offset: int, value: "numpy.ndarray") -> int:
+    """Encode a numpy array with fixed size fields so that its data stays at a known position."""
+    _data = numpy.ascontiguousarray(value).reshape(-1).view(numpy.uint8)
+    _start = offset + 1 + _ARRAY_FIELDS
+    _end = _start + _data.nbytes
+
+    buffer[offset:_start] = _NPARRAY + bytes(_ARRAY_FIELDS)
+    buffer[_start:_end] = _data.data
+
+    _shape_end = encodeInto(buffer, value.shape, _end)
+    _dtype_end = encodeInto(buffer, value.dtype.name if value.dtype.names is None else _describeFields(value.dtype), _shape_end)
+
+    struct.pack_into(">QQQ", buffer, offset + 1, _dtype_end - offset - 9, _shape_end - _end, _dtype_end - _shape_end)
+
+    return _dtype_end
+
+
+_ENCODERS = {
+    int: _encodeInt,
+    float: _encodeFloat,
+    complex: _encodeComplex,
+    bool: _encodeBool,
+    str: _encodeStr,
+    list: _encodeList,
+    tuple: _encodeTuple,
+    dict: _encodeDict,
+}
+
+
+def decode(buffer: bytes) -> any:
+    """Decode value.
+
+    Numpy arrays are returned as read-only views over the given buffer. Both the compact format and the legacy
+    framed one are read.
+
+    Args:
+        buffer (bytes): encoded data
+
+    Returns:
+        any: decoded data
+
+    """
+    return decodeFrom(memoryview(buffer))[0]
+
+
+def decodeFrom(view: memoryview, offset: int = 0) -> tuple:
+    """Decode the value encoded at a given position of a memoryview.
+
+    Args:
+        view (memoryview): encoded data
+        offset (int, optional): position of the first encoded byte. Defaults to 0.
+
+    Raises:
+        SMEncoding: raise an error when the framing or the type of the value is not valid
+
+    Returns:
+        tuple: decoded data and position right after the last encoded byte
+
+    """
+    if view[offset] == _COMPACT_ID:
+        return _decodeElement(view, offset + 1)
+    elif view[offset] != _BEGIN_ID:
+        raise SMEncoding("BEGIN")
+
+    try:
+        _decoder = _LEGACY_DECODERS[view[offset + 1]]
+    except KeyError:
+        raise SMEncoding("TYPE") from None
+
+    _value, offset = _decoder(view, offset + 2)
+
+    if view[offset] != _END_ID:
+        raise SMEncoding("END")
+
+    return _value, offset + 1
+
+
+def _decodeElement(view: memoryview, offset: int) -> tuple:
+    """Decode a tagged value without marker."""
+    _tag = view[offset]
+
+    if _tag >= _SMALL:
+        return _tag - _SMALL_BIAS, offset + 1
+
+    try:
+        _decoder = _DECODERS[_tag]
+    except KeyError:
+        raise SMEncoding("TYPE") from None
+
+    return _decoder(view, offset + 1)
+
+
+def _decodeVarint(view: memoryview, offset: int) -> tuple:
+    """Decode a varint."""
+    _byte = view[offset]
+
+    if _byte < 0x80:
+        return _byte, offset + 1
+
+    _value = _byte & 0x7F
+    _shift = 7
+
+    while True:
+        offset += 1
+        _byte = view[offset]
+        _value |= (_byte & 0x7F) << _shift
+        _shift += 7
+
+        if _byte < 0x80:
+            return _value, offset + 1
+
+
+def _decodeInt(view: memoryview, offset: int) -> tuple:
+    """Decode an int."""
+    _length, offset = _decodeVarint(view, offset)
+
+    return int.from_bytes(view[offset : offset + _length], "big", signed=True), offset + _length
+
+
+def _decodeFloat(view: memoryview, offset: int) -> tuple:
+    """Decode a float."""
+    return struct.unpack_from(">d", view, offset)[0], offset + 8
+
+
+def _decodeComplex(view: memoryview, offset: int) -> tuple:
+    """Decode a complex number."""
+    return complex(*struct.unpack_from(">dd", view, offset)), offset + 16
+
+
+def _decodeFalse(view: memoryview, offset: int) -> tuple:
+    """Decode False."""
+    return False, offset
+
+
+def _decodeTrue(view: memoryview, offset: int) -> tuple:
+    """Decode True."""
+    return True, offset
+
+
+def _decodeStr(view: memoryview, offset: int) -> tuple:
+    """Decode a string."""
+    _length = view[offset]
+
+    if _length < 0x80:
+        offset += 1
+    else:
+        _length, offset = _decodeVarint(view, offset)
+
+    return str(view[offset : offset + _length], "utf-8"), offset + _length
+
+
+def _decodeList(view: memoryview, offset: int) -> tuple:
+    """Decode a list, small ints are decoded inline."""
+    _count, offset = _decodeVarint(view, offset)
+    _value = []
+    _append = _value.append
+
+    for _ in range(_count):
+        _tag = view[offset]
+
+        if _tag >= _SMALL:
+            _append(_tag - _SMALL_BIAS)
+            offset += 1
+        else:
+            _element, offset = _decodeElement(view, offset)
+            _append(_element)
+
+    return _value, offset
+
+
+def _decodeTuple(view: memoryview, offset: int) -> tuple:
+    """Decode a tuple."""
+    _value, offset = _decodeList(view, offset)
+
+    return tuple(_value), offset
+
+
+def _decodeDict(view: memoryview, offset: int) -> tuple:
+    """Decode a dict."""
+    _count, offset = _decodeVarint(view, offset)
+    _value = {}
+
+    for _ in range(_count):
+        _key, offset = _decodeElement(view, offset)
+        _tag = view[offset]
+
+        if _tag >= _SMALL:
+            _value[_key] = _tag - _SMALL_BIAS
+            offset += 1
+        else:
+            _value[_key], offset = _decodeElement(view, offset)
+
+    return _value, offset
+
+
+def _decodeLegacyInt(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy int."""
+    _end = offset + 1 + view[offset]
+
+    return int.from_bytes(view[offset + 1 : _end], "big", signed=True), _end
+
+
+def _decodeLegacyFloat(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy float."""
+    return struct.unpack_from(">d", view, offset + 1)[0], offset + 9
+
+
+def _decodeLegacyComplex(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy complex number."""
+    return complex(*struct.unpack_from(">d2xd", view, offset + 3)), offset + 1 + view[offset]
+
+
+def _decodeLegacyBool(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy boolean."""
+    return bool(view[offset + 1]), offset + 2
+
+
+def _decodeLegacyStr(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy string."""
+    _end = offset + 1 + view[offset]
+
+    return str(view[offset + 1 : _end], "utf-8"), _end
+
+
+def _decodeLegacyList(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy list."""
+    _end = offset + 8 + int.from_bytes(view[offset : offset + 8], "big")
+    offset += 8
+    _value = []
+
+    while offset < _end:
+        _element, offset = decodeFrom(view, offset)
+        _value.append(_element)
+
+    return _value, _end
+
+
+def _decodeLegacyTuple(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy tuple."""
+    _value, offset = _decodeLegacyList(view, offset)
+
+    return tuple(_value), offset
+
+
+def _decodeLegacyDict(view: memoryview, offset: int) -> tuple:
+    """Decode a legacy dict."""
+    _end = offset + 8 + int.from_bytes(view[offset : offset + 8], "big")
+    offset += 8
+    _value = {}
+
+    while offset < _end:
+        _key, offset = decodeFrom(view, offset)
+        _value[_key], offset = decodeFrom(view, offset)
+
+    return _value, _end
+
+
+def _decodeSlotted(view: memoryview, offset: int) -> tuple:
+    """Decode a slotted dict or list."""
+    _frame = offset - 2
+    _count = int.from_bytes(view[offset + 8 : offset + 16], "big")
+    _table = offset + 24
+    _is_dict = view[offset - 1] == _SLOTDICT[0]
+    _value = {} if _is_dict else []
+
+    for i in range(_count):
+        _position = _frame + int.from_bytes(view[_table + 8 * i : _table + 8 * i + 8], "big") + 4
+
+        if _is_dict:
+            _key, _position = decodeFrom(view, _position)
+            _value[_key] = decodeFrom(view, _position)[0]
+        else:
+            _value.append(decodeFrom(view, _position)[0])
+
+    return _value, offset + 8 + int.from_bytes(view[offset : offset + 8], "big")
+
+
+def _decodeArray(view: memoryview, offset: int) -> tuple:
+    """Decode a numpy array."""
+    _size, _size_shape, _size_dtype = struct.unpack_from(">QQQ", view, offset)
+    _end = offset + 8 + _size
+    _shape_start = _end - _size_dtype - _size_shape
+
+    _shape, _dtype_start = decodeFrom(view, _shape_start)
+    _dtype = dtypeFrom(decodeFrom(view, _dtype_start)[0])
+
+    return (numpy or _importNumpy()).frombuffer(view[offset + _ARRAY_FIELDS : _shape_start], dtype=_dtype).reshape(_shape), _end
+
+
+def _decodeLegacyArray(view: memoryview, offset: int) -> tuple:
+    """Decode a numpy array of a legacy frame, its dtype size takes a single byte."""
+    _end = offset + 8 + int.from_bytes(view[offset : offset + 8], "big")
+    _size_dtype = view[offset + 16]
+    _shape_start = _end - _size_dtype - int.from_bytes(view[offset + 8 : offset + 16], "big")
+
+    _shape, _dtype_start = decodeFrom(view, _shape_start)
+    _dtype = dtypeFrom(decodeFrom(view, _dtype_start)[0])
+
+    return (numpy or _importNumpy()).frombuffer(view[offset + 17 : _shape_start], dtype=_dtype).reshape(_shape), _end
+
+
+def _describeFields(dtype: "numpy.dtype") -> dict:
+    """Describe a structured dtype with encodable values, nested structured fields included."""
+    _formats = []
+
+    for _name in dtype.names:
+        _field = dtype.fields[_name][0]
+        _base = _field.base.str if _field.base.names is None else _describeFields(_field.base)
+        _formats.append(_base if _field.shape == () else (_base, _field.shape))
+
+    return {"names": list(dtype.names), "formats": _formats, "offsets": [dtype.fields[_name][1] for _name in dtype.names], "itemsize": dtype.itemsize}
+
+
+def dtypeFrom(description: any) -> "numpy.dtype":
+    """Rebuild a dtype from its encoded description.
+
+    Args:
+        description (any): dtype name, or names, formats, offsets and itemsize of a structured dtype
+
+    Returns:
+        numpy.dtype: dtype
+
+    """
+    _numpy = numpy or _importNumpy()
+
+    if type(description) is str:
+        return _numpy.dtype(description)
+
+    _format = lambda f: (dtypeFrom(f[0]), f[1]) if type(f) is tuple else dtypeFrom(f)  # noqa: E731
+
+    return _numpy.dtype({"names": description["names"], "formats": [_format(f) for f in description["formats"]], "offsets": description["offsets"], "itemsize": description["itemsize"]})
+
+
+def _importNumpy() -> any:
+    """Import numpy on first use and register the ndarray encoder.
+
+    Values can only be numpy arrays once numpy has been imported by the caller, so encoding retries after a type
+    error only when numpy is loaded but not registered yet.
+
+    Returns:
+        any: numpy module
+
+    """
+    global numpy
+
+    if numpy is None:
+        import numpy as _numpy
+
+        _ENCODERS[_numpy.ndarray] = _encodeArray
+        numpy = _numpy
+
+    return numpy
+
+
+_BEGIN_ID = _BEGIN[0]
+_END_ID = _END[0]
+_COMPACT_ID = _COMPACT[0]
+
+_DECODERS = {
+    _INT[0]: _decodeInt,
+    _FLOAT[0]: _decodeFloat,
+    _COMPLEX[0]: _decodeComplex,
+    _FALSE[0]: _decodeFalse,
+    _TRUE[0]: _decodeTrue,
+    _STR[0]: _decodeStr,
+    _LIST[0]: _decodeList,
+    _TUPLE[0]: _decodeTuple,
+    _DICT[0]: _decodeDict,
+    _NPARRAY[0]: _decodeArray,
+    _SLOTLIST[0]: _decodeSlotted,
+    _SLOTDICT[0]: _decodeSlotted,
+}
+
+_LEGACY_DECODERS = {
+    _INT[0]: _decodeLegacyInt,
+    _FLOAT[0]: _decodeLegacyFloat,
+    _COMPLEX[0]: _decodeLegacyComplex,
+    _BOOL[0]: _decodeLegacyBool,
+    _STR[0]: _decodeLegacyStr,
+    _LIST[0]: _decodeLegacyList,
+    _TUPLE[0]: _decodeLegacyTuple,
+    _DICT[0]: _decodeLegacyDict,
+    _NPARRAY[0]: _decodeLegacyArray,
+    _SLOTLIST[0]: _decodeSlotted,
+    _SLOTDICT[0]: _decodeSlotted,
+}
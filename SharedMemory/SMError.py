@@ -36,6 +36,7 @@ HISTORY:
 2020-07-03	Zen	Adding new exception
 2020-07-02	Zen	Creating file
 2024-11-03	Zen	Updating docstring
+2026-10-18	Zen	Adding unsafe serializer error
 """  # noqa
 
 
@@ -213,3 +214,28 @@ class SMNameLength(Exception):
         self.message = "Your shared memory name: '" + name + "' have a length of " + str(message) + ". It shouldn't exceed 9 characters."
 
         super().__init__(self.message)
+
+
+class SMUnsafeSerializer(Exception):
+    """Class focused on catching an attempt to read a shared memory with a serializer that wasn't explicitly accepted.
+
+    Args:
+        Exception (Exception):
+
+    """
+
+    def __init__(self, name: str, serializer: str, message: str = None) -> None:
+        """Class constructor.
+
+        Args:
+            name (str): shared memory name
+            serializer (str): serializer named by the shared memory
+            message (str, optional): message. Defaults to None.
+
+        """
+        if message is None:
+            self.message = "shared memory called '" + name + "' uses the " + serializer + " serializer, it must be given explicitly to read it."
+        else:
+            self.message = message
+
+        super().__init__(self.message)
@@ -0,0 +1,421 @@
+"""
+File: SMQueue.py
+Created Date: Sunday, October 18th 2026, 5:12:36 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: multi-producer/multi-consumer ring buffer queue
+"""  # noqa
+
+from .SMError import SMSizeError, SMNameLength, SMNotDefined, SMEncoding
+from .SharedMemory import _SHM_NAME_PREFIX, _SEM_NAME_PREFIX, _MAX_LEN, _MODE, _FLAG
+from .SMCodec import encode, decode
+import posix_ipc
+import struct
+import queue
+import mmap
+import time
+
+_MAGIC = b"PSHQ"
+_VERSION = 1
+
+_HDR_MAGIC = 0
+_HDR_VERSION = 4
+_HDR_STATE = 5
+_HDR_HEAD = 8
+_HDR_TAIL = 16
+_HDR_CAPACITY = 24
+_HDR_COUNT = 32
+_HDR_WAITERS = 40
+_HEADER_SIZE = 64
+
+_STATE_OPEN = 0x01
+_STATE_CLOSED = 0x02
+
+_RECORD = 4
+
+_ITEMS_SUFFIX = "_i"
+_SPACE_SUFFIX = "_s"
+
+
+class SharedQueue:
+    """Multi-producer/multi-consumer queue of variable-length records stored in a shared ring buffer."""
+
+    def __init__(self, name: str, size: int = 1 << 20, client: bool = False, silent: bool = False) -> None:
+        """Class constructor.
+
+        Args:
+            name (str): desired name for the shared queue
+            size (int, optional): size in bytes of the ring, only used by the client. Defaults to 1 << 20.
+            client (bool, optional): create the queue or attach to an existing one. Defaults to False.
+            silent (bool, optional): silent mode. Defaults to False.
+
+        Raises:
+            SMNameLength: raise an error when the name is too long
+            SMNotDefined: raise an error when a server attaches to a queue that doesn't exist
+
+        """
+        self.__name_memory = _SHM_NAME_PREFIX + name
+        self.__name_semaphore = _SEM_NAME_PREFIX + name
+        self.__client = client
+        self.__silent = silent
+        self.__memory = None
+        self.__mapfile = None
+
+        if len(self.__name_memory) > _MAX_LEN:
+            raise SMNameLength(name, len(self.__name_memory) - len(_SHM_NAME_PREFIX))
+
+        if self.__client:
+            for _name in (self.__name_semaphore, self.__name_semaphore + _ITEMS_SUFFIX, self.__name_semaphore + _SPACE_SUFFIX):
+                try:
+                    posix_ipc.unlink_semaphore(_name)
+                except posix_ipc.ExistentialError:
+                    pass
+
+            try:
+                posix_ipc.unlink_shared_memory(self.__name_memory)
+            except posix_ipc.ExistentialError:
+                pass
+
+            self.__memory = posix_ipc.SharedMemory(self.__name_memory, flags=_FLAG, mode=_MODE, size=_HEADER_SIZE + size)
+            self.__semaphore = posix_ipc.Semaphore(self.__name_semaphore, _FLAG, _MODE, initial_value=1)
+            self.__items = posix_ipc.Semaphore(self.__name_semaphore + _ITEMS_SUFFIX, _FLAG, _MODE, initial_value=0)
+            self.__space = posix_ipc.Semaphore(self.__name_semaphore + _SPACE_SUFFIX, _FLAG, _MODE, initial_value=0)
+        else:
+            try:
+                self.__memory = posix_ipc.SharedMemory(self.__name_memory)
+                self.__semaphore = posix_ipc.Semaphore(self.__name_semaphore)
+                self.__items = posix_ipc.Semaphore(self.__name_semaphore + _ITEMS_SUFFIX)
+                self.__space = posix_ipc.Semaphore(self.__name_semaphore + _SPACE_SUFFIX)
+            except posix_ipc.ExistentialError:
+                if not self.__silent:
+                    print("ERROR: Shared queue '" + name + "' doesn't exist.")
+
+                raise SMNotDefined(name)
+
+        self.__mapfile = mmap.mmap(self.__memory.fd, self.__memory.size)
+        self.__memory.close_fd()
+
+        if self.__client:
+            self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] = _MAGIC
+            self.__mapfile[_HDR_VERSION] = _VERSION
+            struct.pack_into(">Q", self.__mapfile, _HDR_CAPACITY, size)
+            self.__mapfile[_HDR_STATE] = _STATE_OPEN
+        elif self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] != _MAGIC or self.__mapfile[_HDR_VERSION] != _VERSION:
+            raise SMEncoding("HEADER")
+
+        self.__capacity = struct.unpack_from(">Q", self.__mapfile, _HDR_CAPACITY)[0]
+
+    def put(self, value: any, block: bool = True, timeout: float = None) -> None:
+        """Append a value at the end of the queue.
+
+        Args:
+            value (any): value to append
+            block (bool, optional): wait for free space when the ring is full. Defaults to True.
+            timeout (float, optional): maximum waiting time in seconds, None waits forever. Defaults to None.
+
+        Raises:
+            SMSizeError: raise an error when the encoded value can't fit in the ring
+            queue.Full: raise an error when the ring is still full after the timeout or without blocking
+
+        """
+        _data = encode(value)
+        _record = struct.pack(">I", len(_data)) + _data
+
+        if len(_record) > self.__capacity:
+            raise SMSizeError("encoded value of " + str(len(_data)) + " bytes doesn't fit in the shared queue.")
+
+        _deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            self.__semaphore.acquire()
+
+            _head, _tail = struct.unpack_from(">QQ", self.__mapfile, _HDR_HEAD)
+
+            if self.__capacity - (_tail - _head) >= len(_record):
+                self.__writeRing(_tail, _record)
+                struct.pack_into(">Q", self.__mapfile, _HDR_TAIL, _tail + len(_record))
+                struct.pack_into(">Q", self.__mapfile, _HDR_COUNT, struct.unpack_from(">Q", self.__mapfile, _HDR_COUNT)[0] + 1)
+                self.__semaphore.release()
+                self.__items.release()
+
+                return
+
+            if not block or _deadline is not None and time.monotonic() >= _deadline:
+                self.__semaphore.release()
+
+                raise queue.Full
+
+            struct.pack_into(">I", self.__mapfile, _HDR_WAITERS, struct.unpack_from(">I", self.__mapfile, _HDR_WAITERS)[0] + 1)
+            self.__semaphore.release()
+
+            if not self.__acquire(self.__space, None if _deadline is None else max(_deadline - time.monotonic(), 0)):
+                self.__semaphore.acquire()
+
+                if not self.__acquire(self.__space, 0):
+                    struct.pack_into(">I", self.__mapfile, _HDR_WAITERS, struct.unpack_from(">I", self.__mapfile, _HDR_WAITERS)[0] - 1)
+
+                self.__semaphore.release()
+
+    def put_nowait(self, value: any) -> None:
+        """Append a value without waiting for free space.
+
+        Args:
+            value (any): value to append
+
+        """
+        self.put(value, False)
+
+    def get(self, block: bool = True, timeout: float = None) -> any:
+        """Remove and return the first value of the queue.
+
+        Args:
+            block (bool, optional): wait for a value when the queue is empty. Defaults to True.
+            timeout (float, optional): maximum waiting time in seconds, None waits forever. Defaults to None.
+
+        Raises:
+            queue.Empty: raise an error when the queue is still empty after the timeout or without blocking
+
+        Returns:
+            any: first value
+
+        """
+        if not self.__acquire(self.__items, timeout if block else 0):
+            raise queue.Empty
+
+        return decode(self.__take(1)[0])
+
+    def get_nowait(self) -> any:
+        """Remove and return the first value without waiting.
+
+        Returns:
+            any: first value
+
+        """
+        return self.get(False)
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float = None) -> list:
+        """Remove and return up to max_items values in a single locked pass.
+
+        Args:
+            max_items (int): maximum number of values to return
+            block (bool, optional): wait for the first value when the queue is empty. Defaults to True.
+            timeout (float, optional): maximum waiting time in seconds for the first value, None waits forever. Defaults to None.
+
+        Raises:
+            queue.Empty: raise an error when the queue is still empty after the timeout or without blocking
+
+        Returns:
+            list: values in queue order
+
+        """
+        if not self.__acquire(self.__items, timeout if block else 0):
+            raise queue.Empty
+
+        _count = 1
+
+        while _count < max_items and self.__acquire(self.__items, 0):
+            _count += 1
+
+        return [decode(_data) for _data in self.__take(_count)]
+
+    def qsize(self) -> int:
+        """Return the number of values in the queue.
+
+        Returns:
+            int: number of values
+
+        """
+        return struct.unpack_from(">Q", self.__mapfile, _HDR_COUNT)[0]
+
+    def empty(self) -> bool:
+        """Check if the queue is empty.
+
+        Returns:
+            bool: the queue has no value
+
+        """
+        return self.qsize() == 0
+
+    def getAvailability(self) -> bool:
+        """Return the availability of the shared queue.
+
+        Returns:
+            bool: the queue is open
+
+        """
+        try:
+            return self.__mapfile[_HDR_STATE] == _STATE_OPEN
+        except:
+            return False
+
+    def close(self) -> None:
+        """Close the shared queue, the client also removes it."""
+        if self.__mapfile is None:
+            return
+
+        if self.__client:
+            self.__mapfile[_HDR_STATE] = _STATE_CLOSED
+
+            for _name in (self.__name_semaphore, self.__name_semaphore + _ITEMS_SUFFIX, self.__name_semaphore + _SPACE_SUFFIX):
+                try:
+                    posix_ipc.unlink_semaphore(_name)
+                except posix_ipc.ExistentialError:
+                    pass
+
+            try:
+                posix_ipc.unlink_shared_memory(self.__name_memory)
+            except posix_ipc.ExistentialError:
+                pass
+
+        for _semaphore in (self.__semaphore, self.__items, self.__space):
+            _semaphore.close()
+
+        self.__mapfile.close()
+        self.__mapfile = None
+
+    def __take(self, count: int) -> list:
+        """Copy records out of the ring and wake up the producers waiting for space.
+
+        Args:
+            count (int): number of records already reserved through the items semaphore
+
+        Returns:
+            list: encoded values
+
+        """
+        _records = []
+
+        self.__semaphore.acquire()
+
+        _head = struct.unpack_from(">Q", self.__mapfile, _HDR_HEAD)[0]
+
+        for _ in range(count):
+            _size = struct.unpack(">I", self.__readRing(_head, _RECORD))[0]
+            _records.append(self.__readRing(_head + _RECORD, _size))
+            _head += _RECORD + _size
+
+        struct.pack_into(">Q", self.__mapfile, _HDR_HEAD, _head)
+        struct.pack_into(">Q", self.__mapfile, _HDR_COUNT, struct.unpack_from(">Q", self.__mapfile, _HDR_COUNT)[0] - count)
+
+        _waiters = struct.unpack_from(">I", self.__mapfile, _HDR_WAITERS)[0]
+        struct.pack_into(">I", self.__mapfile, _HDR_WAITERS, 0)
+
+        for _ in range(_waiters):
+            self.__space.release()
+
+        self.__semaphore.release()
+
+        return _records
+
+    def __writeRing(self, position: int, data: bytes) -> None:
+        """Write data into the ring, wrapping around its end.
+
+        Args:
+            position (int): unwrapped write position
+            data (bytes): data to write
+
+        """
+        _start = position % self.__capacity
+        _first = min(len(data), self.__capacity - _start)
+
+        self.__mapfile[_HEADER_SIZE + _start : _HEADER_SIZE + _start + _first] = data[:_first]
+
+        if _first < len(data):
+            self.__mapfile[_HEADER_SIZE : _HEADER_SIZE + len(data) - _first] = data[_first:]
+
+    def __readRing(self, position: int, size: int) -> bytes:
+        """Read data from the ring, wrapping around its end.
+
+        Args:
+            position (int): unwrapped read position
+            size (int): number of bytes
+
+        Returns:
+            bytes: data
+
+        """
+        _start = position % self.__capacity
+        _first = min(size, self.__capacity - _start)
+
+        if _first == size:
+            return self.__mapfile[_HEADER_SIZE + _start : _HEADER_SIZE + _start + size]
+
+        return self.__mapfile[_HEADER_SIZE + _start : _HEADER_SIZE + self.__capacity] + self.__mapfile[_HEADER_SIZE : _HEADER_SIZE + size - _first]
+
+    def __acquire(self, semaphore: posix_ipc.Semaphore, timeout: float) -> bool:
+        """Acquire a semaphore with an optional timeout.
+
+        Args:
+            semaphore (posix_ipc.Semaphore): semaphore to acquire
+            timeout (float): maximum waiting time in seconds, None waits forever
+
+        Returns:
+            bool: the semaphore has been acquired
+
+        """
+        try:
+            if timeout is None or timeout == 0 or posix_ipc.SEMAPHORE_TIMEOUT_SUPPORTED:
+                semaphore.acquire(timeout)
+            else:
+                _deadline = time.monotonic() + timeout
+
+                while True:
+                    try:
+                        semaphore.acquire(0)
+
+                        break
+                    except posix_ipc.BusyError:
+                        if time.monotonic() >= _deadline:
+                            raise
+
+                        time.sleep(0.001)
+        except posix_ipc.BusyError:
+            return False
+
+        return True
+
+    def __len__(self) -> int:
+        """Return the number of values in the queue.
+
+        Returns:
+            int: number of values
+
+        """
+        return self.qsize()
+
+    def __repr__(self) -> str:
+        """Print the queue state.
+
+        Returns:
+            str: printable queue
+
+        """
+        return "SharedQueue(" + self.__name_memory[len(_SHM_NAME_PREFIX) :] + ", " + str(self.qsize()) + " values)"
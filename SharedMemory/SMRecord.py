@@ -0,0 +1,253 @@
+"""
+File: SMRecord.py
+Created Date: Sunday, October 18th 2026, 11:57:12 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: records and tables of records with a structured dtype
+2026-10-18	Zen	Reading fields through the read path of the lock
+"""  # noqa
+
+from .SharedMemory import SharedMemory
+from .SMError import SMMultiInputError, SMNotDefined
+import numpy
+
+
+class SharedRecord:
+    """Fixed record, or table of records, whose fields are mapped over a shared space with a NumPy structured dtype.
+
+    Every field stays at a fixed offset: reads copy it from the mapping without decoding, through the read path of the
+    lock so that a snapshot comes from a single write, writes store it under the write lock and bump the generation
+    like any other write. Built on the array mode of SharedMemory.
+    """
+
+    def __init__(self, name: str, schema: any = None, value: any = None, rows: int = None, client: bool = False, log: str = None, silent: bool = False, lock: str = "mutex") -> None:
+        """Class constructor.
+
+        Args:
+            name (str): desired name for the sharing space
+            schema (any, optional): dict of field names and dtypes, list of (name, dtype) tuples or structured dtype, required by a client and checked by a server. Defaults to None.
+            value (any, optional): initial fields as a dict, a list of dicts or tuples for a table. Defaults to None.
+            rows (int, optional): number of rows of a table, None for a single record. Defaults to None.
+            client (bool, optional): will creat a client or server instance
+            log (str, optional): write log into a file. Defaults to None.
+            silent (bool, optional): silent mode. Defaults to False.
+            lock (str, optional): "mutex", "rwlock" or "seqlock", see SharedMemory. Defaults to "mutex".
+
+        Raises:
+            SMMultiInputError: raise an error when a server is given a value or a number of rows
+            SMNotDefined: raise an error when a server attaches to a space that doesn't exist
+            ValueError: raise an error when the schema is missing, has no named field or doesn't match the shared one
+
+        """
+        _dtype = None
+
+        if schema is not None:
+            _dtype = numpy.dtype(list(schema.items()) if type(schema) is dict else schema)
+
+            if _dtype.names is None:
+                raise ValueError("schema must have named fields.")
+
+        if client:
+            if _dtype is None:
+                raise ValueError("schema must be given to create a record.")
+
+            _array = numpy.zeros(() if rows is None else rows, dtype=_dtype)
+
+            if value is not None:
+                SharedRecord.__fill(_array, value)
+
+            self.__memory = SharedMemory(name, _array, client=True, log=log, silent=silent, array=True, lock=lock)
+        else:
+            if value is not None or rows is not None:
+                raise SMMultiInputError("value and rows must be None for a server.")
+
+            self.__memory = SharedMemory.attach(name, log=log, silent=silent, array=True)
+
+        self.__array = self.__memory.getValue()
+
+        if not isinstance(self.__array, numpy.ndarray) or self.__array.dtype.names is None:
+            self.__memory = None
+            raise SMNotDefined(name, "shared memory called '" + name + "' is not a record.")
+
+        if _dtype is not None and self.__array.dtype != _dtype:
+            raise ValueError("schema " + str(_dtype) + " doesn't match the shared one " + str(self.__array.dtype) + ".")
+
+    @property
+    def memory(self) -> SharedMemory:
+        """Return the underlying instance, for its generation, waitForChange and statistics.
+
+        Returns:
+            SharedMemory: array mode instance
+
+        """
+        return self.__memory
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        """Return the structured dtype of the record.
+
+        Returns:
+            numpy.dtype: dtype
+
+        """
+        return self.__array.dtype
+
+    def view(self) -> numpy.ndarray:
+        """Return a read-only zero-copy view of the record or of the table.
+
+        Returns:
+            numpy.ndarray: structured array backed by the shared space
+
+        """
+        return self.__array
+
+    def getValue(self) -> any:
+        """Return a copy of the fields, taken in a single read of the shared space.
+
+        Returns:
+            any: dict of the fields, or list of dicts for a table
+
+        """
+        _array = self.__memory[...]
+
+        if _array.ndim == 0:
+            return SharedRecord.__toDict(_array[()])
+
+        return [SharedRecord.__toDict(_row) for _row in _array]
+
+    def update(self, values: dict, row: int = None) -> None:
+        """Write several fields under a single lock acquisition.
+
+        Args:
+            values (dict): new values by field name
+            row (int, optional): row of a table, None for a single record. Defaults to None.
+
+        """
+        with self.__memory.lockedView() as _array:
+            for _field, _value in values.items():
+                if row is None:
+                    _array[_field] = _value
+                else:
+                    _array[_field][row] = _value
+
+    def close(self) -> None:
+        """Close the shared space."""
+        self.__memory.close()
+
+    def __getitem__(self, key: any) -> any:
+        """Read a field, a row or a column, copied under the read lock or retried with a seqlock.
+
+        Args:
+            key (any): field name, row index, (row, field) tuple or a field name for a whole column of a table
+
+        Returns:
+            any: Python value of a scalar field, dict of a row, or copy of a column or an array field
+
+        """
+        _value = self.__memory[key[0]][key[1]] if type(key) is tuple else self.__memory[key]
+
+        if isinstance(_value, numpy.void):
+            return SharedRecord.__toDict(_value)
+
+        if _value.ndim == 0:
+            return _value.item()
+
+        return _value
+
+    def __setitem__(self, key: any, value: any) -> None:
+        """Write a field, a row or a column under the write lock.
+
+        Args:
+            key (any): field name, row index or (row, field) tuple
+            value (any): new value, a dict or a tuple of fields for a row
+
+        """
+        with self.__memory.lockedView() as _array:
+            if type(key) is tuple:
+                _array[key[1]][key[0]] = value
+            elif type(value) is dict:
+                for _field, _value in value.items():
+                    _array[_field][key] = _value
+            else:
+                _array[key] = value
+
+    def __len__(self) -> int:
+        """Return the number of rows of a table or the number of fields of a record.
+
+        Returns:
+            int: length
+
+        """
+        return len(self.__array.dtype.names) if self.__array.ndim == 0 else len(self.__array)
+
+    def __repr__(self) -> str:
+        """Redefine the print method.
+
+        Returns:
+            str: printable value of SharedRecord instance
+
+        """
+        return "SharedRecord: " + str(self.__array.dtype) + "\n\tValue: " + self.getValue().__repr__()
+
+    @staticmethod
+    def __fill(array: numpy.ndarray, value: any) -> None:
+        """Copy initial fields into a new record or table.
+
+        Args:
+            array (numpy.ndarray): record or table
+            value (any): dict of fields, or list of dicts or tuples for a table
+
+        """
+        if array.ndim == 0:
+            for _field, _value in value.items():
+                array[_field] = _value
+
+            return
+
+        for _row, _fields in enumerate(value):
+            if type(_fields) is dict:
+                for _field, _value in _fields.items():
+                    array[_field][_row] = _value
+            else:
+                array[_row] = tuple(_fields)
+
+    @staticmethod
+    def __toDict(record: any) -> dict:
+        """Convert a record into a dict of Python values.
+
+        Args:
+            record (any): numpy.void record
+
+        Returns:
+            dict: fields
+
+        """
+        return dict(zip(record.dtype.names, record.item()))
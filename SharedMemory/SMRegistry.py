@@ -0,0 +1,366 @@
+"""
+File: SMRegistry.py
+Created Date: Sunday, October 18th 2026, 11:48:05 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: shared hash table registry of the shared memory spaces
+"""  # noqa
+
+import posix_ipc
+import struct
+import zlib
+import mmap
+import os
+
+_MAGIC = b"PSMR"
+_VERSION = 1
+
+_HEADER = struct.Struct("=4sB3xQQQ")
+_HEADER_SIZE = 64
+
+_SLOT = struct.Struct("=B3xII40s24sQd4x")
+_SLOT_SIZE = _SLOT.size
+
+_EMPTY = 0
+_USED = 1
+_DELETED = 2
+
+_MIN_SLOTS = 1024
+_MAX_LOAD = 0.75
+
+_registries = {}
+
+
+class SMRegistry:
+    """Open addressing hash table of the shared memory spaces, stored in its own shared space.
+
+    Entries are keyed by name and hold the size, the type name, the creator pid and the creation time of a space.
+    Every operation runs under one semaphore and costs O(1) on average, except listing which scans the table.
+    A process resizing the table rewrites its capacity in the header, the others remap when they see it change.
+    """
+
+    def __init__(self, name_memory: str, name_semaphore: str, mode: int) -> None:
+        """Class constructor, open the registry or create it when missing.
+
+        Args:
+            name_memory (str): shared space name
+            name_semaphore (str): semaphore name
+            mode (int): permissions of a created registry
+
+        """
+        self.__semaphore = posix_ipc.Semaphore(name_semaphore, posix_ipc.O_CREAT, mode, initial_value=1)
+        self.__memory = posix_ipc.SharedMemory(name_memory, posix_ipc.O_CREAT, mode)
+        self.__mapfile = None
+        self.__slots = 0
+
+        with self:
+            pass
+
+    def __enter__(self) -> "SMRegistry":
+        """Acquire the registry, mapping or formatting the table when needed.
+
+        Returns:
+            SMRegistry: registry
+
+        """
+        self.__semaphore.acquire()
+
+        try:
+            if self.__mapfile is None or _HEADER.unpack_from(self.__mapfile)[2] != self.__slots:
+                self.__remap()
+        except BaseException:
+            self.__semaphore.release()
+            raise
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Release the registry."""
+        self.__semaphore.release()
+
+    def register(self, entries: list) -> None:
+        """Add or replace entries.
+
+        Args:
+            entries (list): (name, type name, size, pid, created time) tuples
+
+        """
+        with self:
+            for _name, _type, _size, _pid, _created in entries:
+                _key = _name.encode()
+                _hash = zlib.crc32(_key)
+                _position = self.__find(_key, _hash)
+
+                if _position is None:
+                    self.__reserve()
+                    _position = self.__free(_hash)
+                    self.__count(1, 0 if self.__mapfile[_position] == _EMPTY else -1)
+
+                _SLOT.pack_into(self.__mapfile, _position, _USED, _hash, _pid, _key, _type.encode()[:24], _size, _created)
+
+    def unregister(self, names: list, pid: int = None) -> None:
+        """Remove entries, missing names are ignored.
+
+        Args:
+            names (list): names to remove
+            pid (int, optional): only remove entries created by this pid, None removes any. Defaults to None.
+
+        """
+        with self:
+            for _name in names:
+                _key = _name.encode()
+                _position = self.__find(_key, zlib.crc32(_key))
+
+                if _position is not None and (pid is None or _SLOT.unpack_from(self.__mapfile, _position)[2] == pid):
+                    self.__mapfile[_position] = _DELETED
+                    self.__count(-1, 1)
+
+    def resize(self, name: str, size: int) -> None:
+        """Update the size of an entry.
+
+        Args:
+            name (str): name
+            size (int): new size in bytes
+
+        """
+        with self:
+            _key = name.encode()
+            _position = self.__find(_key, zlib.crc32(_key))
+
+            if _position is not None:
+                struct.pack_into("=Q", self.__mapfile, _position + 76, size)
+
+    def get(self, name: str) -> dict:
+        """Return the entry of a name.
+
+        Args:
+            name (str): name
+
+        Returns:
+            dict: size, type, pid and created time, None when the name isn't registered
+
+        """
+        with self:
+            _key = name.encode()
+            _position = self.__find(_key, zlib.crc32(_key))
+
+            return None if _position is None else SMRegistry.__entry(_SLOT.unpack_from(self.__mapfile, _position))[1]
+
+    def entries(self, prefix: str = "") -> dict:
+        """Return the entries whose name starts with a prefix.
+
+        Args:
+            prefix (str, optional): name prefix. Defaults to "".
+
+        Returns:
+            dict: entries by name
+
+        """
+        _prefix = prefix.encode()
+
+        with self:
+            _table = self.__mapfile[_HEADER_SIZE : _HEADER_SIZE + self.__slots * _SLOT_SIZE]
+
+        return dict(SMRegistry.__entry(_slot) for _slot in _SLOT.iter_unpack(_table) if _slot[0] == _USED and _slot[3].startswith(_prefix))
+
+    def __len__(self) -> int:
+        """Return the number of entries.
+
+        Returns:
+            int: number of entries
+
+        """
+        with self:
+            return _HEADER.unpack_from(self.__mapfile)[3]
+
+    def close(self) -> None:
+        """Unmap the registry."""
+        if self.__mapfile is not None:
+            self.__mapfile.close()
+            self.__mapfile = None
+
+        self.__memory.close_fd()
+        self.__semaphore.close()
+
+    @staticmethod
+    def __entry(slot: tuple) -> tuple:
+        """Convert a slot into a name and its entry.
+
+        Args:
+            slot (tuple): unpacked slot
+
+        Returns:
+            tuple: name and entry
+
+        """
+        return slot[3].rstrip(b"\x00").decode(), {"size": slot[5], "type": slot[4].rstrip(b"\x00").decode(), "pid": slot[2], "created": slot[6]}
+
+    def __remap(self) -> None:
+        """Map the table at its current size, formatting a new or foreign shared space, the semaphore must be held."""
+        _size = os.fstat(self.__memory.fd).st_size
+
+        if _size >= _HEADER_SIZE:
+            _mapfile = mmap.mmap(self.__memory.fd, _size)
+
+            if _HEADER.unpack_from(_mapfile)[:2] == (_MAGIC, _VERSION):
+                if self.__mapfile is not None:
+                    self.__mapfile.close()
+
+                self.__mapfile = _mapfile
+                self.__slots = _HEADER.unpack_from(_mapfile)[2]
+
+                return
+
+            _mapfile.close()
+
+        self.__format(_MIN_SLOTS)
+
+    def __format(self, slots: int) -> None:
+        """Resize the shared space to an empty table, the semaphore must be held.
+
+        Args:
+            slots (int): number of slots
+
+        """
+        if self.__mapfile is not None:
+            self.__mapfile.close()
+
+        os.ftruncate(self.__memory.fd, 0)
+        os.ftruncate(self.__memory.fd, _HEADER_SIZE + slots * _SLOT_SIZE)
+
+        self.__mapfile = mmap.mmap(self.__memory.fd, _HEADER_SIZE + slots * _SLOT_SIZE)
+        self.__slots = slots
+        _HEADER.pack_into(self.__mapfile, 0, _MAGIC, _VERSION, slots, 0, 0)
+
+    def __count(self, used: int, deleted: int) -> None:
+        """Update the entry and deleted slot counts.
+
+        Args:
+            used (int): entries added
+            deleted (int): deleted slots added
+
+        """
+        _magic, _version, _slots, _used, _deleted = _HEADER.unpack_from(self.__mapfile)
+        _HEADER.pack_into(self.__mapfile, 0, _magic, _version, _slots, _used + used, _deleted + deleted)
+
+    def __find(self, key: bytes, digest: int) -> int:
+        """Return the position of a key.
+
+        Args:
+            key (bytes): encoded name
+            digest (int): key hash
+
+        Returns:
+            int: slot position, None when missing
+
+        """
+        _mask = self.__slots - 1
+        _index = digest & _mask
+        _key = struct.pack("=I", digest) + bytes(4) + key.ljust(40, b"\x00")
+
+        while True:
+            _position = _HEADER_SIZE + _index * _SLOT_SIZE
+            _state = self.__mapfile[_position]
+
+            if _state == _EMPTY:
+                return None
+
+            if _state == _USED and self.__mapfile[_position + 4 : _position + 8] == _key[:4] and self.__mapfile[_position + 12 : _position + 52] == _key[8:]:
+                return _position
+
+            _index = (_index + 1) & _mask
+
+    def __free(self, digest: int) -> int:
+        """Return the position of the first empty or deleted slot for a hash.
+
+        Args:
+            digest (int): key hash
+
+        Returns:
+            int: slot position
+
+        """
+        _mask = self.__slots - 1
+        _index = digest & _mask
+
+        while self.__mapfile[_HEADER_SIZE + _index * _SLOT_SIZE] == _USED:
+            _index = (_index + 1) & _mask
+
+        return _HEADER_SIZE + _index * _SLOT_SIZE
+
+    def __reserve(self) -> None:
+        """Rehash the table before an insertion would exceed the maximum load, doubling it when mostly used."""
+        _used, _deleted = _HEADER.unpack_from(self.__mapfile)[3:]
+
+        if _used + _deleted + 1 <= self.__slots * _MAX_LOAD:
+            return
+
+        _table = self.__mapfile[_HEADER_SIZE : _HEADER_SIZE + self.__slots * _SLOT_SIZE]
+        _live = [_table[i : i + _SLOT_SIZE] for i in range(0, len(_table), _SLOT_SIZE) if _table[i] == _USED]
+
+        self.__format(self.__slots * 2 if (_used + 1) * 2 > self.__slots else self.__slots)
+
+        for _slot in _live:
+            _position = self.__free(struct.unpack_from("=I", _slot, 4)[0])
+            self.__mapfile[_position : _position + _SLOT_SIZE] = _slot
+
+        self.__count(len(_live), 0)
+
+
+def getRegistry(name_memory: str, name_semaphore: str, mode: int) -> SMRegistry:
+    """Return the registry of this process, opening it on first use.
+
+    Args:
+        name_memory (str): shared space name
+        name_semaphore (str): semaphore name
+        mode (int): permissions of a created registry
+
+    Returns:
+        SMRegistry: registry
+
+    """
+    if name_memory not in _registries:
+        _registries[name_memory] = SMRegistry(name_memory, name_semaphore, mode)
+
+    return _registries[name_memory]
+
+
+def dropRegistry(name_memory: str) -> None:
+    """Forget the registry of this process, the next getRegistry call opens it again.
+
+    Args:
+        name_memory (str): shared space name
+
+    """
+    _registry = _registries.pop(name_memory, None)
+
+    if _registry is not None:
+        _registry.close()
@@ -0,0 +1,264 @@
+"""
+File: SMSerializer.py
+Created Date: Sunday, October 18th 2026, 11:02:17 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: native, pickle protocol 5 and marshal serializers
+2026-10-18	Zen	Giving the type id of builtin values whatever the serializer
+2026-10-18	Zen	Making SMSerializer an abstract base class
+"""  # noqa
+
+from .SMCodec import _OBJECT, _SLOTTED, _TYPE_IDS, _VALUE_TYPES, encodeInto, decode
+from abc import ABC, abstractmethod
+import marshal
+import pickle
+import struct
+
+_ALIGNMENT = 64
+_VALUE_TYPE_IDS = {_type: _id for _id, _type in _VALUE_TYPES.items() if bytes([_id]) not in _SLOTTED}
+
+
+class SMSerializer(ABC):
+    """Serializer protocol: encode a value into a reusable buffer and decode it from a memoryview.
+
+    ID is stored in the segment header so that server instances check the serializer of the client, ids below 128
+    are reserved for the serializers shipped with the package. encodeInto and decode must be implemented.
+    """
+
+    ID = None
+    name = None
+
+    @abstractmethod
+    def encodeInto(self, buffer: bytearray, value: any) -> int:
+        """Encode value at the start of a buffer, growing it when it is too small.
+
+        Args:
+            buffer (bytearray): destination buffer
+            value (any): data to encode
+
+        Returns:
+            int: encoded size
+
+        """
+
+    @abstractmethod
+    def decode(self, view: memoryview) -> any:
+        """Decode value.
+
+        Args:
+            view (memoryview): encoded data
+
+        Returns:
+            any: decoded data
+
+        """
+
+    def typeId(self, buffer: bytearray, value: any) -> int:
+        """Return the type id written in the segment header for an encoded value, server instances read their type from it.
+
+        Args:
+            buffer (bytearray): encoded data
+            value (any): encoded value
+
+        Returns:
+            int: type id of builtin values, the object id otherwise
+
+        """
+        return _VALUE_TYPE_IDS.get(type(value), _OBJECT[0])
+
+
+class SMNativeSerializer(SMSerializer):
+    """Built-in codec, needed by array mode, slack and lazy views."""
+
+    ID = 0
+    name = "native"
+
+    def encodeInto(self, buffer: bytearray, value: any) -> int:
+        """Encode value at the start of a buffer.
+
+        Args:
+            buffer (bytearray): destination buffer
+            value (any): data to encode
+
+        Returns:
+            int: encoded size
+
+        """
+        return encodeInto(buffer, value)
+
+    def decode(self, view: memoryview) -> any:
+        """Decode value.
+
+        Args:
+            view (memoryview): encoded data
+
+        Returns:
+            any: decoded data
+
+        """
+        return decode(view)
+
+    def typeId(self, buffer: bytearray, value: any) -> int:
+        """Return the type id written in the segment header for an encoded value.
+
+        Args:
+            buffer (bytearray): encoded data
+            value (any): encoded value
+
+        Returns:
+            int: type id
+
+        """
+        return _TYPE_IDS[buffer[1]]
+
+
+class SMPickleSerializer(SMSerializer):
+    """Pickle protocol 5 with out-of-band buffers.
+
+    Buffers exposed through PickleBuffer, such as contiguous numpy arrays or bytearrays, are copied next to the
+    pickle stream at 64 bytes aligned positions instead of through it, and are handed back to pickle as views over the
+    encoded data. Layout: stream size, buffer count, (position, size) per buffer, stream, buffers.
+    """
+
+    ID = 1
+    name = "pickle"
+
+    def encodeInto(self, buffer: bytearray, value: any) -> int:
+        """Encode value at the start of a buffer.
+
+        Args:
+            buffer (bytearray): destination buffer
+            value (any): data to encode
+
+        Returns:
+            int: encoded size
+
+        """
+        _buffers = []
+        _stream = pickle.dumps(value, protocol=5, buffer_callback=_buffers.append)
+        _start = 12 + 16 * len(_buffers)
+        _size = _start + len(_stream)
+
+        buffer[0:_start] = bytes(_start)
+        buffer[_start:_size] = _stream
+        struct.pack_into(">QI", buffer, 0, len(_stream), len(_buffers))
+
+        for i, _buffer in enumerate(_buffers):
+            with _buffer.raw() as _raw:
+                _position = _size + (-_size) % _ALIGNMENT
+
+                buffer[_size:_position] = bytes(_position - _size)
+                buffer[_position : _position + _raw.nbytes] = _raw
+                struct.pack_into(">QQ", buffer, 12 + 16 * i, _position, _raw.nbytes)
+
+                _size = _position + _raw.nbytes
+
+        return _size
+
+    def decode(self, view: memoryview) -> any:
+        """Decode value, out-of-band buffers are views over the given data.
+
+        Args:
+            view (memoryview): encoded data
+
+        Returns:
+            any: decoded data
+
+        """
+        _length, _count = struct.unpack_from(">QI", view, 0)
+        _start = 12 + 16 * _count
+        _buffers = [view[_position : _position + _size] for _position, _size in struct.iter_unpack(">QQ", view[12:_start])]
+
+        return pickle.loads(view[_start : _start + _length], buffers=_buffers)
+
+
+class SMMarshalSerializer(SMSerializer):
+    """Marshal format of the interpreter, fast for plain builtin values but not stable across Python versions.
+
+    Objects exposing a buffer, numpy arrays included, are decoded as bytes.
+    """
+
+    ID = 2
+    name = "marshal"
+
+    def encodeInto(self, buffer: bytearray, value: any) -> int:
+        """Encode value at the start of a buffer.
+
+        Args:
+            buffer (bytearray): destination buffer
+            value (any): data to encode
+
+        Returns:
+            int: encoded size
+
+        """
+        _data = marshal.dumps(value)
+        buffer[0 : len(_data)] = _data
+
+        return len(_data)
+
+    def decode(self, view: memoryview) -> any:
+        """Decode value.
+
+        Args:
+            view (memoryview): encoded data
+
+        Returns:
+            any: decoded data
+
+        """
+        return marshal.loads(view)
+
+
+_SERIALIZERS = {_serializer.name: _serializer() for _serializer in (SMNativeSerializer, SMPickleSerializer, SMMarshalSerializer)}
+_SERIALIZER_IDS = {_serializer.ID: _serializer for _serializer in _SERIALIZERS.values()}
+
+
+def getSerializer(serializer: any) -> SMSerializer:
+    """Return a serializer from its name, its header id or itself.
+
+    Args:
+        serializer (any): name, id or SMSerializer instance
+
+    Raises:
+        ValueError: raise an error when the serializer is unknown
+
+    Returns:
+        SMSerializer: serializer
+
+    """
+    if isinstance(serializer, SMSerializer):
+        return serializer
+
+    try:
+        return _SERIALIZERS[serializer] if type(serializer) is str else _SERIALIZER_IDS[serializer]
+    except KeyError:
+        raise ValueError("serializer must be one of " + ", ".join(_SERIALIZERS) + " or an SMSerializer instance.") from None
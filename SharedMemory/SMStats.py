@@ -0,0 +1,209 @@
+"""
+File: SMStats.py
+Created Date: Sunday, October 18th 2026, 9:14:22 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: runtime counters and latency histograms
+2026-10-18	Zen	Adding compression counters
+"""  # noqa
+
+import struct
+
+_CALLS = ("setValue", "getValue", "getItem", "setItem", "delItem", "transaction", "waitForChange")
+_BYTES = ("read", "written", "raw", "compressed")
+_TIMERS = ("wait", "hold", "encode", "decode", "compress", "decompress")
+
+_BUCKETS = 64
+_TIMER_WORDS = 3 + _BUCKETS
+
+_INDEX = {}
+
+for _i, _name in enumerate(_CALLS + _BYTES):
+    _INDEX[_name] = _i
+
+for _i, _name in enumerate(_TIMERS):
+    _INDEX[_name] = len(_CALLS) + len(_BYTES) + _i * _TIMER_WORDS
+
+_WORDS = len(_CALLS) + len(_BYTES) + len(_TIMERS) * _TIMER_WORDS
+_FORMAT = "=" + str(_WORDS + 1) + "Q"
+
+STATS_SIZE = struct.calcsize(_FORMAT)
+
+SET_VALUE, GET_VALUE, GET_ITEM, SET_ITEM, DEL_ITEM, TRANSACTION, WAIT_FOR_CHANGE = (_INDEX[_name] for _name in _CALLS)
+READ, WRITTEN, RAW, COMPRESSED = (_INDEX[_name] for _name in _BYTES)
+WAIT, HOLD, ENCODE, DECODE, COMPRESS, DECOMPRESS = (_INDEX[_name] for _name in _TIMERS)
+
+
+class SMStats:
+    """Counters and log2 latency histograms, published as 64-bit words into a monitoring slot on demand.
+
+    A slot starts with the pid owning it, 0 for a free slot, followed by the words.
+    """
+
+    def __init__(self, words: list = None) -> None:
+        """Class constructor.
+
+        Args:
+            words (list, optional): initial words, None starts from zero. Defaults to None.
+
+        """
+        self.__words = [0] * _WORDS if words is None else words
+
+    def count(self, index: int, value: int = 1) -> None:
+        """Increment a call or bytes counter.
+
+        Args:
+            index (int): counter index
+            value (int, optional): increment. Defaults to 1.
+
+        """
+        self.__words[index] += value
+
+    def time(self, index: int, ns: int) -> None:
+        """Record a duration.
+
+        Args:
+            index (int): timer index
+            ns (int): duration in nanoseconds
+
+        """
+        _words = self.__words
+        _words[index] += 1
+        _words[index + 1] += ns
+
+        if ns > _words[index + 2]:
+            _words[index + 2] = ns
+
+        _words[index + 3 + ns.bit_length()] += 1
+
+    def lock(self, wait: int, hold: int) -> None:
+        """Record the wait and hold durations of a lock.
+
+        Args:
+            wait (int): waiting duration in nanoseconds
+            hold (int): holding duration in nanoseconds
+
+        """
+        _words = self.__words
+        _words[WAIT] += 1
+        _words[WAIT + 1] += wait
+        _words[WAIT + 3 + wait.bit_length()] += 1
+        _words[HOLD] += 1
+        _words[HOLD + 1] += hold
+        _words[HOLD + 3 + hold.bit_length()] += 1
+
+        if wait > _words[WAIT + 2]:
+            _words[WAIT + 2] = wait
+
+        if hold > _words[HOLD + 2]:
+            _words[HOLD + 2] = hold
+
+    def clear(self) -> None:
+        """Reset every counter."""
+        self.__words[:] = [0] * _WORDS
+
+    def publish(self, buffer: any, offset: int, pid: int) -> None:
+        """Write the words into a monitoring slot.
+
+        Args:
+            buffer (any): writable buffer
+            offset (int): slot position
+            pid (int): pid owning the slot, 0 to free it
+
+        """
+        struct.pack_into(_FORMAT, buffer, offset, pid, *self.__words)
+
+    @staticmethod
+    def read(buffer: any, offset: int) -> tuple:
+        """Read a monitoring slot.
+
+        Args:
+            buffer (any): buffer
+            offset (int): slot position
+
+        Returns:
+            tuple: pid owning the slot and its statistics
+
+        """
+        _words = list(struct.unpack_from(_FORMAT, buffer, offset))
+
+        return _words[0], SMStats(_words[1:])
+
+    def toDict(self) -> dict:
+        """Return the counters and a summary of every timer.
+
+        Returns:
+            dict: calls, bytes, compression ratio (raw bytes over compressed bytes of the compressed writes) and timers
+
+        """
+        _words = self.__words
+        _stats = {"calls": {_name: _words[_INDEX[_name]] for _name in _CALLS}, "bytes": {_name: _words[_INDEX[_name]] for _name in _BYTES}}
+        _stats["compression_ratio"] = _words[RAW] / _words[COMPRESSED] if _words[COMPRESSED] else 1.0
+
+        for _name in _TIMERS:
+            _index = _INDEX[_name]
+            _count, _total, _max = _words[_index : _index + 3]
+            _histogram = _words[_index + 3 : _index + 3 + _BUCKETS]
+
+            _stats[_name] = {
+                "count": _count,
+                "total_s": _total / 1e9,
+                "mean_us": _total / _count / 1e3 if _count else 0.0,
+                "max_us": _max / 1e3,
+                "p50_us": self.__percentile(_histogram, _count, 0.5),
+                "p99_us": self.__percentile(_histogram, _count, 0.99),
+                "histogram_us": {(1 << _b) / 1e3: _n for _b, _n in enumerate(_histogram) if _n},
+            }
+
+        return _stats
+
+    @staticmethod
+    def __percentile(histogram: list, count: int, q: float) -> float:
+        """Return the upper bound of the bucket holding a percentile.
+
+        Args:
+            histogram (list): bucket counts, bucket b holding durations below 2**b ns
+            count (int): number of durations
+            q (float): percentile between 0 and 1
+
+        Returns:
+            float: percentile upper bound in microseconds
+
+        """
+        _seen = 0
+
+        for _b, _n in enumerate(histogram):
+            _seen += _n
+
+            if _n and _seen >= q * count:
+                return (1 << _b) / 1e3
+
+        return 0.0
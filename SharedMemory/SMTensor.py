@@ -0,0 +1,364 @@
+"""
+File: SMTensor.py
+Created Date: Sunday, October 18th 2026, 11:58:31 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: named arrays allocated in a single shared space
+"""  # noqa
+
+from .SMError import SMSizeError, SMNameLength, SMNotDefined, SMEncoding
+from .SharedMemory import _SHM_NAME_PREFIX, _SEM_NAME_PREFIX, _MAX_LEN, _MODE, _FLAG
+from .SMCodec import _describeFields, dtypeFrom, encode, decode
+from contextlib import contextmanager
+import posix_ipc
+import struct
+import numpy
+import mmap
+
+_MAGIC = b"PSHT"
+_VERSION = 1
+
+_HDR_MAGIC = 0
+_HDR_VERSION = 4
+_HDR_STATE = 5
+_HDR_COUNT = 8
+_HDR_ENTRIES = 12
+_HDR_USED = 16
+_HDR_DATA = 24
+_HEADER_SIZE = 64
+
+_STATE_OPEN = 0x01
+_STATE_CLOSED = 0x02
+
+_ENTRY = struct.Struct(">64sQQB7x8Q96s8x")
+_MAX_DIMS = 8
+
+_ALIGNMENT = 64
+
+
+class SharedTensorStore:
+    """Named numpy arrays allocated in a single shared space, every array data being 64 bytes aligned.
+
+    A directory after the header lists the name, position, dtype and shape of every array. Arrays are only appended:
+    an entry is written before the count is increased, so readers look names up without any lock and get zero-copy
+    views of every array through a single mapping.
+    """
+
+    def __init__(self, name: str, size: int = 1 << 26, entries: int = 256, client: bool = False, silent: bool = False) -> None:
+        """Class constructor.
+
+        Args:
+            name (str): desired name for the shared store
+            size (int, optional): size in bytes of the array data, only used by the client. Defaults to 1 << 26.
+            entries (int, optional): maximum number of arrays, only used by the client. Defaults to 256.
+            client (bool, optional): create the store or attach to an existing one. Defaults to False.
+            silent (bool, optional): silent mode. Defaults to False.
+
+        Raises:
+            SMNameLength: raise an error when the name is too long
+            SMNotDefined: raise an error when a server attaches to a store that doesn't exist
+            SMEncoding: raise an error when the shared space isn't a store
+
+        """
+        self.__name_memory = _SHM_NAME_PREFIX + name
+        self.__name_semaphore = _SEM_NAME_PREFIX + name
+        self.__client = client
+        self.__silent = silent
+        self.__mapfile = None
+        self.__directory = {}
+        self.__views = {}
+
+        if len(self.__name_memory) > _MAX_LEN:
+            raise SMNameLength(name, len(self.__name_memory) - len(_SHM_NAME_PREFIX))
+
+        if self.__client:
+            for _unlink, _name in ((posix_ipc.unlink_semaphore, self.__name_semaphore), (posix_ipc.unlink_shared_memory, self.__name_memory)):
+                try:
+                    _unlink(_name)
+                except posix_ipc.ExistentialError:
+                    pass
+
+            _data = _HEADER_SIZE + entries * _ENTRY.size
+            _data += -_data % _ALIGNMENT
+            _size = _data + size
+            _size += -_size % mmap.ALLOCATIONGRANULARITY
+
+            _memory = posix_ipc.SharedMemory(self.__name_memory, flags=_FLAG, mode=_MODE, size=_size)
+            self.__semaphore = posix_ipc.Semaphore(self.__name_semaphore, _FLAG, _MODE, initial_value=1)
+        else:
+            try:
+                _memory = posix_ipc.SharedMemory(self.__name_memory)
+                self.__semaphore = posix_ipc.Semaphore(self.__name_semaphore)
+            except posix_ipc.ExistentialError:
+                if not self.__silent:
+                    print("ERROR: Shared tensor store '" + name + "' doesn't exist.")
+
+                raise SMNotDefined(name)
+
+        self.__mapfile = mmap.mmap(_memory.fd, _memory.size)
+        _memory.close_fd()
+
+        if self.__client:
+            self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] = _MAGIC
+            self.__mapfile[_HDR_VERSION] = _VERSION
+            struct.pack_into(">IIQQ", self.__mapfile, _HDR_COUNT, 0, entries, _data, _data)
+            self.__mapfile[_HDR_STATE] = _STATE_OPEN
+        elif self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] != _MAGIC or self.__mapfile[_HDR_VERSION] != _VERSION:
+            self.__mapfile.close()
+            raise SMEncoding("HEADER")
+
+        self.__refresh()
+
+    def allocate(self, name: str, shape: any, dtype: any = "float64") -> numpy.ndarray:
+        """Allocate a zeroed array in the store.
+
+        Args:
+            name (str): array name, at most 64 bytes once encoded
+            shape (any): array shape, at most 8 dimensions
+            dtype (any, optional): array dtype. Defaults to "float64".
+
+        Raises:
+            KeyError: raise an error when the name is already allocated
+            ValueError: raise an error when the name, the shape or the dtype doesn't fit in a directory entry
+            SMSizeError: raise an error when the store is full
+
+        Returns:
+            numpy.ndarray: writable view over the shared array
+
+        """
+        _key = name.encode()
+        _shape = (shape,) if type(shape) is int else tuple(shape)
+        _dtype = numpy.dtype(dtype)
+        _description = encode(_dtype.str if _dtype.names is None else _describeFields(_dtype))
+        _nbytes = _dtype.itemsize * int(numpy.prod(_shape))
+
+        if len(_key) > 64 or len(_shape) > _MAX_DIMS or len(_description) > 96:
+            raise ValueError("name, shape or dtype of " + name + " doesn't fit in a directory entry.")
+
+        self.__semaphore.acquire()
+
+        try:
+            self.__refresh()
+
+            if name in self.__directory:
+                raise KeyError(name + " is already allocated.")
+
+            _count, _entries, _used = struct.unpack_from(">IIQ", self.__mapfile, _HDR_COUNT)
+            _offset = _used + -_used % _ALIGNMENT
+
+            if _count == _entries or _offset + _nbytes > len(self.__mapfile):
+                raise SMSizeError("array " + name + " of " + str(_nbytes) + " bytes doesn't fit in the shared tensor store.")
+
+            _ENTRY.pack_into(self.__mapfile, _HEADER_SIZE + _count * _ENTRY.size, _key, _offset, _nbytes, len(_shape), *(_shape + (0,) * (_MAX_DIMS - len(_shape))), _description)
+            struct.pack_into(">Q", self.__mapfile, _HDR_USED, _offset + _nbytes)
+            struct.pack_into(">I", self.__mapfile, _HDR_COUNT, _count + 1)
+
+            self.__refresh()
+        finally:
+            self.__semaphore.release()
+
+        return self.get(name, writable=True)
+
+    def put(self, name: str, array: numpy.ndarray) -> numpy.ndarray:
+        """Allocate an array in the store and copy the given one into it.
+
+        Args:
+            name (str): array name
+            array (numpy.ndarray): array to copy
+
+        Returns:
+            numpy.ndarray: writable view over the shared array
+
+        """
+        _view = self.allocate(name, array.shape, array.dtype)
+        _view[...] = array
+
+        return _view
+
+    def get(self, name: str, writable: bool = False) -> numpy.ndarray:
+        """Return a zero-copy view of an array.
+
+        Args:
+            name (str): array name
+            writable (bool, optional): give a writable view, writers coordinate through lock(). Defaults to False.
+
+        Raises:
+            KeyError: raise an error when the name isn't allocated
+
+        Returns:
+            numpy.ndarray: view over the shared array
+
+        """
+        if name not in self.__views:
+            if name not in self.__directory:
+                self.__refresh()
+
+            _offset, _dtype, _shape = self.__directory[name]
+            _view = numpy.ndarray(_shape, dtype=_dtype, buffer=self.__mapfile, offset=_offset)
+            _view_ro = _view.view()
+            _view_ro.flags.writeable = False
+            self.__views[name] = (_view_ro, _view)
+
+        return self.__views[name][writable]
+
+    def keys(self) -> list:
+        """Return the array names.
+
+        Returns:
+            list: names in allocation order
+
+        """
+        self.__refresh()
+
+        return list(self.__directory)
+
+    def info(self) -> dict:
+        """Return the directory of the store.
+
+        Returns:
+            dict: (offset, dtype, shape) by name
+
+        """
+        self.__refresh()
+
+        return dict(self.__directory)
+
+    @contextmanager
+    def lock(self) -> "SharedTensorStore":
+        """Hold the store semaphore, shared by allocations and by writers coordinating their updates.
+
+        Yields:
+            SharedTensorStore: store
+
+        """
+        self.__semaphore.acquire()
+
+        try:
+            yield self
+        finally:
+            self.__semaphore.release()
+
+    def close(self) -> None:
+        """Close the shared store, the client also removes it."""
+        if self.__mapfile is None:
+            return
+
+        if self.__client:
+            self.__mapfile[_HDR_STATE] = _STATE_CLOSED
+
+            for _unlink, _name in ((posix_ipc.unlink_semaphore, self.__name_semaphore), (posix_ipc.unlink_shared_memory, self.__name_memory)):
+                try:
+                    _unlink(_name)
+                except posix_ipc.ExistentialError:
+                    pass
+
+        self.__semaphore.close()
+        self.__views = {}
+
+        try:
+            self.__mapfile.close()
+        except BufferError:
+            if not self.__silent:
+                print("WARNING: Array views are still in use, memory mapping will be released with them.")
+
+        self.__mapfile = None
+
+    def __getitem__(self, name: str) -> numpy.ndarray:
+        """Return a read-only zero-copy view of an array.
+
+        Args:
+            name (str): array name
+
+        Returns:
+            numpy.ndarray: read-only view over the shared array
+
+        """
+        return self.get(name)
+
+    def __setitem__(self, name: str, array: numpy.ndarray) -> None:
+        """Copy an array into the store, allocating it on first use.
+
+        Args:
+            name (str): array name
+            array (numpy.ndarray): array to copy, with the allocated shape and dtype for an existing name
+
+        Raises:
+            ValueError: raise an error when the shape or the dtype differs from the allocated one
+
+        """
+        if name not in self:
+            self.put(name, array)
+
+            return
+
+        _view = self.get(name, writable=True)
+
+        if _view.shape != array.shape or _view.dtype != array.dtype:
+            raise ValueError("array " + name + " is allocated as " + str(_view.dtype) + str(list(_view.shape)) + ".")
+
+        _view[...] = array
+
+    def __contains__(self, name: str) -> bool:
+        """Check if an array is allocated.
+
+        Args:
+            name (str): array name
+
+        Returns:
+            bool: the name is allocated
+
+        """
+        if name not in self.__directory:
+            self.__refresh()
+
+        return name in self.__directory
+
+    def __len__(self) -> int:
+        """Return the number of arrays.
+
+        Returns:
+            int: number of arrays
+
+        """
+        self.__refresh()
+
+        return len(self.__directory)
+
+    def __refresh(self) -> None:
+        """Read the directory entries appended since the last call."""
+        _count = struct.unpack_from(">I", self.__mapfile, _HDR_COUNT)[0]
+
+        for i in range(len(self.__directory), _count):
+            _entry = _ENTRY.unpack_from(self.__mapfile, _HEADER_SIZE + i * _ENTRY.size)
+            _ndim = _entry[3]
+            _dtype = dtypeFrom(decode(_entry[12]))
+
+            self.__directory[_entry[0].rstrip(b"\x00").decode()] = (_entry[1], _dtype, _entry[4 : 4 + _ndim])
@@ -0,0 +1,302 @@
+"""
+File: SMView.py
+Created Date: Sunday, October 18th 2026, 2:41:09 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: lazy views over slotted dict and list
+2026-10-18	Zen	Adding transaction handle
+2026-10-18	Zen	Converting int keys of a dict transaction to str
+2026-10-18	Zen	Checking membership of a list transaction on its values
+"""  # noqa
+
+from .SMCodec import slotCount, locateSlot, decodeSlot, slotKeys
+from collections.abc import Mapping, Sequence
+
+_UNSET = object()
+
+
+class SMDictView(Mapping):
+    """Read-only dict view decoding only the accessed entries of a shared slotted dict."""
+
+    def __init__(self, read: callable) -> None:
+        """Class constructor.
+
+        Args:
+            read (callable): run an accessor over the encoded shared data under the read lock
+
+        """
+        self.__read = read
+
+    def __getitem__(self, key: any) -> any:
+        """Decode the value of a key.
+
+        Args:
+            key (any): key
+
+        Returns:
+            any: value
+
+        """
+        return self.__read(lambda view: decodeSlot(view, key))
+
+    def __contains__(self, key: any) -> bool:
+        """Check if a key is into the shared dict.
+
+        Args:
+            key (any): key to find
+
+        Returns:
+            bool: boolean to determine if the key is or not into the shared dict
+
+        """
+        return self.__read(lambda view: locateSlot(view, key) is not None)
+
+    def __len__(self) -> int:
+        """Return the number of keys of the shared dict.
+
+        Returns:
+            int: number of keys
+
+        """
+        return self.__read(slotCount)
+
+    def __iter__(self) -> iter:
+        """Iterate over the keys of the shared dict.
+
+        Returns:
+            iter: keys iterator
+
+        """
+        return iter(self.__read(slotKeys))
+
+    def __repr__(self) -> str:
+        """Print the keys of the view.
+
+        Returns:
+            str: printable view
+
+        """
+        return "SMDictView(" + str(list(self)) + ")"
+
+
+class SMListView(Sequence):
+    """Read-only list view decoding only the accessed elements of a shared slotted list."""
+
+    def __init__(self, read: callable) -> None:
+        """Class constructor.
+
+        Args:
+            read (callable): run an accessor over the encoded shared data under the read lock
+
+        """
+        self.__read = read
+
+    def __getitem__(self, index: any) -> any:
+        """Decode an element or a slice of elements.
+
+        Args:
+            index (any): element index or slice
+
+        Returns:
+            any: element or list of elements
+
+        """
+        if type(index) is slice:
+            return self.__read(lambda view: [decodeSlot(view, i) for i in range(*index.indices(slotCount(view)))])
+
+        return self.__read(lambda view: decodeSlot(view, index))
+
+    def __len__(self) -> int:
+        """Return the number of elements of the shared list.
+
+        Returns:
+            int: number of elements
+
+        """
+        return self.__read(slotCount)
+
+    def __repr__(self) -> str:
+        """Print the size of the view.
+
+        Returns:
+            str: printable view
+
+        """
+        return "SMListView(" + str(len(self)) + " elements)"
+
+
+class SMTransaction:
+    """Value handle of a transaction, entries of a slotted dict or list are decoded only when accessed."""
+
+    def __init__(self, read: callable, load: callable, lazy: bool, keyed: bool = False) -> None:
+        """Class constructor.
+
+        Args:
+            read (callable): run an accessor over the encoded shared data, the lock being already held
+            load (callable): decode the whole shared value
+            lazy (bool): the shared value is a slotted dict or list
+            keyed (bool, optional): the shared value is a dict, int keys are converted to str like SharedMemory items. Defaults to False.
+
+        """
+        self.__keyed = keyed
+        self.__read = read
+        self.__load = load
+        self.__value = _UNSET if lazy else load()
+        self.__entries = {}
+
+    @property
+    def value(self) -> any:
+        """Return the whole shared value, decoding it if needed.
+
+        Returns:
+            any: shared value
+
+        """
+        if self.__value is _UNSET:
+            self.__value = self.__load()
+
+            for _key, _entry in self.__entries.items():
+                self.__value[_key] = _entry
+
+            self.__entries = {}
+
+        return self.__value
+
+    @value.setter
+    def value(self, value: any) -> None:
+        """Replace the whole shared value.
+
+        Args:
+            value (any): new value
+
+        """
+        self.__value = value
+        self.__entries = {}
+
+    def getChanges(self) -> tuple:
+        """Return the state to write back.
+
+        Returns:
+            tuple: whole value or _UNSET, and the accessed entries of a lazy transaction
+
+        """
+        return self.__value, self.__entries
+
+    def __getitem__(self, key: any) -> any:
+        """Return an entry of the shared value.
+
+        Args:
+            key (any): list index or dict key
+
+        Returns:
+            any: entry value
+
+        """
+        if self.__keyed and type(key) is int:
+            key = str(key)
+
+        if self.__value is not _UNSET:
+            return self.__value[key]
+
+        if key not in self.__entries:
+            self.__entries[key] = self.__read(lambda view: decodeSlot(view, key))
+
+        return self.__entries[key]
+
+    def __setitem__(self, key: any, value: any) -> None:
+        """Update an entry of the shared value.
+
+        Args:
+            key (any): list index or dict key
+            value (any): new entry value
+
+        """
+        if self.__keyed and type(key) is int:
+            key = str(key)
+
+        if self.__value is _UNSET and (key in self.__entries or self.__read(lambda view: locateSlot(view, key)) is not None):
+            self.__entries[key] = value
+        else:
+            self.value[key] = value
+
+    def __delitem__(self, key: any) -> None:
+        """Remove an entry of the shared value.
+
+        Args:
+            key (any): list index or dict key
+
+        """
+        del self.value[key]
+
+    def __contains__(self, key: any) -> bool:
+        """Check if a key is into the shared value.
+
+        Args:
+            key (any): key to find
+
+        Returns:
+            bool: boolean to determine if the key is or not into the shared value
+
+        """
+        if self.__value is _UNSET and self.__keyed:
+            return key in self.__entries or self.__read(lambda view: locateSlot(view, key)) is not None
+
+        return key in self.value
+
+    def __len__(self) -> int:
+        """Return the size of the shared value.
+
+        Returns:
+            int: number of entries
+
+        """
+        if self.__value is _UNSET:
+            return self.__read(slotCount)
+
+        return len(self.__value)
+
+    def __iter__(self) -> iter:
+        """Iterate over the shared value.
+
+        Returns:
+            iter: iterator over the dict keys or the list elements
+
+        """
+        return iter(self.value)
+
+    def __repr__(self) -> str:
+        """Print the transaction value.
+
+        Returns:
+            str: printable transaction
+
+        """
+        return "SMTransaction(" + repr(self.value) + ")"
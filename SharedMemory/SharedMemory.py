@@ -5,7 +5,7 @@ Author: Zentetsu
 
 ----
 
-Last Modified: Thu Nov 07 2024
+Last Modified: Sun Oct 18 2026
 Modified By: Zentetsu
 
 ----
@@ -51,19 +51,54 @@ HISTORY:
 2023-10-18	Zen	Correcting close method
 2024-11-03	Zen	Updating docstring + type + silent mode
 2024-11-07	Zen	Optimizing code for memory allocation
+2026-10-18	Zen	Bounding reads to the encoded payload
+2026-10-18	Zen	Adding zero-copy numpy array mode
+2026-10-18	Zen	Moving encoder to SMCodec + encoding outside of the lock
+2026-10-18	Zen	Moving decoder to SMCodec + decoding outside of the lock
+2026-10-18	Zen	Adding control block + reader-writer lock mode
+2026-10-18	Zen	Adding seqlock mode for lock-free reads
+2026-10-18	Zen	Adding generation counter and change notification
+2026-10-18	Zen	Adding in-place updates for slotted dict and list
+2026-10-18	Zen	Adding lazy views + indexed item access for slotted dict and list
+2026-10-18	Zen	Replacing control block and frame sentinels with a versioned header
+2026-10-18	Zen	Adding transaction
+2026-10-18	Zen	Adding multiple buffering
+2026-10-18	Zen	Adding runtime statistics
+2026-10-18	Zen	Adding growable shared space
+2026-10-18	Zen	Storing the type id of compact payloads in the header
+2026-10-18	Zen	Adding pluggable serializers
+2026-10-18	Zen	Adding payload compression
+2026-10-18	Zen	Replacing the manager list with a shared hash table registry
+2026-10-18	Zen	Adding attach + reading the type of server instances from the header + importing numpy on first use
+2026-10-18	Zen	Widening the dtype size of arrays, header version 2
+2026-10-18	Zen	Unregistering on every close unlinking the shared space
+2026-10-18	Zen	Server instances default to the native serializer, pickle must be given explicitly
 """  # noqa
 
 from re import S
-from .SMError import SMMultiInputError, SMTypeError, SMSizeError, SMManagerName, SMAlreadyExist, SMEncoding, SMNameLength
+from .SMError import SMMultiInputError, SMTypeError, SMSizeError, SMManagerName, SMAlreadyExist, SMEncoding, SMNameLength, SMNotDefined, SMUnsafeSerializer
+from .SMCodec import _ARRAY_FIELDS, _NPARRAY, _SLOTTED, _VALUE_TYPES, _importNumpy, dtypeFrom, encode, encodeSlotted, slotCount, locateSlot, decodeSlot, decode
+from .SMView import SMDictView, SMListView, SMTransaction, _UNSET
+from .SMSerializer import getSerializer
+from .SMRegistry import SMRegistry, getRegistry, dropRegistry
+from .SMStats import SMStats, STATS_SIZE, SET_VALUE, GET_VALUE, GET_ITEM, SET_ITEM, DEL_ITEM, TRANSACTION, WAIT_FOR_CHANGE, READ, WRITTEN, RAW, COMPRESSED, ENCODE, DECODE, COMPRESS, DECOMPRESS
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+import threading
+import struct
+import time
 import posix_ipc
 import logging
-import struct
-import numpy
+import zlib
+import lzma
 import json
 import mmap
 import sys
 import os
 
+if TYPE_CHECKING:
+    import numpy
+
 _SHM_NAME_PREFIX = "/psm_"
 _SEM_NAME_PREFIX = "/sem_"
 
@@ -72,19 +107,58 @@ _MAX_LEN = 14
 _MODE = 0o666
 _FLAG = posix_ipc.O_CREX | os.O_RDWR
 
-_BEGIN = b"\xaa"
-_END = b"\xbb"
-_CLOSED = b"\xab"
-
-_INT = b"\x00"
-_FLOAT = b"\x01"
-_BOOL = b"\x02"
-_COMPLEX = b"\x03"
-_STR = b"\x04"
-_LIST = b"\x05"
-_DICT = b"\x06"
-_TUPLE = b"\x07"
-_NPARRAY = b"\x08"
+_MAGIC = b"PSHM"
+_VERSION = 2
+
+_HDR_MAGIC = 0
+_HDR_VERSION = 4
+_HDR_STATE = 5
+_HDR_TYPE = 6
+_HDR_LOCK = 7
+_HDR_LENGTH = 8
+_HDR_CAPACITY = 16
+_HDR_GEN = 24
+_HDR_SEQ = 32
+_HDR_PID = 40
+_HDR_READERS = 44
+_HDR_WRITERS = 48
+_HDR_WAITERS = 52
+_HDR_SLACK = 56
+_HDR_OFFSET = 60
+_HDR_BUFFERS = 64
+_HDR_SERIALIZER = 65
+_HDR_COMPRESS = 66
+_HDR_LEVEL = 67
+_HDR_EPOCH = 68
+_HDR_PUBLISHED = 72
+_HDR_SLOTS = 80
+_HEADER_SIZE = 128
+
+_SLOT_SIZE = 16
+_MAX_BUFFERS = (_HEADER_SIZE - _HDR_SLOTS) // _SLOT_SIZE
+
+_STATE_OPEN = 0x01
+_STATE_CLOSED = 0x02
+
+_ALIGNMENT = 64
+_NPARRAY_DATA = 2 + _ARRAY_FIELDS
+
+_LOCKS = {"mutex": 0, "rwlock": 1, "seqlock": 2}
+_RW_SUFFIXES = ("_t", "_r", "_w")
+_NOTIFY_SUFFIX = "_n"
+_MONITOR_SUFFIX = "_m"
+_MONITOR_SLOTS = 64
+_MONITOR_PERIOD = 100_000_000
+
+_GROW_FACTOR = 2
+_SHRINK_RATIO = 4
+_SHRINK_WRITES = 64
+
+_COMPRESSORS = {"zlib": 1, "lzma": 2}
+_COMPRESS = {1: lambda data, level: zlib.compress(data, level), 2: lambda data, level: lzma.compress(data, preset=level)}
+_DECOMPRESS = {1: lambda data, size: zlib.decompress(data, bufsize=size), 2: lambda data, size: lzma.decompress(data)}
+_STORED = b"\x00"
+_COMPRESSED_FRAME = 9
 
 _MAN_NAME = "man"
 
@@ -94,7 +168,7 @@ class SharedMemory:
 
     MAN = False
 
-    def __init__(self, name: str, value: any = None, path: str = None, size: int = None, client: bool = False, log: str = None, silent: bool = False) -> None:
+    def __init__(self, name: str, value: any = None, path: str = None, size: int = None, client: bool = False, log: str = None, silent: bool = False, array: bool = False, lock: str = "mutex", slack: int = None, buffers: int = 1, monitor: bool = False, grow: int = None, serializer: any = None, compress: str = None, level: int = 6, threshold: int = 1024) -> None:
         """Class constructor.
 
         Args:
@@ -105,14 +179,72 @@ class SharedMemory:
             client (bool, optional): will creat a client or server instance
             log (str, optional): write log into a file. Defaults to None.
             silent (bool, optional): silent mode. Defaults to False.
+            array (bool, optional): map a numpy array with a fixed dtype/shape directly over the shared space. Defaults to False.
+            lock (str, optional): "mutex", "rwlock" to let readers share the lock or "seqlock" for lock-free reads with a single writer, server instances use the client one. Defaults to "mutex".
+            slack (int, optional): spare bytes reserved for every entry of a dict or a list so that updates are written in place. Defaults to None.
+            buffers (int, optional): number of payload slots, with 3 writers fill a free slot and publish it while readers copy the latest published one without any lock, server instances use the client one. Defaults to 1.
+            monitor (bool, optional): publish the statistics of this instance into a side segment read by readMonitor(). Defaults to False.
+            grow (int, optional): maximum size in bytes, a value outgrowing the shared space makes this instance resize it geometrically up to that size, and sustained low usage shrinks it back. Defaults to None.
+            serializer (any, optional): "native", "pickle", "marshal" or an SMSerializer instance, None uses "native". A server must give the serializer of the shared space when it isn't native, pickle is never picked from the header. Defaults to None.
+            compress (str, optional): "zlib" or "lzma" to compress payloads outside the lock, server instances use the client one. Defaults to None.
+            level (int, optional): compression level between 0 and 9, server instances use the client one. Defaults to 6.
+            threshold (int, optional): encoded size in bytes under which payloads are stored uncompressed. Defaults to 1024.
 
         Raises:
             SMMultiInputError: raise an error when value and path are both at None or initialized
+            SMTypeError: raise an error when array mode or slack is requested for a value that doesn't support it
+            ValueError: raise an error when the lock mode, the number of buffers or the serializer is unknown, when buffers or growth are combined with array mode or another lock, or when another serializer or compression is combined with array mode or slack
 
         """
         self.__log = log
         self.__size = None
         self.__silent = silent
+        self.__array_mode = array
+        self.__array = None
+        self.__local = threading.local()
+        self.__lock = lock
+        self.__rw_semaphores = None
+        self.__notify_semaphore = None
+        self.__slack = slack
+        self.__offset = _HEADER_SIZE
+        self.__buffers = buffers
+        self.__capacity = None
+        self.__stats = SMStats()
+        self.__monitor = None
+        self.__monitor_slot = None
+        self.__publish_at = 0
+        self.__grow = grow
+        self.__epoch = 0
+        self.__low_writes = 0
+        self.__remap_lock = threading.Lock()
+        self.__serializer = getSerializer(serializer or "native") if client or serializer is not None else None
+        self.__compress = None
+        self.__level = level
+        self.__threshold = threshold
+
+        if self.__lock not in _LOCKS:
+            raise ValueError("lock must be one of " + ", ".join(_LOCKS) + ".")
+
+        if not 1 <= self.__buffers <= _MAX_BUFFERS:
+            raise ValueError("buffers must be between 1 and " + str(_MAX_BUFFERS) + ".")
+
+        if self.__buffers > 1 and (self.__array_mode or self.__lock != "mutex"):
+            raise ValueError("buffers can't be combined with array mode or another lock.")
+
+        if self.__grow is not None and (self.__array_mode or self.__buffers > 1):
+            raise ValueError("grow can't be combined with array mode or buffers.")
+
+        if self.__serializer is not None and self.__serializer.ID != 0 and (self.__array_mode or self.__slack is not None):
+            raise ValueError("array mode and slack need the native serializer.")
+
+        if compress is not None:
+            if compress not in _COMPRESSORS or not 0 <= level <= 9:
+                raise ValueError("compress must be one of " + ", ".join(_COMPRESSORS) + " with a level between 0 and 9.")
+
+            if self.__array_mode or self.__slack is not None:
+                raise ValueError("compression can't be combined with array mode or slack.")
+
+            self.__compress = _COMPRESSORS[compress]
 
         if self.__log is not None:
             logging.basicConfig(filename=self.__log, format="%(asctime)s - " + _SHM_NAME_PREFIX[1:] + name + " - %(levelname)s - %(message)s")
@@ -120,7 +252,7 @@ class SharedMemory:
             f = open(os.devnull, "w")
             sys.stdout = f
 
-        if name == _MAN_NAME and sys.platform == "darwin" and not SharedMemory.MAN:
+        if name == _MAN_NAME:
             if self.__log is not None:
                 self.__writeLog(1, "shared memory called '" + _MAN_NAME + "' is defined as the shared memory manager.")
             elif not self.__silent:
@@ -152,13 +284,19 @@ class SharedMemory:
         self.__type = type(self.__value)
         self.__client = client
 
+        if self.__array_mode and self.__client and self.__type is not _importNumpy().ndarray:
+            raise SMTypeError(self.__type)
+
+        if self.__slack is not None and self.__client and self.__type not in (dict, list):
+            raise SMTypeError(self.__type)
+
         if len(self.__name_memory) > _MAX_LEN:
             raise SMNameLength(_MAN_NAME, len(self.__name_memory) - len(_SHM_NAME_PREFIX))
 
-        self.__initSharedMemory()
+        if monitor:
+            self.__openMonitor()
 
-        if not SharedMemory.MAN:
-            SharedMemory.__addToManager(name)
+        self.__initSharedMemory()
 
     def restart(self) -> None:
         """Restart the shared memory space."""
@@ -181,34 +319,51 @@ class SharedMemory:
         self.__initSharedMemory()
 
     def close(self) -> None:
-        """Close the shared memory space."""
+        """Close the shared memory space.
+
+        The registry entry is removed when the shared space is unlinked, or only when this process created it if a
+        client closes a space that was already unlinked.
+        """
+        self.__unlinked = False
+
         if not self.getAvailability():
             if self.__log is not None:
                 self.__writeLog(0, "Client already stopped.")
             elif not self.__silent:
                 print("INFO: Client already stopped.")
 
-            if not SharedMemory.MAN:
-                SharedMemory.__removeFromManager(self.__name_memory[5:])
+            if self.__monitor is not None:
+                self.__closeMonitor()
+
+            if self.__client and not SharedMemory.MAN:
+                SharedMemory.__registry().unregister([self.__name_memory[5:]], os.getpid())
 
             return
 
-        self.__semaphore.acquire()
+        self.__acquireWrite()
 
         if self.__mapfile is not None:
-            self.__mapfile.seek(0)
+            self.__mapfile[_HDR_STATE] = _STATE_CLOSED
 
-            self.__mapfile.write(_BEGIN + _CLOSED + _END)
+        self.__releaseWrite()
 
-            self.__mapfile.close()
-            self.__mapfile = None
+        if self.__mapfile is not None:
+            self.__closeMapfile()
 
         if self.__memory is not None:
             try:
                 posix_ipc.unlink_shared_memory(self.__name_memory)
+                self.__unlinked = True
 
-                self.__semaphore.release()
                 self.__semaphore.unlink()
+
+                for _semaphore in self.__rw_semaphores or ():
+                    _semaphore.unlink()
+
+                try:
+                    posix_ipc.unlink_semaphore(self.__name_semaphore + _NOTIFY_SUFFIX)
+                except posix_ipc.ExistentialError:
+                    pass
             except:
                 if self.__log is not None:
                     self.__writeLog(0, "SharedMemory already closed.")
@@ -217,9 +372,16 @@ class SharedMemory:
 
             self.__memory = None
             self.__semaphore = None
+            self.__rw_semaphores = None
+            self.__notify_semaphore = None
 
-        if not SharedMemory.MAN:
-            SharedMemory.__removeFromManager(self.__name_memory[5:])
+        if self.__monitor is not None:
+            self.__closeMonitor()
+
+        if self.__unlinked and not SharedMemory.MAN:
+            SharedMemory.__registry().unregister([self.__name_memory[5:]])
+        elif self.__client and not SharedMemory.MAN:
+            SharedMemory.__registry().unregister([self.__name_memory[5:]], os.getpid())
 
     def setValue(self, value: any, mutex: bool = False) -> bool:
         """Set the shared memory value.
@@ -239,38 +401,61 @@ class SharedMemory:
                 print("ERROR: Shared Memory space doesn't exist.")
 
             return None
-        elif not mutex:
-            self.__semaphore.acquire()
+
+        if not mutex:
+            self.__stats.count(SET_VALUE)
 
         if not self.__checkValue(type(value)):
             raise SMTypeError()
 
-        _data = self.__encoding(value)
+        if self.__array is not None:
+            if value.dtype != self.__array.dtype:
+                raise SMTypeError(value.dtype)
+
+            if value.shape != self.__array.shape:
+                raise SMSizeError("shape " + str(value.shape) + " doesn't match the shared array shape " + str(self.__array.shape) + ".")
+
+            if not mutex:
+                self.__acquireWrite()
+
+            self.__array[...] = value
+            self.__stats.count(WRITTEN, value.nbytes)
+
+            if not mutex:
+                self.__releaseWrite()
+
+            return True
+
+        _buffer = self.__getBuffer()
+        _size, _type_id = self.__encoding(_buffer, value)
+
+        if not mutex:
+            self.__acquireWrite()
+
+        if not self.__fit(_size):
+            if not mutex:
+                self.__releaseWrite(False)
 
-        if sys.getsizeof(_data) > self.__size:
             if self.__log is not None:
                 self.__writeLog(1, "Data size is too big for the shared memory space.")
             elif not self.__silent:
                 print("ERROR: Data size is too big for the shared memory space.")
 
-            if not mutex:
-                self.__semaphore.release()
-
             return False
 
-        self.__mapfile.seek(0)
-        self.__mapfile.write(_data)
+        self.__storePayload(_buffer, _size, _type_id)
 
         if not mutex:
-            self.__semaphore.release()
+            self.__releaseWrite()
 
         return True
 
-    def getValue(self, mutex: bool = False) -> any:
+    def getValue(self, mutex: bool = False, lazy: bool = False) -> any:
         """Return the shared memory value.
 
         Args:
             mutex (bool, optional): use mutex or not. Defaults to False.
+            lazy (bool, optional): return a read-only view decoding only the accessed entries, see view(). Defaults to False.
 
         Returns:
             any: return data from the shared space
@@ -284,44 +469,132 @@ class SharedMemory:
 
             return None
         elif not mutex:
-            self.__semaphore.acquire()
+            self.__stats.count(GET_VALUE)
+
+        if self.__array is not None:
+            return self.__array_ro
+        elif lazy:
+            return self.view()
 
         try:
-            self.__mapfile.seek(0)
-            _packed = self.__mapfile.read()
-            _shift = int.from_bytes(_packed[2:10], "big") + 11 if _packed[1].to_bytes(1, byteorder="big") in [_NPARRAY, _LIST, _TUPLE, _DICT] else _packed[2] + 4
-            _encoded_data = _packed[0:_shift]
+            _encoded_data = self.__readPayload() if mutex else self.__read(self.__readPayload)
         except:
             return None
 
-        if (b := _encoded_data[0].to_bytes(1, byteorder="big") != _BEGIN) or _encoded_data[-1].to_bytes(1, byteorder="big") != _END:
-            if not mutex:
-                self.__semaphore.release()
+        return self.__decoding(_encoded_data)
 
-            raise SMEncoding("BEGIN" if b else "END")
+    def view(self) -> any:
+        """Return a read-only view of a dict or a list stored with slack.
 
-        if _encoded_data[1].to_bytes(1, byteorder="big") == _CLOSED:
-            if not mutex:
-                self.__semaphore.release()
+        The view reads the shared space on every access and only decodes the accessed entries.
 
-            raise SMEncoding("CLOSED")
+        Raises:
+            TypeError: raise an error when the shared data is not a slotted dict or list
 
-        _decoded_data = self.__decoding(_encoded_data[1:-1])
+        Returns:
+            any: SMDictView or SMListView
 
-        if not mutex:
-            self.__semaphore.release()
+        """
+        if self.__slack is None:
+            raise TypeError("Lazy views need a dict or a list shared with slack.")
+
+        return SMDictView(self.__readFrame) if self.__type is dict else SMListView(self.__readFrame)
+
+    def stats(self, reset: bool = False) -> dict:
+        """Return the runtime statistics of this instance.
+
+        Args:
+            reset (bool, optional): reset the statistics once read. Defaults to False.
+
+        Returns:
+            dict: call counts, bytes read and written, and lock wait, lock hold, encoding and decoding timers
+
+        """
+        _stats = self.__stats.toDict()
+
+        if reset:
+            self.__stats.clear()
 
-        return _decoded_data
+        if self.__monitor is not None:
+            self.__publish(time.perf_counter_ns())
+
+        return _stats
 
     def getType(self) -> type:
         """Return data type of shared momory.
 
+        Server instances read it from the header, the value is only decoded for objects of other serializers.
+
         Returns:
             type: data type
 
         """
+        if self.__type is None and self.getAvailability():
+            self.__type = type(self.getValue())
+
         return self.__type
 
+    def getGeneration(self) -> int:
+        """Return the generation of the shared value, incremented by every write.
+
+        Returns:
+            int: generation number
+
+        """
+        if self.__mapfile is None:
+            return None
+
+        return struct.unpack_from(">Q", self.__mapfile, _HDR_GEN)[0]
+
+    def waitForChange(self, generation: int, timeout: float = None) -> int:
+        """Block until the shared value is written after a given generation.
+
+        Args:
+            generation (int): last generation seen by the caller
+            timeout (float, optional): maximum waiting time in seconds, None waits forever. Defaults to None.
+
+        Returns:
+            int: current generation, equal to the given one when the timeout expired
+
+        """
+        if self.__mapfile is None or self.__semaphore is None:
+            return None
+
+        self.__stats.count(WAIT_FOR_CHANGE)
+        _deadline = None if timeout is None else time.monotonic() + timeout
+        _notify = self.__getNotifySemaphore()
+
+        while True:
+            self.__semaphore.acquire()
+
+            _current = struct.unpack_from(">Q", self.__mapfile, _HDR_GEN)[0]
+
+            if _current == generation:
+                struct.pack_into(">I", self.__mapfile, _HDR_WAITERS, struct.unpack_from(">I", self.__mapfile, _HDR_WAITERS)[0] + 1)
+
+            self.__semaphore.release()
+
+            if _current != generation:
+                return _current
+
+            _remaining = None if _deadline is None else max(_deadline - time.monotonic(), 0)
+
+            try:
+                if _remaining is None or posix_ipc.SEMAPHORE_TIMEOUT_SUPPORTED:
+                    _notify.acquire(_remaining)
+                else:
+                    time.sleep(min(_remaining, 0.001))
+                    _notify.acquire(0)
+            except posix_ipc.BusyError:
+                pass
+
+            self.__semaphore.acquire()
+            struct.pack_into(">I", self.__mapfile, _HDR_WAITERS, struct.unpack_from(">I", self.__mapfile, _HDR_WAITERS)[0] - 1)
+            self.__semaphore.release()
+
+            if _deadline is not None and time.monotonic() >= _deadline:
+                return struct.unpack_from(">Q", self.__mapfile, _HDR_GEN)[0]
+
     def getAvailability(self) -> bool:
         """Return the availability of Shared Memory.
 
@@ -336,10 +609,7 @@ class SharedMemory:
                 return False
 
         try:
-            self.__mapfile.seek(0)
-            _encoded_data = self.__mapfile.read()
-
-            return _encoded_data[:3] != _BEGIN + _CLOSED + _END
+            return self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] == _MAGIC and self.__mapfile[_HDR_STATE] == _STATE_OPEN
         except:
             return False
 
@@ -362,17 +632,73 @@ class SharedMemory:
         json.dump(self.getValue(), _file)
         _file.close()
 
+    @contextmanager
+    def transaction(self) -> SMTransaction:
+        """Hold the write lock for a group of reads and writes, the result is written back once on exit.
+
+        Entries of a dict or a list shared with slack are decoded only when accessed and written back in place,
+        other values are decoded once. Nothing is written if nothing changed, an exception discards the changes.
+
+        Yields:
+            SMTransaction: value handle supporting item access, the whole value is available through its value attribute
+
+        Raises:
+            SMNotDefined: raise an error when the shared space is closed
+
+        """
+        if not self.getAvailability() or self.__semaphore is None:
+            raise SMNotDefined(self.__name_memory)
+
+        self.__stats.count(TRANSACTION)
+        _keyed = self.getType() == dict
+        self.__acquireWrite()
+        _changed = False
+
+        try:
+            _transaction = SMTransaction(self.__readLocked, lambda: self.__decoding(self.__readPayload()), self.__slack is not None and self.__buffers == 1, _keyed)
+
+            yield _transaction
+
+            _changed = self.__commit(_transaction)
+        finally:
+            self.__releaseWrite(_changed)
+
+    @contextmanager
+    def lockedView(self) -> "numpy.ndarray":
+        """Lock the shared space and give a writable numpy view over it.
+
+        Yields:
+            numpy.ndarray: writable array backed by the shared space
+
+        Raises:
+            TypeError: raise an error when the shared memory is not in array mode
+
+        """
+        if self.__array is None:
+            raise TypeError("Shared Memory is not in array mode.")
+
+        self.__acquireWrite()
+
+        try:
+            yield self.__array
+        finally:
+            self.__releaseWrite()
+
     def __initSharedMemory(self) -> None:
         """Initialize the shared space."""
-        if self.__size is None:
-            self.__size = sys.getsizeof(self.__encoding(self.__value))
-
         _page_size = mmap.ALLOCATIONGRANULARITY
+
+        if self.__size is None:
+            self.__size = self.__encoding(self.__getBuffer(), self.__value)[0] * self.__buffers + self.__payloadOffset() if self.__client else _page_size
         self.__size = ((self.__size + _page_size - 1) // _page_size) * _page_size
 
         self.__memory = None
         self.__semaphore = None
+        self.__rw_semaphores = None
+        self.__notify_semaphore = None
         self.__mapfile = None
+        self.__array = None
+        _created = False
 
         if self.__client:
             try:
@@ -383,6 +709,7 @@ class SharedMemory:
 
                 self.__memory = posix_ipc.SharedMemory(self.__name_memory, flags=_FLAG, mode=_MODE, size=self.__size)
                 self.__semaphore = posix_ipc.Semaphore(self.__name_semaphore, _FLAG, _MODE, initial_value=1)
+                _created = True
 
                 # os.ftruncate(self.__memory.fd, self.__size)
             except posix_ipc.ExistentialError:
@@ -410,264 +737,815 @@ class SharedMemory:
                 return
 
         self.__mapfile = mmap.mmap(self.__memory.fd, self.__size)
+        self.__memory.close_fd()
+
+        if self.__client and (_created or self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] != _MAGIC):
+            self.__offset = self.__payloadOffset()
+            self.__writeHeader()
+        else:
+            self.__readHeader()
+
+        if self.__lock == "rwlock":
+            self.__rw_semaphores = [self.__openSemaphore(self.__name_semaphore + _suffix, _created) for _suffix in _RW_SUFFIXES]
 
         if self.__client:
             self.setValue(self.__value)
+        elif self.__mapfile[_HDR_TYPE] == _NPARRAY[0]:
+            self.__type = _importNumpy().ndarray
         else:
-            self.__value = self.getValue()
-            self.__type = type(self.__value)
+            self.__type = _VALUE_TYPES.get(self.__mapfile[_HDR_TYPE])
 
-    def __checkValue(self, value: type) -> bool:
-        """Check value type.
+        if self.__array_mode and self.__type is _importNumpy().ndarray:
+            self.__mapArray()
+
+        if self.__client and not SharedMemory.MAN:
+            SharedMemory.__registry().register([self.__entry()])
+
+    def __openMonitor(self) -> None:
+        """Claim a free slot of the monitoring segment to publish the statistics of this instance."""
+        _semaphore = posix_ipc.Semaphore(self.__name_semaphore + _MONITOR_SUFFIX, posix_ipc.O_CREAT, _MODE, initial_value=1)
+        _memory = posix_ipc.SharedMemory(self.__name_memory + _MONITOR_SUFFIX, posix_ipc.O_CREAT, _MODE, size=_MONITOR_SLOTS * STATS_SIZE)
+        self.__monitor = mmap.mmap(_memory.fd, _memory.size)
+        _memory.close_fd()
+
+        _semaphore.acquire()
+
+        try:
+            for _slot in range(_MONITOR_SLOTS):
+                if not SharedMemory.__isAlive(SMStats.read(self.__monitor, _slot * STATS_SIZE)[0]):
+                    self.__monitor_slot = _slot * STATS_SIZE
+                    self.__publish(time.perf_counter_ns())
+
+                    return
+        finally:
+            _semaphore.release()
+            _semaphore.close()
+
+        self.__monitor.close()
+        self.__monitor = None
+
+        if self.__log is not None:
+            self.__writeLog(3, "No monitoring slot left, statistics are kept private.")
+        elif not self.__silent:
+            print("WARNING: No monitoring slot left, statistics are kept private.")
+
+    def __publish(self, now: int) -> None:
+        """Copy the statistics into the monitoring slot.
 
         Args:
-            value (type): value to test
+            now (int): current perf_counter_ns time
 
-        Raises:
-            SMTypeError: raise an error when the value is a dict or a list
+        """
+        self.__stats.publish(self.__monitor, self.__monitor_slot, os.getpid())
+        self.__publish_at = now + _MONITOR_PERIOD
+
+    def __closeMonitor(self) -> None:
+        """Free the monitoring slot, the statistics stay readable through stats()."""
+        SMStats().publish(self.__monitor, self.__monitor_slot, 0)
+        self.__monitor.close()
+        self.__monitor = None
+
+        if self.__client:
+            for _unlink, _name in ((posix_ipc.unlink_shared_memory, self.__name_memory), (posix_ipc.unlink_semaphore, self.__name_semaphore)):
+                try:
+                    _unlink(_name + _MONITOR_SUFFIX)
+                except posix_ipc.ExistentialError:
+                    pass
+
+    def __payloadOffset(self) -> int:
+        """Return the position of the encoded value, numpy data is aligned in array mode.
 
         Returns:
-            type: return the initialized value
+            int: payload offset
 
         """
-        if value != self.__type:
-            raise SMTypeError(value)
+        if self.__array_mode:
+            return _HEADER_SIZE + (-(_HEADER_SIZE + _NPARRAY_DATA)) % _ALIGNMENT
 
-        return True
+        return _HEADER_SIZE
 
-    def __encoding(self, value: any) -> list:
-        """Encode value.
+    def __entry(self) -> tuple:
+        """Return the registry entry of this shared space.
 
-        Args:
-            value (any): data to encode
+        Returns:
+            tuple: name, type name, size, creator pid and creation time
 
         """
-        _data = _BEGIN
+        return (self.__name_memory[5:], self.__type.__name__, self.__size, os.getpid(), time.time())
+
+    def __writeHeader(self) -> None:
+        """Write the header of a newly created shared space."""
+        self.__mapfile[0:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] = _MAGIC
+        self.__mapfile[_HDR_VERSION] = _VERSION
+        self.__mapfile[_HDR_LOCK] = _LOCKS[self.__lock]
+        self.__capacity = (self.__size - self.__offset) // self.__buffers
+        struct.pack_into(">Q", self.__mapfile, _HDR_CAPACITY, self.__capacity)
+        struct.pack_into(">I", self.__mapfile, _HDR_SLACK, self.__slack or 0)
+        struct.pack_into(">I", self.__mapfile, _HDR_OFFSET, self.__offset)
+        self.__mapfile[_HDR_BUFFERS] = self.__buffers
+        self.__mapfile[_HDR_SERIALIZER] = self.__serializer.ID
+        self.__mapfile[_HDR_COMPRESS] = self.__compress or 0
+        self.__mapfile[_HDR_LEVEL] = self.__level
+        self.__mapfile[_HDR_STATE] = _STATE_OPEN
+        self.__epoch = 0
+
+    def __readHeader(self) -> None:
+        """Read the layout of an existing shared space from its header.
 
-        if type(value) == int:
-            _data += _INT + b"\x08" + value.to_bytes(8, "big", signed=True)
+        Raises:
+            SMEncoding: raise an error when the header version is not supported
+            ValueError: raise an error when the serializer of the shared space is unknown or differs from the given one
+            SMUnsafeSerializer: raise an error when the shared space uses pickle and no serializer was given
 
-        elif type(value) == float:
-            _encoded_float = struct.pack(">d", value)
+        """
+        if self.__mapfile[_HDR_MAGIC : _HDR_MAGIC + 4] != _MAGIC:
+            self.__serializer = self.__serializer or getSerializer("native")
+            self.__offset = _HEADER_SIZE
+            self.__buffers = 1
+            self.__capacity = self.__size - self.__offset
+            self.__epoch = 0
 
-            _data += _FLOAT + len(_encoded_float).to_bytes(1, byteorder="big") + _encoded_float
+            return
 
-        if type(value) == complex:
-            _encoded_cplx = self.__encoding(value.real)[1:-1] + self.__encoding(value.imag)[1:-1]
+        if self.__mapfile[_HDR_VERSION] != _VERSION:
+            raise SMEncoding("VERSION")
 
-            _data += _COMPLEX + len(_encoded_cplx).to_bytes(1, byteorder="big") + _encoded_cplx
+        self.__lock = next(k for k, v in _LOCKS.items() if v == self.__mapfile[_HDR_LOCK])
+        self.__offset = struct.unpack_from(">I", self.__mapfile, _HDR_OFFSET)[0]
+        self.__capacity = struct.unpack_from(">Q", self.__mapfile, _HDR_CAPACITY)[0]
+        self.__buffers = self.__mapfile[_HDR_BUFFERS]
+        self.__epoch = struct.unpack_from(">I", self.__mapfile, _HDR_EPOCH)[0]
+        self.__compress = self.__mapfile[_HDR_COMPRESS] or None
+        self.__level = self.__mapfile[_HDR_LEVEL]
 
-        elif type(value) == bool:
-            _data += _BOOL + b"\x01" + int(value).to_bytes(1, byteorder="big")
+        if self.__serializer is None:
+            if self.__mapfile[_HDR_SERIALIZER] == getSerializer("pickle").ID:
+                raise SMUnsafeSerializer(self.__name_memory[len(_SHM_NAME_PREFIX) :], "pickle")
 
-        elif type(value) == str:
-            _str_encoded = value.encode("utf-8")
+            self.__serializer = getSerializer("native")
 
-            _data += _STR + len(_str_encoded).to_bytes(1, byteorder="big") + _str_encoded
+        if self.__serializer.ID != self.__mapfile[_HDR_SERIALIZER]:
+            raise ValueError("serializer " + str(self.__serializer.name) + " doesn't match the one of the shared space.")
 
-        elif type(value) == list or type(value) == tuple:
-            _lt_encoded = b""
+        self.__slack = struct.unpack_from(">I", self.__mapfile, _HDR_SLACK)[0] if bytes([self.__mapfile[_HDR_TYPE]]) in _SLOTTED else None
 
-            for e in value:
-                _lt_encoded += self.__encoding(e)
+    def __mapArray(self) -> None:
+        """Map a numpy array over the data part of the shared space."""
+        _size_np, _size_shape, _size_dtype = struct.unpack_from(">QQQ", self.__mapfile, self.__offset + 2)
+        _end = self.__offset + 10 + _size_np
 
-            _data += (_LIST if type(value) == list else _TUPLE) + len(_lt_encoded).to_bytes(8, byteorder="big") + _lt_encoded
+        _shape = decode(self.__mapfile[_end - _size_dtype - _size_shape : _end - _size_dtype])
+        _dtype = dtypeFrom(decode(self.__mapfile[_end - _size_dtype : _end]))
 
-        elif type(value) == dict:
-            if list(value.keys())[0] == "_LIST":
-                return self.__encoding([0] * value[list(value.keys())[0]])
-            elif list(value.keys())[0] == "_NPARRAY":
-                return self.__encoding(numpy.zeros(value[list(value.keys())[0]][0], dtype=value[list(value.keys())[0]][1]))
-            else:
-                _dict_encoded = b""
+        self.__array = _importNumpy().ndarray(_shape, dtype=_dtype, buffer=self.__mapfile, offset=self.__offset + _NPARRAY_DATA)
+        self.__array_ro = self.__array.view()
+        self.__array_ro.flags.writeable = False
 
-                for k in value:
-                    _dict_encoded += self.__encoding(k)
-                    _dict_encoded += self.__encoding(value[k])
+    def __openSemaphore(self, name: str, created: bool) -> posix_ipc.Semaphore:
+        """Open an additional semaphore of the shared space.
 
-                _data += _DICT + len(_dict_encoded).to_bytes(8, byteorder="big") + _dict_encoded
+        Args:
+            name (str): semaphore name
+            created (bool): the shared space has just been created, a stale semaphore is then replaced
 
-        elif type(value) == numpy.ndarray:
-            _encoded_shape = self.__encoding(value.shape)
-            _encoded_dtype = self.__encoding(value.dtype.name)
-            _encoded_np = len(_encoded_shape).to_bytes(8, byteorder="big") + len(_encoded_dtype).to_bytes(1, byteorder="big") + value.tobytes() + _encoded_shape + _encoded_dtype
+        Returns:
+            posix_ipc.Semaphore: opened semaphore
 
-            _data += _NPARRAY + len(_encoded_np).to_bytes(8, byteorder="big") + _encoded_np
+        """
+        if created:
+            try:
+                posix_ipc.unlink_semaphore(name)
+            except posix_ipc.ExistentialError:
+                pass
 
-        _data += _END
+        return posix_ipc.Semaphore(name, posix_ipc.O_CREAT, _MODE, initial_value=1)
 
-        return _data
+    def __fit(self, size: int) -> bool:
+        """Make the shared space fit a value about to be stored, the write lock must be held.
 
-    def __decoding(self, value: bytes) -> any:
-        """MDecode value.
+        With growth enabled, the space doubles until the value fits or the maximum size is reached, and is halved
+        towards the stored size after a run of writes using less than a quarter of it. Lock-free seqlock readers
+        may still be reading beyond the new end, so these spaces never shrink.
 
         Args:
-            value (any): data to decode
+            size (int): encoded value size
+
+        Returns:
+            bool: return if the value fits in the shared space
 
         """
-        if value[0].to_bytes(1, "big") == _INT:
-            _d_data = int.from_bytes(value[2 : value[1] + 2], "big", signed=True)
+        if self.__grow is None or self.__buffers > 1:
+            return size <= self.__capacity
+
+        if size > self.__capacity:
+            self.__low_writes = 0
+
+            if self.__offset + size > self.__grow:
+                return False
 
-        elif value[0].to_bytes(1, "big") == _FLOAT:
-            _d_data = struct.unpack(">d", value[2 : value[1] + 2])[0]
+            self.__resize(max(self.__offset + size, min(self.__size * _GROW_FACTOR, self.__grow)))
+        elif size * _SHRINK_RATIO < self.__capacity and self.__lock != "seqlock" and self.__size > mmap.ALLOCATIONGRANULARITY:
+            self.__low_writes += 1
 
-        elif value[0].to_bytes(1, "big") == _COMPLEX:
-            _d_data = complex(self.__decoding(value[2 : value[3] + 4]), self.__decoding(value[value[3] + 4 : value[3] + 4 + value[value[3] + 6]]))
+            if self.__low_writes >= _SHRINK_WRITES:
+                self.__low_writes = 0
+                self.__resize(max(self.__offset + size * _GROW_FACTOR, self.__size // _GROW_FACTOR))
+        else:
+            self.__low_writes = 0
 
-        elif value[0].to_bytes(1, "big") == _BOOL:
-            _d_data = bool(value[2])
+        return True
 
-        elif value[0].to_bytes(1, "big") == _STR:
-            _d_data = value[2 : value[1] + 2].decode("utf-8")
+    def __resize(self, size: int) -> None:
+        """Resize the shared space and remap it, the write lock must be held.
 
-        elif value[0].to_bytes(1, "big") == _LIST or value[0].to_bytes(1, "big") == _TUPLE:
-            c_type = value[0]
-            _d_data = []
+        The capacity is written before the epoch, attached instances remap when they see a new epoch.
 
-            if len(value) != 2:
-                value = value[9:]
+        Args:
+            size (int): new size in bytes, rounded up to the page size
 
-                while len(value) != 0:
-                    _shift = int.from_bytes(value[2:10], "big") + 10 if value[1].to_bytes(1, "big") in [_NPARRAY, _LIST, _TUPLE, _DICT] else value[2] + 3
-                    new_data = value[1:_shift]
-                    value = value[_shift + 1 :]
-                    _d_data.append(self.__decoding(new_data))
+        """
+        _page_size = mmap.ALLOCATIONGRANULARITY
+        _size = ((size + _page_size - 1) // _page_size) * _page_size
 
-            if c_type.to_bytes(1, "big") == _TUPLE:
-                _d_data = tuple(_d_data)
+        if _size == self.__size:
+            return
 
-        elif value[0].to_bytes(1, "big") == _DICT:
-            _d_data = {}
+        self.__remap(_size)
+        self.__capacity = _size - self.__offset
+        self.__epoch += 1
 
-            value = value[9:]
+        struct.pack_into(">Q", self.__mapfile, _HDR_CAPACITY, self.__capacity)
+        struct.pack_into(">I", self.__mapfile, _HDR_EPOCH, self.__epoch)
 
-            while len(value) != 0:
-                new_key = self.__decoding(value[1 : value[2] + 3])
-                value = value[value[2] + 4 :]
-                _shift = int.from_bytes(value[2:10], "big") + 10 if value[1].to_bytes(1, "big") in [_NPARRAY, _LIST, _TUPLE, _DICT] else value[2] + 3
-                new_data = self.__decoding(value[1:_shift])
-                _d_data[new_key] = new_data
-                value = value[_shift + 1 :]
+        SharedMemory.__registry().resize(self.__name_memory[5:], _size)
 
-        elif value[0].to_bytes(1, "big") == _NPARRAY:
-            _size_data = int.from_bytes(value[1:9], "big")
-            _size_shape = int.from_bytes(value[9:17], "big")
-            _data = value[18 : -_size_shape - value[17]]
-            _shape = value[9 + _size_data - _size_shape - value[17] : -value[17]]
-            _type = value[9 + _size_data - value[17] :]
+    def __checkEpoch(self) -> None:
+        """Remap the shared space when another instance has resized it.
 
-            _d_data = numpy.frombuffer(_data, dtype=self.__decoding(_type[1:-1])).reshape(self.__decoding(_shape[1:-1]))
+        The previous mapping is not closed, it is released once no thread of this instance reads it anymore.
+        """
+        if struct.unpack_from(">I", self.__mapfile, _HDR_EPOCH)[0] == self.__epoch:
+            return
 
-        return _d_data
+        with self.__remap_lock:
+            if struct.unpack_from(">I", self.__mapfile, _HDR_EPOCH)[0] != self.__epoch:
+                self.__remap()
+                self.__readHeader()
 
-    def __initValueByJSON(self, path: str) -> dict:
-        """Extract value from a JSON file.
+    def __remap(self, size: int = None) -> None:
+        """Map the shared space again, the descriptor is reopened for the time of the call as mappings hold their own.
 
         Args:
-            path (str): path to the JSON file
+            size (int, optional): size to truncate the shared space to, None maps its current size. Defaults to None.
+
+        """
+        _memory = posix_ipc.SharedMemory(self.__name_memory)
+
+        try:
+            if size is not None:
+                os.ftruncate(_memory.fd, size)
+
+            self.__size = os.fstat(_memory.fd).st_size
+            self.__mapfile = mmap.mmap(_memory.fd, self.__size)
+        finally:
+            _memory.close_fd()
+
+    def __readPayload(self) -> bytes:
+        """Copy the encoded value out of the shared space.
 
         Returns:
-            dict: return  data from JSON file
+            bytes: encoded value
 
         """
-        _json_file = open(path)
-        _value = json.load(_json_file)
-        _json_file.close()
+        _position, _slot = self.__current()
+        _length = struct.unpack_from(">Q", self.__mapfile, _HDR_LENGTH if _slot is None else _HDR_SLOTS + _slot * _SLOT_SIZE + 8)[0]
+        self.__stats.count(READ, _length)
 
-        return _value
+        return self.__mapfile[_position : _position + _length]
 
-    def __writeLog(self, log_id: int, message: str) -> None:
-        """Write information into a log file.
+    def __current(self) -> tuple:
+        """Return where the current encoded value is stored.
 
-        Args:
-            log_id (int): log id
-            message (str): message to write into the log file
+        With several buffers, a reader uses the slot chosen by __read and a writer the latest published one.
+
+        Returns:
+            tuple: payload position and slot index, None with a single buffer
 
         """
-        if log_id == 0:
-            logging.info(message)
-        elif log_id == 1:
-            logging.error(message)
-        elif log_id == 2:
-            logging.debug(message)
-        elif log_id == 3:
-            logging.warning(message)
+        if self.__buffers == 1:
+            return self.__offset, None
 
-    def __getitem__(self, key: any) -> any:
-        """Get item value from the shared data.
+        _slot = getattr(self.__local, "slot", None)
 
-        Args:
-            key (any): key
+        if _slot is None:
+            _slot = struct.unpack_from(">Q", self.__mapfile, _HDR_PUBLISHED)[0] % self.__buffers
 
-        """
-        if not self.getAvailability() or self.__semaphore is None:
-            if self.__log is not None:
-                self.__writeLog(1, "Shared Memory space doesn't exist.")
-            elif not self.__silent:
-                print("ERROR: Shared Memory space doesn't exist.")
+        return self.__offset + _slot * self.__capacity, _slot
 
-            return None
-        else:
-            self.__semaphore.acquire()
+    def __readLocked(self, accessor: callable) -> any:
+        """Run an accessor over the encoded shared data while the lock is already held.
 
-        self.__value = self.getValue(mutex=True)
+        Args:
+            accessor (callable): function taking a memoryview of the encoded data
 
-        self.__semaphore.release()
+        Returns:
+            any: accessor result
 
-        if self.__type == dict:
-            if type(key) is int:
-                key = str(key)
+        """
+        _position = self.__current()[0]
 
-            return self.__value[key]
-        elif self.__type == list:
-            return self.__value[key]
-        else:
-            return self.__value
+        with memoryview(self.__mapfile)[_position : _position + self.__capacity] as _view:
+            return accessor(_view)
 
-    def __setitem__(self, key: any, value: any) -> None:
-        """Update data of the shared space.
+    def __commit(self, transaction: SMTransaction) -> bool:
+        """Write back the result of a transaction.
 
         Args:
-            key (str): key
-            value (any): new key value
+            transaction (SMTransaction): finished transaction
+
+        Raises:
+            SMSizeError: raise an error when the new value doesn't fit in the shared space
+
+        Returns:
+            bool: return if the shared value has changed
 
         """
-        if not self.getAvailability() or self.__semaphore is None:
-            if self.__log is not None:
-                self.__writeLog(1, "Shared Memory space doesn't exist.")
-            elif not self.__silent:
-                print("ERROR: Shared Memory space doesn't exist.")
+        _value, _entries = transaction.getChanges()
 
-            return None
-        else:
-            self.__semaphore.acquire()
+        if _value is _UNSET:
+            _changed = False
 
-        self.__value = self.getValue(mutex=True)
+            with memoryview(self.__mapfile)[self.__offset :] as _view:
+                for _key, _entry in _entries.items():
+                    _data = encode(_entry)
+                    _start, _end = locateSlot(_view, _key)
 
-        if self.__type == dict:
-            if type(key) is int:
-                key = str(key)
-            self.__value[key] = value
-        elif self.__type == list:
-            self.__value[key] = value
-        else:
-            self.__value = value
+                    if _view[_start : _start + len(_data)] == _data:
+                        continue
+                    elif _start + len(_data) > _end:
+                        break
 
-        if sys.getsizeof(self.__value) > self.__size:
-            raise SMSizeError
+                    _view[_start : _start + len(_data)] = _data
+                    self.__stats.count(WRITTEN, len(_data))
+                    _changed = True
+                else:
+                    return _changed
 
-        self.setValue(self.__value, mutex=True)
+            _value = transaction.value
 
-        self.__semaphore.release()
+        _buffer = self.__getBuffer()
+        _size, _type_id = self.__encoding(_buffer, _value)
 
-    def __len__(self) -> int:
-        """Return the size of the shared data.
+        if _buffer[0:_size] == self.__readPayload():
+            return False
 
-        Returns:
-            int: size of the shared data
+        if not self.__fit(_size):
+            raise SMSizeError("transaction result of " + str(_size) + " bytes doesn't fit in the shared memory space.")
+
+        self.__type = type(_value)
+        self.__storePayload(_buffer, _size, _type_id)
+
+        return True
+
+    def __storePayload(self, buffer: bytearray, size: int, type_id: int) -> None:
+        """Copy an encoded value into the shared space and update the header, the lock must be held.
+
+        Args:
+            buffer (bytearray): encoded value
+            size (int): encoded value size
+            type_id (int): type id of the value
+
+        """
+        if self.__buffers == 1:
+            with memoryview(buffer) as _view:
+                self.__mapfile[self.__offset : self.__offset + size] = _view[0:size]
+        else:
+            _published = struct.unpack_from(">Q", self.__mapfile, _HDR_PUBLISHED)[0]
+            _slot = (_published + 1) % self.__buffers
+            _position = self.__offset + _slot * self.__capacity
+            _counter = _HDR_SLOTS + _slot * _SLOT_SIZE
+            _seq = struct.unpack_from(">Q", self.__mapfile, _counter)[0]
+
+            struct.pack_into(">Q", self.__mapfile, _counter, _seq + 1)
+
+            with memoryview(buffer) as _view:
+                self.__mapfile[_position : _position + size] = _view[0:size]
+
+            struct.pack_into(">QQ", self.__mapfile, _counter, _seq + 2, size)
+            struct.pack_into(">Q", self.__mapfile, _HDR_PUBLISHED, _published + 1)
+
+        self.__mapfile[_HDR_TYPE] = type_id
+        struct.pack_into(">Q", self.__mapfile, _HDR_LENGTH, size)
+        self.__stats.count(WRITTEN, size)
+
+    def __readFrame(self, accessor: callable) -> any:
+        """Run an accessor over the encoded shared data.
+
+        Args:
+            accessor (callable): function taking a memoryview of the encoded data
 
         Raises:
-            TypeError: raise an error when this method is called and tha data shared type is not a dict
+            SMNotDefined: raise an error when the shared space is closed
+
+        Returns:
+            any: accessor result
+
+        """
+        if not self.getAvailability():
+            raise SMNotDefined(self.__name_memory)
+
+        return self.__read(lambda: self.__readLocked(accessor))
+
+    def __read(self, reader: callable) -> any:
+        """Run a read access on the shared space.
+
+        With a seqlock, the access runs without any semaphore and is retried until no write happened meanwhile.
+        With several buffers, the latest published slot is read without any semaphore and the access is only retried
+        when writers reused that slot meanwhile.
+
+        Args:
+            reader (callable): read access
+
+        Returns:
+            any: read access result
+
+        """
+        if self.__lock != "seqlock" and self.__buffers == 1:
+            self.__acquireRead()
+
+            try:
+                return reader()
+            finally:
+                self.__releaseRead()
+
+        _counter = _HDR_SEQ
+
+        try:
+            while True:
+                if self.__buffers > 1:
+                    self.__local.slot = struct.unpack_from(">Q", self.__mapfile, _HDR_PUBLISHED)[0] % self.__buffers
+                    _counter = _HDR_SLOTS + self.__local.slot * _SLOT_SIZE
+
+                self.__checkEpoch()
+                _seq = struct.unpack_from(">Q", self.__mapfile, _counter)[0]
+
+                if _seq & 1:
+                    time.sleep(0)
+
+                    continue
+
+                try:
+                    _result = reader()
+                except Exception:
+                    if struct.unpack_from(">Q", self.__mapfile, _counter)[0] == _seq:
+                        raise
+
+                    continue
+
+                if struct.unpack_from(">Q", self.__mapfile, _counter)[0] == _seq:
+                    return _result
+        finally:
+            self.__local.slot = None
+
+    def __acquireRead(self) -> None:
+        """Acquire the lock as a reader."""
+        _start = time.perf_counter_ns()
+
+        if self.__rw_semaphores is None:
+            self.__semaphore.acquire()
+        else:
+            _try, _readers, _ = self.__rw_semaphores
+
+            _try.acquire()
+            _readers.acquire()
+
+            _count = struct.unpack_from(">I", self.__mapfile, _HDR_READERS)[0] + 1
+            struct.pack_into(">I", self.__mapfile, _HDR_READERS, _count)
+
+            if _count == 1:
+                self.__semaphore.acquire()
+
+            _readers.release()
+            _try.release()
+
+        self.__checkEpoch()
+        self.__local.acquired = (_start, time.perf_counter_ns())
+
+    def __releaseRead(self) -> None:
+        """Release the lock held as a reader."""
+        self.__recordLock()
+
+        if self.__rw_semaphores is None:
+            self.__semaphore.release()
+
+            return
+
+        _readers = self.__rw_semaphores[1]
+
+        _readers.acquire()
+
+        _count = struct.unpack_from(">I", self.__mapfile, _HDR_READERS)[0] - 1
+        struct.pack_into(">I", self.__mapfile, _HDR_READERS, _count)
+
+        if _count == 0:
+            self.__semaphore.release()
+
+        _readers.release()
+
+    def __acquireWrite(self) -> None:
+        """Acquire the lock as a writer, waiting writers stop new readers from entering."""
+        _start = time.perf_counter_ns()
+
+        if self.__rw_semaphores is not None:
+            _try, _, _writers = self.__rw_semaphores
+
+            _writers.acquire()
+
+            _count = struct.unpack_from(">I", self.__mapfile, _HDR_WRITERS)[0] + 1
+            struct.pack_into(">I", self.__mapfile, _HDR_WRITERS, _count)
+
+            if _count == 1:
+                _try.acquire()
+
+            _writers.release()
+
+        self.__semaphore.acquire()
+
+        self.__checkEpoch()
+        self.__local.acquired = (_start, time.perf_counter_ns())
+
+        if self.__lock == "seqlock":
+            self.__bumpSequence()
+
+    def __releaseWrite(self, changed: bool = True) -> None:
+        """Release the lock held as a writer, publish a new generation and wake up the waiting instances.
+
+        Args:
+            changed (bool, optional): the shared value has been written, otherwise no generation is published. Defaults to True.
+
+        """
+        _waiters = 0
+
+        if changed:
+            struct.pack_into(">Q", self.__mapfile, _HDR_GEN, struct.unpack_from(">Q", self.__mapfile, _HDR_GEN)[0] + 1)
+            struct.pack_into(">I", self.__mapfile, _HDR_PID, os.getpid())
+            _waiters = struct.unpack_from(">I", self.__mapfile, _HDR_WAITERS)[0]
+
+        if self.__lock == "seqlock":
+            self.__bumpSequence()
+
+        self.__recordLock()
+        self.__semaphore.release()
+
+        if _waiters:
+            _notify = self.__getNotifySemaphore()
+
+            for _ in range(_waiters):
+                _notify.release()
+
+        if self.__rw_semaphores is not None:
+            _try, _, _writers = self.__rw_semaphores
+
+            _writers.acquire()
+
+            _count = struct.unpack_from(">I", self.__mapfile, _HDR_WRITERS)[0] - 1
+            struct.pack_into(">I", self.__mapfile, _HDR_WRITERS, _count)
+
+            if _count == 0:
+                _try.release()
+
+            _writers.release()
+
+    def __recordLock(self) -> None:
+        """Record the wait and hold durations of the lock about to be released, and publish them periodically."""
+        _now = time.perf_counter_ns()
+        _start, _acquired = self.__local.acquired
+        self.__stats.lock(_acquired - _start, _now - _acquired)
+
+        if self.__monitor is not None and _now >= self.__publish_at:
+            self.__publish(_now)
+
+    def __getNotifySemaphore(self) -> posix_ipc.Semaphore:
+        """Return the semaphore used to wake up the instances waiting for a change.
+
+        Returns:
+            posix_ipc.Semaphore: notification semaphore
+
+        """
+        if self.__notify_semaphore is None:
+            self.__notify_semaphore = posix_ipc.Semaphore(self.__name_semaphore + _NOTIFY_SUFFIX, posix_ipc.O_CREAT, _MODE, initial_value=0)
+
+        return self.__notify_semaphore
+
+    def __bumpSequence(self) -> None:
+        """Increment the seqlock sequence, odd while a write is in progress."""
+        struct.pack_into(">Q", self.__mapfile, _HDR_SEQ, struct.unpack_from(">Q", self.__mapfile, _HDR_SEQ)[0] + 1)
+
+    def __closeMapfile(self) -> None:
+        """Close the memory mapping of the shared space."""
+        self.__array = None
+        self.__array_ro = None
+
+        try:
+            self.__mapfile.close()
+        except BufferError:
+            if self.__log is not None:
+                self.__writeLog(3, "Array views are still in use, memory mapping will be released with them.")
+            elif not self.__silent:
+                print("WARNING: Array views are still in use, memory mapping will be released with them.")
+
+        self.__mapfile = None
+
+    def __checkValue(self, value: type) -> bool:
+        """Check value type.
+
+        Args:
+            value (type): value to test
+
+        Raises:
+            SMTypeError: raise an error when the value is a dict or a list
+
+        Returns:
+            type: return the initialized value
+
+        """
+        if self.__type is None:
+            self.__type = value
+        elif value != self.__type:
+            raise SMTypeError(value)
+
+        return True
+
+    def __encoding(self, buffer: bytearray, value: any) -> tuple:
+        """Encode value with the layout of the shared space, compressed when the shared space is.
+
+        Args:
+            buffer (bytearray): destination buffer
+            value (any): data to encode
+
+        Returns:
+            tuple: stored size and type id of the value
+
+        """
+        _start = time.perf_counter_ns()
+
+        try:
+            if self.__slack is not None:
+                _size = encodeSlotted(buffer, value, self.__slack)
+            else:
+                _size = self.__serializer.encodeInto(buffer, value)
+        finally:
+            self.__stats.time(ENCODE, time.perf_counter_ns() - _start)
+
+        _type_id = self.__serializer.typeId(buffer, value)
+
+        if self.__compress is not None:
+            _size = self.__compressing(buffer, _size)
+
+        return _size, _type_id
+
+    def __compressing(self, buffer: bytearray, size: int) -> int:
+        """Compress an encoded value in place.
+
+        A compressed payload starts with the compressor id and the encoded size, other payloads with a null byte.
+
+        Args:
+            buffer (bytearray): encoded value
+            size (int): encoded value size
+
+        Returns:
+            int: stored size
+
+        """
+        _data = None
+
+        if size >= self.__threshold:
+            _start = time.perf_counter_ns()
+
+            with memoryview(buffer) as _view:
+                _data = _COMPRESS[self.__compress](_view[0:size], self.__level)
+
+            self.__stats.time(COMPRESS, time.perf_counter_ns() - _start)
+
+        if _data is None or _COMPRESSED_FRAME + len(_data) >= size:
+            buffer[1 : size + 1] = buffer[0:size]
+            buffer[0] = _STORED[0]
+            _stored = size + 1
+        else:
+            buffer[0:_COMPRESSED_FRAME] = bytes((self.__compress,)) + size.to_bytes(8, "big")
+            buffer[_COMPRESSED_FRAME : _COMPRESSED_FRAME + len(_data)] = _data
+            _stored = _COMPRESSED_FRAME + len(_data)
+
+        if _data is not None:
+            self.__stats.count(RAW, size)
+            self.__stats.count(COMPRESSED, _stored)
+
+        return _stored
+
+    def __decoding(self, data: bytes) -> any:
+        """Decode an encoded value, decompressed first when the shared space is compressed.
+
+        Args:
+            data (bytes): encoded value
+
+        Returns:
+            any: decoded value
+
+        """
+        _view = memoryview(data)
+
+        if self.__compress is not None:
+            if _view[0] == _STORED[0]:
+                _view = _view[1:]
+            else:
+                _start = time.perf_counter_ns()
+                _view = memoryview(_DECOMPRESS[_view[0]](_view[_COMPRESSED_FRAME:], int.from_bytes(_view[1:_COMPRESSED_FRAME], "big")))
+                self.__stats.time(DECOMPRESS, time.perf_counter_ns() - _start)
+
+        _start = time.perf_counter_ns()
+        _value = self.__serializer.decode(_view)
+        self.__stats.time(DECODE, time.perf_counter_ns() - _start)
+
+        return _value
+
+    def __writeSlot(self, key: any, data: bytes) -> bool:
+        """Write an encoded dict or list entry in place when its slot is large enough.
+
+        Args:
+            key (any): list index or dict key
+            data (bytes): encoded entry
+
+        Returns:
+            bool: return if the entry has been written
+
+        """
+        if self.__buffers > 1:
+            return False
+
+        with memoryview(self.__mapfile)[self.__offset :] as _view:
+            _slot = locateSlot(_view, key)
+
+        if _slot is None or _slot[0] + len(data) > _slot[1]:
+            return False
+
+        self.__mapfile[self.__offset + _slot[0] : self.__offset + _slot[0] + len(data)] = data
+        self.__stats.count(WRITTEN, len(data))
+
+        return True
+
+    def __getBuffer(self) -> bytearray:
+        """Return the encoding buffer of the calling thread.
+
+        Returns:
+            bytearray: reusable encoding buffer
+
+        """
+        try:
+            return self.__local.buffer
+        except AttributeError:
+            self.__local.buffer = bytearray()
+
+            return self.__local.buffer
+
+    def __initValueByJSON(self, path: str) -> dict:
+        """Extract value from a JSON file.
+
+        Args:
+            path (str): path to the JSON file
+
+        Returns:
+            dict: return  data from JSON file
+
+        """
+        _json_file = open(path)
+        _value = json.load(_json_file)
+        _json_file.close()
+
+        return _value
+
+    def __writeLog(self, log_id: int, message: str) -> None:
+        """Write information into a log file.
+
+        Args:
+            log_id (int): log id
+            message (str): message to write into the log file
+
+        """
+        if log_id == 0:
+            logging.info(message)
+        elif log_id == 1:
+            logging.error(message)
+        elif log_id == 2:
+            logging.debug(message)
+        elif log_id == 3:
+            logging.warning(message)
+
+    def __getitem__(self, key: any) -> any:
+        """Get item value from the shared data.
+
+        Args:
+            key (any): key
 
         """
         if not self.getAvailability() or self.__semaphore is None:
@@ -677,12 +1555,100 @@ class SharedMemory:
                 print("ERROR: Shared Memory space doesn't exist.")
 
             return None
+
+        self.__stats.count(GET_ITEM)
+
+        if self.__array is not None:
+            return self.__read(lambda: self.__array[key].copy())
+        elif self.__slack is not None:
+            if self.__type == dict and type(key) is int:
+                key = str(key)
+
+            return self.__readFrame(lambda view: decodeSlot(view, key))
+
+        self.__value = self.getValue()
+
+        if self.__type == dict:
+            if type(key) is int:
+                key = str(key)
+
+            return self.__value[key]
+        elif self.__type == list:
+            return self.__value[key]
         else:
-            self.__semaphore.acquire()
+            return self.__value
 
-        self.__value = self.getValue(mutex=True)
+    def __setitem__(self, key: any, value: any) -> None:
+        """Update data of the shared space.
 
-        self.__semaphore.release()
+        Args:
+            key (str): key
+            value (any): new key value
+
+        """
+        if not self.getAvailability() or self.__semaphore is None:
+            if self.__log is not None:
+                self.__writeLog(1, "Shared Memory space doesn't exist.")
+            elif not self.__silent:
+                print("ERROR: Shared Memory space doesn't exist.")
+
+            return None
+
+        self.__stats.count(SET_ITEM)
+
+        if self.__type == dict and type(key) is int:
+            key = str(key)
+
+        _data = encode(value) if self.__slack is not None else None
+
+        self.__acquireWrite()
+
+        try:
+            if self.__array is not None:
+                self.__array[key] = value
+
+                return
+
+            if _data is not None and self.__writeSlot(key, _data):
+                return
+
+            self.__value = self.getValue(mutex=True)
+
+            if self.__type == dict or self.__type == list:
+                self.__value[key] = value
+            else:
+                self.__value = value
+
+            if self.__compress is None and sys.getsizeof(self.__value) > (self.__size if self.__grow is None else max(self.__size, self.__grow)):
+                raise SMSizeError
+
+            self.setValue(self.__value, mutex=True)
+        finally:
+            self.__releaseWrite()
+
+    def __len__(self) -> int:
+        """Return the size of the shared data.
+
+        Returns:
+            int: size of the shared data
+
+        Raises:
+            TypeError: raise an error when this method is called and tha data shared type is not a dict
+
+        """
+        if not self.getAvailability() or self.__semaphore is None:
+            if self.__log is not None:
+                self.__writeLog(1, "Shared Memory space doesn't exist.")
+            elif not self.__silent:
+                print("ERROR: Shared Memory space doesn't exist.")
+
+            return None
+        elif self.__array is not None:
+            return self.__array.__len__()
+        elif self.__slack is not None:
+            return self.__readFrame(slotCount)
+
+        self.__value = self.getValue()
 
         return self.__value.__len__()
 
@@ -706,12 +1672,12 @@ class SharedMemory:
                 print("ERROR: Shared Memory space doesn't exist.")
 
             return None
-        else:
-            self.__semaphore.acquire()
+        elif self.__array is not None:
+            return self.__read(lambda: self.__array.__contains__(key))
+        elif self.__slack is not None and self.__type == dict:
+            return self.__readFrame(lambda view: locateSlot(view, key) is not None)
 
-        self.__value = self.getValue(mutex=True)
-
-        self.__semaphore.release()
+        self.__value = self.getValue()
 
         return self.__value.__contains__(key)
 
@@ -732,16 +1698,18 @@ class SharedMemory:
                 print("ERROR: Shared Memory space doesn't exist.")
 
             return
-        else:
-            self.__semaphore.acquire()
 
-        self.__value = self.getValue(mutex=True)
+        self.__stats.count(DEL_ITEM)
+        self.__acquireWrite()
 
-        self.__value.__delitem__(key)
+        try:
+            self.__value = self.getValue(mutex=True)
 
-        self.setValue(self.__value, mutex=True)
+            self.__value.__delitem__(key)
 
-        self.__semaphore.release()
+            self.setValue(self.__value, mutex=True)
+        finally:
+            self.__releaseWrite()
 
     def __repr__(self) -> str:
         """Print value of the Client Class instance.
@@ -755,28 +1723,175 @@ class SharedMemory:
         return _s
 
     @staticmethod
-    def getSharedMemorySpace() -> list:
-        """Get list of all shared memory space."""
-        return SharedMemory.__getSharedMemoryList()
+    def attach(name: str, log: str = None, silent: bool = False, array: bool = False, monitor: bool = False, serializer: any = None) -> "SharedMemory":
+        """Attach a server instance to an existing shared memory space.
+
+        The space is mapped and its header read, the value is never decoded. The type comes from the header, the one
+        of an object of another serializer is taken from the first written value or decoded by getType().
+
+        Args:
+            name (str): name of the shared space
+            log (str, optional): write log into a file. Defaults to None.
+            silent (bool, optional): silent mode. Defaults to False.
+            array (bool, optional): map a numpy array over the shared space. Defaults to False.
+            monitor (bool, optional): publish the statistics of this instance, see readMonitor(). Defaults to False.
+            serializer (any, optional): serializer of the shared space, None uses "native" and refuses pickle. Defaults to None.
+
+        Raises:
+            SMNotDefined: raise an error when the shared memory space doesn't exist
+            SMUnsafeSerializer: raise an error when the shared space uses pickle and no serializer was given
+
+        Returns:
+            SharedMemory: server instance
+
+        """
+        _memory = SharedMemory(name, client=False, log=log, silent=True, array=array, monitor=monitor, serializer=serializer)
+        if _memory.__mapfile is None:
+            _memory.close()
+            raise SMNotDefined(name)
+
+        _memory.__silent = silent
+
+        return _memory
+
+    @staticmethod
+    def readMonitor(name: str) -> list:
+        """Read the statistics published by every instance monitoring a shared memory space.
+
+        Args:
+            name (str): shared memory name
+
+        Returns:
+            list: statistics of every live instance, with its pid
+
+        """
+        try:
+            _memory = posix_ipc.SharedMemory(_SHM_NAME_PREFIX + name + _MONITOR_SUFFIX)
+        except posix_ipc.ExistentialError:
+            return []
+
+        _size = _memory.size
+
+        with mmap.mmap(_memory.fd, _size) as _monitor:
+            _memory.close_fd()
+            _slots = [SMStats.read(_monitor, _slot * STATS_SIZE) for _slot in range(_size // STATS_SIZE)]
+
+        return [dict(pid=_pid, **_stats.toDict()) for _pid, _stats in _slots if SharedMemory.__isAlive(_pid)]
+
+    @staticmethod
+    def __isAlive(pid: int) -> bool:
+        """Check if a process is running.
+
+        Args:
+            pid (int): process id, 0 for none
+
+        Returns:
+            bool: the process is running
+
+        """
+        if pid == 0:
+            return False
+
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+
+        return True
+
+    @staticmethod
+    def getSharedMemorySpace(prefix: str = "") -> list:
+        """Get list of all shared memory space.
+
+        Args:
+            prefix (str, optional): only list the names starting with this prefix. Defaults to "".
+
+        Returns:
+            list: names of the shared spaces
+
+        """
+        return list(SharedMemory.__registry().entries(prefix))
+
+    @staticmethod
+    def getSharedMemoryInfo(prefix: str = "") -> dict:
+        """Get the registry entries of the shared memory spaces.
+
+        Args:
+            prefix (str, optional): only list the names starting with this prefix. Defaults to "".
+
+        Returns:
+            dict: size, type name, creator pid and creation time by name
+
+        """
+        return SharedMemory.__registry().entries(prefix)
+
+    @staticmethod
+    def createMany(values: dict, **kwargs) -> dict:
+        """Create several client instances, registered at once.
+
+        Args:
+            values (dict): shared values by name
+            **kwargs: constructor arguments shared by every instance
+
+        Returns:
+            dict: client instances by name
+
+        """
+        _memories = {}
+        SharedMemory.MAN = True
+
+        try:
+            for name, value in values.items():
+                _memories[name] = SharedMemory(name, value, client=True, **kwargs)
+        except BaseException:
+            for _memory in _memories.values():
+                _memory.close()
+
+            raise
+        finally:
+            SharedMemory.MAN = False
+
+        SharedMemory.__registry().register([_memory.__entry() for _memory in _memories.values()])
+
+        return _memories
+
+    @staticmethod
+    def closeMany(memories: list) -> None:
+        """Close several instances, unregistered at once.
+
+        Args:
+            memories (list): instances to close
+
+        """
+        SharedMemory.MAN = True
+
+        try:
+            for _memory in memories:
+                _memory.close()
+        finally:
+            SharedMemory.MAN = False
+
+        SharedMemory.__registry().unregister([_memory.__name_memory[5:] for _memory in memories if _memory.__unlinked])
+        SharedMemory.__registry().unregister([_memory.__name_memory[5:] for _memory in memories if _memory.__client and not _memory.__unlinked], os.getpid())
 
     @staticmethod
     def cleanSharedMemorySpace() -> None:
         """Clean all shared memory space."""
-        l = SharedMemory.__getSharedMemoryList()
+        l = SharedMemory.getSharedMemorySpace()
 
         for name in l:
-            if name == _MAN_NAME:
-                continue
             SharedMemory.__killShareMemorySpace(name)
 
-            if sys.platform == "darwin":
-                SharedMemory.__removeFromManager(name)
+        SharedMemory.__registry().unregister(l)
 
     @staticmethod
     def killManager() -> None:
         """Kill all shared memory with the manager."""
         SharedMemory.cleanSharedMemorySpace()
         SharedMemory.__killShareMemorySpace(_MAN_NAME)
+        dropRegistry(_SHM_NAME_PREFIX + _MAN_NAME)
 
     @staticmethod
     def __killShareMemorySpace(name: str) -> None:
@@ -792,49 +1907,18 @@ class SharedMemory:
         except:
             pass
 
-    @staticmethod
-    def __getSharedMemoryList() -> list:
-        """Get list of all shared memory space."""
-        if sys.platform == "darwin":
-            SharedMemory.MAN = True
-            man = SharedMemory(_MAN_NAME, client=False)
-
-            if not man.getAvailability():
-                man.close()
-                man = SharedMemory(_MAN_NAME, value=["man"], size=1024 * 10, client=True)
-
-            l = man.getValue()
-            SharedMemory.MAN = False
-
-            return l
-
-        return next(os.walk("/dev/shm/"), (None, None, []))[2]
-
-    @staticmethod
-    def __addToManager(name: str) -> None:
-        """Add a shared memory space to the manager."""
-        SharedMemory.MAN = True
-        man = SharedMemory(_MAN_NAME, client=False)
-
-        if not man.getAvailability():
-            man.close()
-            man = SharedMemory(_MAN_NAME, value=["man"], size=1024 * 10, client=True)
-
-        l = man.getValue()
-        l.append(name)
-        man.setValue(l)
-
-        SharedMemory.MAN = False
+        for _suffix in _RW_SUFFIXES + (_NOTIFY_SUFFIX,):
+            try:
+                posix_ipc.unlink_semaphore(_SEM_NAME_PREFIX + name + _suffix)
+            except posix_ipc.ExistentialError:
+                pass
 
     @staticmethod
-    def __removeFromManager(name: str) -> None:
-        """Remove a shared memory space from the manager."""
-        SharedMemory.MAN = True
-        man = SharedMemory(_MAN_NAME, client=False)
+    def __registry() -> SMRegistry:
+        """Return the registry of the shared memory spaces.
 
-        l = man.getValue()
-        if name in l:
-            l.remove(name)
+        Returns:
+            SMRegistry: registry opened by this process
 
-        man.setValue(l)
-        SharedMemory.MAN = False
+        """
+        return getRegistry(_SHM_NAME_PREFIX + _MAN_NAME, _SEM_NAME_PREFIX + _MAN_NAME, _MODE)
@@ -5,7 +5,7 @@ Author: Zentetsu
 
 ----
 
-Last Modified: Sun Nov 03 2024
+Last Modified: Sun Oct 18 2026
 Modified By: Zentetsu
 
 ----
@@ -34,6 +34,37 @@ HISTORY:
 2020-07-03	Zen	Adding import for Server
 2020-07-01	Zen	Creating file
 2021-10-19	Zen	Removing import
+2026-10-18	Zen	Adding import for SharedQueue
+2026-10-18	Zen	Adding import for AsyncSharedMemory
+2026-10-18	Zen	Adding import for SMSerializer
+2026-10-18	Zen	Importing AsyncSharedMemory on first access
+2026-10-18	Zen	Adding import for SharedRecord
+2026-10-18	Zen	Adding import for SharedTensorStore
+2026-10-18	Zen	Adding import for SharedCache and sharedCache
 """  # noqa
 
 from .SharedMemory import SharedMemory
+from .SMQueue import SharedQueue
+from .SMSerializer import SMSerializer
+import importlib
+
+_LAZY = {"AsyncSharedMemory": ".SMAsync", "SharedRecord": ".SMRecord", "SharedTensorStore": ".SMTensor", "SharedCache": ".SMCache", "sharedCache": ".SMCache"}
+
+
+def __getattr__(name: str) -> any:
+    """Import AsyncSharedMemory, SharedRecord, SharedTensorStore, SharedCache and sharedCache on first access so that asyncio and numpy are only loaded by their users.
+
+    Args:
+        name (str): attribute name
+
+    Raises:
+        AttributeError: raise an error when the attribute doesn't exist
+
+    Returns:
+        any: attribute
+
+    """
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+
+    raise AttributeError("module " + __name__ + " has no attribute " + name)
@@ -0,0 +1,75 @@
+"""
+File: bench_codec.py
+Created Date: Sunday, October 18th 2026, 11:02:47 am
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: decoding time per number of elements
+"""  # noqa
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SharedMemory.SMCodec import encode, decode
+import time
+
+
+def bench(value: any, repeat: int = 5) -> float:
+    """Return the best decoding time of an encoded value.
+
+    Args:
+        value (any): value to encode then decode
+        repeat (int, optional): number of measures. Defaults to 5.
+
+    Returns:
+        float: best decoding time in seconds
+
+    """
+    _encoded = encode(value)
+    _best = float("inf")
+
+    for _ in range(repeat):
+        _start = time.perf_counter()
+        decode(_encoded)
+        _best = min(_best, time.perf_counter() - _start)
+
+    return _best
+
+
+if __name__ == "__main__":
+    print("elements\tlist[int] (s)\tns/element\tdict[str, int] (s)\tns/element")
+
+    for n in (1_000, 10_000, 100_000):
+        _list_time = bench(list(range(n)))
+        _dict_time = bench({str(i): i for i in range(n)})
+
+        print(f"{n}\t{_list_time:.6f}\t{_list_time / n * 1e9:.1f}\t{_dict_time:.6f}\t{_dict_time / n * 1e9:.1f}")
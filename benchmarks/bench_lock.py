@@ -0,0 +1,151 @@
+"""
+File: bench_lock.py
+Created Date: Sunday, October 18th 2026, 12:20:14 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: mutex against reader-writer lock with one writer and many readers
+2026-10-18	Zen	Adding triple buffer mode
+"""  # noqa
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SharedMemory import SharedMemory
+import multiprocessing
+import argparse
+import numpy
+import time
+
+
+def reader(name: str, duration: float, start: multiprocessing.Event, results: multiprocessing.Queue) -> None:
+    """Read the shared value in a loop and report the number of reads.
+
+    Args:
+        name (str): shared memory name
+        duration (float): reading time in seconds
+        start (multiprocessing.Event): start signal
+        results (multiprocessing.Queue): reads count output
+
+    """
+    s = SharedMemory(name, client=False, silent=True)
+    _count = 0
+
+    start.wait()
+    _end = time.perf_counter() + duration
+
+    while time.perf_counter() < _end:
+        s.getValue()
+        _count += 1
+
+    results.put(_count)
+
+
+def writer(name: str, duration: float, start: multiprocessing.Event, value: any, results: multiprocessing.Queue) -> None:
+    """Write the shared value in a loop and report the number of writes.
+
+    Args:
+        name (str): shared memory name
+        duration (float): writing time in seconds
+        start (multiprocessing.Event): start signal
+        value (any): value to write
+        results (multiprocessing.Queue): writes count output
+
+    """
+    s = SharedMemory(name, client=False, silent=True)
+    _count = 0
+
+    start.wait()
+    _end = time.perf_counter() + duration
+
+    while time.perf_counter() < _end:
+        s.setValue(value)
+        _count += 1
+
+    results.put(_count)
+
+
+def bench(lock: str, readers: int, duration: float, value: any, buffers: int = 1) -> tuple:
+    """Run one writer and several readers on a shared memory using a given lock mode.
+
+    Args:
+        lock (str): lock mode
+        readers (int): number of reader processes
+        duration (float): benchmark time in seconds
+        value (any): shared value
+        buffers (int, optional): number of payload slots. Defaults to 1.
+
+    Returns:
+        tuple: reads per second and writes per second
+
+    """
+    c = SharedMemory("bench", value, client=True, silent=True, lock=lock, buffers=buffers)
+    _start = multiprocessing.Event()
+    _reads = multiprocessing.Queue()
+    _writes = multiprocessing.Queue()
+
+    _processes = [multiprocessing.Process(target=reader, args=("bench", duration, _start, _reads)) for _ in range(readers)]
+    _processes.append(multiprocessing.Process(target=writer, args=("bench", duration, _start, value, _writes)))
+
+    for p in _processes:
+        p.start()
+
+    time.sleep(0.5)
+    _start.set()
+
+    _read_count = sum(_reads.get() for _ in range(readers))
+    _write_count = _writes.get()
+
+    for p in _processes:
+        p.join()
+
+    c.close()
+
+    return _read_count / duration, _write_count / duration
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the single mutex with the reader-writer lock and the triple buffer.")
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 4, 16, 32])
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--size", type=int, default=1 << 20, help="shared array size in bytes")
+    args = parser.parse_args()
+
+    _value = numpy.zeros(args.size, dtype=numpy.uint8)
+
+    print("readers\tmode\treads/s\twrites/s")
+
+    for n in args.readers:
+        for _mode, lock, buffers in (("mutex", "mutex", 1), ("rwlock", "rwlock", 1), ("buffers=3", "mutex", 3)):
+            _reads, _writes = bench(lock, n, args.duration, _value, buffers)
+
+            print(f"{n}\t{_mode}\t{_reads:.0f}\t{_writes:.0f}")
@@ -0,0 +1,134 @@
+"""
+File: bench_queue.py
+Created Date: Sunday, October 18th 2026, 6:03:19 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: SharedQueue against multiprocessing.Queue messages per second
+"""  # noqa
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SharedMemory import SharedQueue
+import multiprocessing
+import argparse
+import time
+
+
+def producer(name: str, count: int, value: any) -> None:
+    """Put messages into a queue.
+
+    Args:
+        name (str): shared queue name or multiprocessing queue
+        count (int): number of messages
+        value (any): message
+
+    """
+    q = SharedQueue(name, silent=True) if isinstance(name, str) else name
+
+    for _ in range(count):
+        q.put(value)
+
+
+def consumer(name: str, count: int, batch: int) -> None:
+    """Get messages from a queue.
+
+    Args:
+        name (str): shared queue name or multiprocessing queue
+        count (int): number of messages
+        batch (int): number of messages per get_many call, 1 uses get
+
+    """
+    q = SharedQueue(name, silent=True) if isinstance(name, str) else name
+    _received = 0
+
+    while _received < count:
+        if batch > 1:
+            _received += len(q.get_many(min(batch, count - _received)))
+        else:
+            q.get()
+            _received += 1
+
+
+def bench(kind: str, producers: int, consumers: int, count: int, value: any, batch: int = 1) -> float:
+    """Run producers and consumers processes over a queue.
+
+    Args:
+        kind (str): "shared" or "multiprocessing"
+        producers (int): number of producer processes
+        consumers (int): number of consumer processes
+        count (int): total number of messages
+        value (any): message
+        batch (int, optional): consumer batch size on the shared queue. Defaults to 1.
+
+    Returns:
+        float: messages per second
+
+    """
+    _shared = SharedQueue("bench", client=True, silent=True) if kind == "shared" else None
+    _target = "bench" if _shared is not None else multiprocessing.Queue()
+
+    _processes = [multiprocessing.Process(target=producer, args=(_target, count // producers, value)) for _ in range(producers)]
+    _processes += [multiprocessing.Process(target=consumer, args=(_target, count // consumers, batch)) for _ in range(consumers)]
+
+    _start = time.perf_counter()
+
+    for p in _processes:
+        p.start()
+
+    for p in _processes:
+        p.join()
+
+    _elapsed = time.perf_counter() - _start
+
+    if _shared is not None:
+        _shared.close()
+
+    return count / _elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare SharedQueue with multiprocessing.Queue.")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--pairs", type=int, nargs="+", default=[1, 2, 4], help="number of producers and of consumers")
+    args = parser.parse_args()
+
+    print("pairs\tmessage\tmultiprocessing msg/s\tshared msg/s\tshared get_many msg/s")
+
+    for n in args.pairs:
+        for _label, _value in (("int", 42), ("dict", {"id": 1, "pos": [1.0, 2.0, 3.0], "name": "sensor"})):
+            _mp = bench("multiprocessing", n, n, args.count, _value)
+            _sq = bench("shared", n, n, args.count, _value)
+            _sqb = bench("shared", n, n, args.count, _value, batch=64)
+
+            print(f"{n}\t{_label}\t{_mp:.0f}\t{_sq:.0f}\t{_sqb:.0f}")
@@ -0,0 +1,95 @@
+"""
+File: compare.py
+Created Date: Sunday, October 18th 2026, 8:57:03 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: comparison of two benchmark suite results
+"""  # noqa
+
+
+import argparse
+import json
+
+_KEYS = ("type", "size", "lock", "buffers", "writers", "readers")
+
+
+def flatten(report: dict) -> dict:
+    """Index every numeric metric of a suite report.
+
+    Args:
+        report (dict): suite report
+
+    Returns:
+        dict: metric value per (group, case, metric) name
+
+    """
+    _metrics = {}
+
+    for _group, _results in report.items():
+        if not isinstance(_results, list):
+            continue
+
+        for _result in _results:
+            _case = " ".join(str(_result[k]) for k in _KEYS if k in _result)
+
+            for _name, _value in _result.items():
+                if isinstance(_value, dict):
+                    for _sub, _number in _value.items():
+                        _metrics[(_group, _case, _name + "." + _sub)] = _number
+                elif _name not in _KEYS and isinstance(_value, (int, float)):
+                    _metrics[(_group, _case, _name)] = _value
+
+    return _metrics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark suite results.")
+    parser.add_argument("base", help="JSON results of the reference commit")
+    parser.add_argument("new", help="JSON results of the compared commit")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change reported, 0.1 for 10%%")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        _base = flatten(json.load(f))
+
+    with open(args.new) as f:
+        _new = flatten(json.load(f))
+
+    print("group\tcase\tmetric\tbase\tnew\tchange")
+
+    for _key in sorted(_base.keys() & _new.keys()):
+        if _base[_key] == 0:
+            continue
+
+        _change = _new[_key] / _base[_key] - 1
+
+        if abs(_change) >= args.threshold:
+            print("\t".join(_key) + f"\t{_base[_key]:.6g}\t{_new[_key]:.6g}\t{_change:+.1%}")
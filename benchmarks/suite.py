@@ -0,0 +1,576 @@
+"""
+File: suite.py
+Created Date: Sunday, October 18th 2026, 8:21:40 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file: codec, latency, contention and lifecycle benchmarks with JSON results
+2026-10-18	Zen	Adding long string values
+2026-10-18	Zen	Adding serializer benchmarks
+2026-10-18	Zen	Adding registry benchmarks
+2026-10-18	Zen	Adding import and attach benchmarks
+2026-10-18	Zen	Adding tensor store benchmarks
+2026-10-18	Zen	Adding shared cache benchmarks
+"""  # noqa
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SharedMemory import SharedMemory, SharedTensorStore, sharedCache
+from SharedMemory.SMCodec import encode, decode
+import multiprocessing
+import functools
+import subprocess
+import platform
+import argparse
+import numpy
+import json
+import time
+
+_GROUPS = ("codec", "serializers", "latency", "contention", "lifecycle", "registry", "startup", "tensors", "cache")
+
+
+def percentiles(samples: list) -> dict:
+    """Summarize latency samples.
+
+    Args:
+        samples (list): durations in seconds
+
+    Returns:
+        dict: count, mean and percentiles in microseconds
+
+    """
+    _sorted = sorted(samples)
+    _pick = lambda q: _sorted[min(int(q * len(_sorted)), len(_sorted) - 1)] * 1e6  # noqa: E731
+
+    return {"count": len(_sorted), "mean_us": sum(_sorted) / len(_sorted) * 1e6, "p50_us": _pick(0.5), "p90_us": _pick(0.9), "p99_us": _pick(0.99), "max_us": _sorted[-1] * 1e6}
+
+
+def best(function: callable, repeat: int) -> float:
+    """Return the best time of several calls.
+
+    Args:
+        function (callable): measured call
+        repeat (int): number of calls
+
+    Returns:
+        float: best duration in seconds
+
+    """
+    _best = float("inf")
+
+    for _ in range(repeat):
+        _start = time.perf_counter()
+        function()
+        _best = min(_best, time.perf_counter() - _start)
+
+    return _best
+
+
+def values(quick: bool) -> list:
+    """Build the benchmarked values per type and size.
+
+    Args:
+        quick (bool): keep sizes small
+
+    Returns:
+        list: (type name, size, value) tuples
+
+    """
+    _values = [("int", 1, 123456789), ("float", 1, 3.14159), ("str", 16, "x" * 16), ("str", 255, "x" * 255), ("str", 65_536, "x" * 65_536)]
+
+    for n in (1_000, 10_000) if quick else (1_000, 10_000, 100_000):
+        _values.append(("list[int]", n, list(range(n))))
+        _values.append(("dict[str, int]", n, {str(i): i for i in range(n)}))
+        _values.append(("dict[str, dict]", n, {str(i): {"id": i, "pos": [1.0, 2.0], "tag": "t"} for i in range(n)}))
+
+    for n in (1 << 10, 1 << 20) if quick else (1 << 10, 1 << 20, 1 << 26, 1 << 30):
+        _values.append(("ndarray[uint8]", n, numpy.zeros(n, dtype=numpy.uint8)))
+
+    return _values
+
+
+def benchCodec(quick: bool) -> list:
+    """Measure encode and decode speed per type and per size.
+
+    Args:
+        quick (bool): keep sizes small
+
+    Returns:
+        list: results
+
+    """
+    _results = []
+
+    for _type, _size, _value in values(quick):
+        _repeat = 3 if _size >= 1 << 20 else 10
+        _encoded = encode(_value)
+        _encode = best(lambda: encode(_value), _repeat)
+        _decode = best(lambda: decode(_encoded), _repeat)
+
+        _results.append({"type": _type, "size": _size, "bytes": len(_encoded), "encode_s": _encode, "decode_s": _decode, "encode_mb_s": len(_encoded) / _encode / 1e6, "decode_mb_s": len(_encoded) / _decode / 1e6})
+
+    return _results
+
+
+def benchSerializers(quick: bool) -> list:
+    """Measure setValue/getValue time per serializer.
+
+    Args:
+        quick (bool): keep sizes small
+
+    Returns:
+        list: results
+
+    """
+    _results = []
+    _n = 1_000 if quick else 10_000
+    _array = numpy.zeros((1 << 20) // 8 if quick else (1 << 26) // 8)
+
+    for _type, _value in (
+        ("dict[str, int]", {str(i): i for i in range(_n)}),
+        ("dict[str, dict]", {str(i): {"id": i, "pos": [1.0, 2.0], "tag": "t"} for i in range(_n)}),
+        ("dict[str, ndarray]", {"frame": _array, "id": 1}),
+    ):
+        for serializer in ("native", "pickle") if "ndarray" in _type else ("native", "pickle", "marshal"):
+            c = SharedMemory("bench", _value, client=True, silent=True, serializer=serializer)
+            _results.append({"type": _type, "serializer": serializer, "setValue_s": best(lambda: c.setValue(_value), 5), "getValue_s": best(c.getValue, 5)})
+
+            c.close()
+
+    return _results
+
+
+def benchLatency(quick: bool) -> list:
+    """Measure getValue/setValue latency percentiles.
+
+    Args:
+        quick (bool): fewer samples
+
+    Returns:
+        list: results
+
+    """
+    _results = []
+    _samples = 1_000 if quick else 10_000
+
+    for _type, _value, _kwargs in (
+        ("int", 1, {}),
+        ("dict[str, int] 1k", {str(i): i for i in range(1_000)}, {}),
+        ("dict[str, int] 1k slack", {str(i): i for i in range(1_000)}, {"slack": 8}),
+        ("ndarray 1MB array", numpy.zeros(1 << 20, dtype=numpy.uint8), {"array": True}),
+    ):
+        for lock in ("mutex", "rwlock", "seqlock"):
+            c = SharedMemory("bench", _value, client=True, silent=True, lock=lock, **_kwargs)
+            _set, _get = [], []
+
+            for _ in range(_samples):
+                _start = time.perf_counter()
+                c.setValue(_value)
+                _set.append(time.perf_counter() - _start)
+
+                _start = time.perf_counter()
+                c.getValue()
+                _get.append(time.perf_counter() - _start)
+
+            c.close()
+
+            _results.append({"type": _type, "lock": lock, "setValue": percentiles(_set), "getValue": percentiles(_get)})
+
+    return _results
+
+
+def worker(name: str, write: bool, value: any, duration: float, start: multiprocessing.Event, results: multiprocessing.Queue) -> None:
+    """Read or write a shared value in a loop and report the number of operations.
+
+    Args:
+        name (str): shared memory name
+        write (bool): write instead of read
+        value (any): written value
+        duration (float): running time in seconds
+        start (multiprocessing.Event): start signal
+        results (multiprocessing.Queue): output as (write, count)
+
+    """
+    s = SharedMemory(name, client=False, silent=True)
+    _count = 0
+
+    start.wait()
+    _end = time.perf_counter() + duration
+
+    while time.perf_counter() < _end:
+        if write:
+            s.setValue(value)
+        else:
+            s.getValue()
+
+        _count += 1
+
+    results.put((write, _count))
+
+
+def benchContention(quick: bool) -> list:
+    """Measure N-writer/M-reader throughput across processes.
+
+    Args:
+        quick (bool): shorter runs
+
+    Returns:
+        list: results
+
+    """
+    _results = []
+    _duration = 0.5 if quick else 2.0
+    _value = {str(i): i for i in range(100)}
+
+    for _writers, _readers in ((1, 1), (1, 4), (2, 4), (4, 4)) if quick else ((1, 1), (1, 4), (1, 16), (2, 4), (4, 4), (4, 16)):
+        for lock, buffers in (("mutex", 1), ("rwlock", 1), ("seqlock", 1), ("mutex", 3)):
+            if lock == "seqlock" and _writers > 1:
+                continue
+
+            c = SharedMemory("bench", _value, client=True, silent=True, lock=lock, buffers=buffers)
+            _start = multiprocessing.Event()
+            _queue = multiprocessing.Queue()
+            _processes = [multiprocessing.Process(target=worker, args=("bench", i < _writers, _value, _duration, _start, _queue)) for i in range(_writers + _readers)]
+
+            for p in _processes:
+                p.start()
+
+            time.sleep(0.2)
+            _start.set()
+
+            _counts = [_queue.get() for _ in _processes]
+
+            for p in _processes:
+                p.join()
+
+            c.close()
+
+            _results.append(
+                {
+                    "writers": _writers,
+                    "readers": _readers,
+                    "lock": lock,
+                    "buffers": buffers,
+                    "writes_s": sum(n for w, n in _counts if w) / _duration,
+                    "reads_s": sum(n for w, n in _counts if not w) / _duration,
+                }
+            )
+
+    return _results
+
+
+def benchLifecycle(quick: bool) -> list:
+    """Measure creation, attach and close cost.
+
+    Args:
+        quick (bool): fewer samples
+
+    Returns:
+        list: results
+
+    """
+    _results = []
+    _samples = 50 if quick else 500
+
+    for _type, _value in (("int", 1), ("dict[str, int] 1k", {str(i): i for i in range(1_000)}), ("ndarray 1MB", numpy.zeros(1 << 20, dtype=numpy.uint8))):
+        _create, _attach, _close = [], [], []
+
+        for _ in range(_samples):
+            _start = time.perf_counter()
+            c = SharedMemory("bench", _value, client=True, silent=True)
+            _create.append(time.perf_counter() - _start)
+
+            _start = time.perf_counter()
+            s = SharedMemory("bench", client=False, silent=True)
+            _attach.append(time.perf_counter() - _start)
+
+            _start = time.perf_counter()
+            s.close()
+            c.close()
+            _close.append(time.perf_counter() - _start)
+
+        _results.append({"type": _type, "create": percentiles(_create), "attach": percentiles(_attach), "close": percentiles(_close)})
+
+    return _results
+
+
+def benchRegistry(quick: bool) -> list:
+    """Measure the creation and close cost of many live shared spaces, one by one and in bulk.
+
+    Args:
+        quick (bool): fewer shared spaces
+
+    Returns:
+        list: results
+
+    """
+    _results = []
+    _count = 1_000 if quick else 10_000
+    _names = ["b" + str(i) for i in range(_count)]
+
+    _create, _memories = [], []
+    _begin = time.perf_counter()
+
+    for name in _names:
+        _start = time.perf_counter()
+        _memories.append(SharedMemory(name, 1, client=True, silent=True))
+        _create.append(time.perf_counter() - _start)
+
+    _total = time.perf_counter() - _begin
+    _list = best(lambda: SharedMemory.getSharedMemorySpace("b1"), 5)
+    _close = []
+
+    for _memory in _memories:
+        _start = time.perf_counter()
+        _memory.close()
+        _close.append(time.perf_counter() - _start)
+
+    _tenth = _count // 10
+    _results.append(
+        {
+            "mode": "single",
+            "count": _count,
+            "create_s": _total,
+            "create_first_10%": percentiles(_create[:_tenth]),
+            "create_last_10%": percentiles(_create[-_tenth:]),
+            "list_prefix_s": _list,
+            "close": percentiles(_close),
+        }
+    )
+
+    _start = time.perf_counter()
+    _memories = SharedMemory.createMany(dict.fromkeys(_names, 1), silent=True)
+    _create = time.perf_counter() - _start
+
+    _start = time.perf_counter()
+    SharedMemory.closeMany(list(_memories.values()))
+    _results.append({"mode": "bulk", "count": _count, "create_s": _create, "close_s": time.perf_counter() - _start})
+
+    return _results
+
+
+def benchStartup(quick: bool) -> list:
+    """Measure the package import time in a fresh interpreter and the attach time of large shared spaces.
+
+    Args:
+        quick (bool): fewer runs and smaller values
+
+    Returns:
+        list: results
+
+    """
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    _script = "import time; _start = time.perf_counter(); import SharedMemory; print(time.perf_counter() - _start)"
+    _imports = [float(subprocess.run([sys.executable, "-c", _script], cwd=_root, capture_output=True, text=True).stdout) for _ in range(5 if quick else 20)]
+    _results = [{"type": "import", "import": percentiles(_imports)}]
+    _n = 10_000 if quick else 100_000
+
+    for _type, _value, _kwargs in (
+        ("dict[str, int]", {str(i): i for i in range(_n)}, {}),
+        ("dict[str, dict] pickle", {str(i): {"id": i, "tag": "t"} for i in range(_n)}, {"serializer": "pickle"}),
+        ("ndarray", numpy.zeros(_n * 64, dtype=numpy.uint8), {}),
+    ):
+        c = SharedMemory("bench", _value, client=True, silent=True, **_kwargs)
+        _attach = lambda: SharedMemory.attach("bench", silent=True, **_kwargs)  # noqa: E731
+        _read = lambda: SharedMemory.attach("bench", silent=True, **_kwargs).getValue()  # noqa: E731
+
+        _results.append({"type": _type, "attach_s": best(_attach, 10), "attach_getValue_s": best(_read, 10)})
+        c.close()
+
+    return _results
+
+
+def benchTensors(quick: bool) -> list:
+    """Measure many named arrays stored as separate array mode spaces against a single tensor store.
+
+    Args:
+        quick (bool): fewer arrays
+
+    Returns:
+        list: results
+
+    """
+    _arrays = {"t" + str(i): numpy.ones((i % 7 + 1) * 1_000, dtype=numpy.float32) for i in range(16 if quick else 64)}
+    _nbytes = sum(_array.nbytes for _array in _arrays.values())
+
+    _start = time.perf_counter()
+    _memories = [SharedMemory(_name, _array, client=True, silent=True, array=True) for _name, _array in _arrays.items()]
+    _create = time.perf_counter() - _start
+
+    _start = time.perf_counter()
+    _servers = [SharedMemory.attach(_name, silent=True, array=True) for _name in _arrays]
+    _views = [_server.getValue() for _server in _servers]
+    _attach = time.perf_counter() - _start
+
+    _results = [{"mode": "segments", "arrays": len(_arrays), "bytes": _nbytes, "shared_bytes": sum(os.path.getsize("/dev/shm/psm_" + _name) for _name in _arrays), "create_s": _create, "attach_s": _attach}]
+
+    del _views, _servers
+
+    SharedMemory.closeMany(_memories)
+
+    _start = time.perf_counter()
+    c = SharedTensorStore("bench", size=_nbytes + 64 * len(_arrays), client=True, silent=True)
+
+    for _name, _array in _arrays.items():
+        c.put(_name, _array)
+
+    _create = time.perf_counter() - _start
+
+    _start = time.perf_counter()
+    s = SharedTensorStore("bench", silent=True)
+    _views = [s[_name] for _name in s.keys()]
+    _attach = time.perf_counter() - _start
+
+    _results.append({"mode": "store", "arrays": len(_arrays), "bytes": _nbytes, "shared_bytes": os.path.getsize("/dev/shm/psm_bench"), "create_s": _create, "attach_s": _attach})
+
+    del _views
+    s.close()
+    c.close()
+
+    return _results
+
+
+def expensive(x: int) -> dict:
+    """Compute a result worth caching, about a millisecond of pure Python work.
+
+    Args:
+        x (int): argument
+
+    Returns:
+        dict: result
+
+    """
+    _total = 0
+
+    for i in range(20_000):
+        _total = (_total * 31 + i * x) % 1_000_003
+
+    return {"x": x, "total": _total, "digits": [int(_d) for _d in str(_total)]}
+
+
+def cachedCalls(keys: list) -> list:
+    """Call the shared cached function from another process.
+
+    Args:
+        keys (list): arguments
+
+    Returns:
+        list: durations in seconds
+
+    """
+    _cached = sharedCache("bench", silent=True)(expensive)
+    _samples = []
+
+    for _key in keys:
+        _start = time.perf_counter()
+        _cached(_key)
+        _samples.append(time.perf_counter() - _start)
+
+    _cached.cache.close()
+
+    return _samples
+
+
+def benchCache(quick: bool) -> list:
+    """Measure a shared cache hit against the recompute, in the computing process and in another one.
+
+    Args:
+        quick (bool): fewer keys
+
+    Returns:
+        list: results
+
+    """
+    _keys = list(range(100 if quick else 1_000))
+    _cached = sharedCache("bench", silent=True)(expensive)
+    _local = functools.lru_cache(maxsize=None)(expensive)
+    _cached.cache.clear()
+    _results = []
+
+    for _key in _keys:
+        _local(_key)
+
+    for _mode, _function in (("recompute", expensive), ("shared miss", _cached), ("shared hit", _cached), ("lru_cache hit", _local)):
+        _samples = []
+
+        for _key in _keys:
+            _start = time.perf_counter()
+            _function(_key)
+            _samples.append(time.perf_counter() - _start)
+
+        _results.append({"mode": _mode, "latency": percentiles(_samples)})
+
+    with multiprocessing.get_context("fork").Pool(1) as _pool:
+        _results.append({"mode": "shared hit other process", "latency": percentiles(_pool.apply(cachedCalls, (_keys,)))})
+
+    _results.append({"mode": "stats", **_cached.cache.stats()})
+    _cached.cache.close(remove=True)
+
+    return _results
+
+
+def metadata() -> dict:
+    """Describe the environment of the run.
+
+    Returns:
+        dict: commit, interpreter, platform and date
+
+    """
+    try:
+        _commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        _commit = None
+
+    return {"commit": _commit, "python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count(), "numpy": numpy.__version__, "date": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the SharedMemory benchmark suite and write the results as JSON.")
+    parser.add_argument("groups", nargs="*", choices=_GROUPS + ((),), default=(), help="benchmark groups, all when omitted")
+    parser.add_argument("--quick", action="store_true", help="small sizes and short runs")
+    parser.add_argument("--output", default=None, help="JSON file, stdout when omitted")
+    args = parser.parse_args()
+
+    _report = {"meta": metadata(), "quick": args.quick}
+    _benches = {"codec": benchCodec, "serializers": benchSerializers, "latency": benchLatency, "contention": benchContention, "lifecycle": benchLifecycle, "registry": benchRegistry, "startup": benchStartup, "tensors": benchTensors, "cache": benchCache}
+
+    for _group in args.groups or _GROUPS:
+        print("running " + _group + "...", file=sys.stderr)
+        _report[_group] = _benches[_group](args.quick)
+
+    if args.output is None:
+        json.dump(_report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(_report, f, indent=2)
@@ -0,0 +1,100 @@
+"""
+File: test_async.py
+Created Date: Sunday, October 18th 2026, 7:58:14 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file
+"""  # noqa
+
+from SharedMemory import SharedMemory, AsyncSharedMemory
+import unittest
+import asyncio
+
+
+class TestAsyncSharedMemory(unittest.TestCase):
+    """Test the AsyncSharedMemory class."""
+
+    def test_value(self) -> None:
+        """Test awaitable reads and writes."""
+
+        async def run() -> bool:
+            c = AsyncSharedMemory(SharedMemory("async1", {"a": 1}, size=1024, client=True, silent=True))
+            res1 = await c.getValue() == {"a": 1}
+            await c.setValue({"a": 2, "b": 3})
+            await c.setItem("b", 4)
+            res2 = await c.getItem("b") == 4 and await c.getValue() == {"a": 2, "b": 4}
+            c.memory.close()
+
+            return res1 and res2
+
+        try:
+            self.assertTrue(asyncio.run(run()))
+        except:
+            self.assertTrue(False)
+
+    def test_changes(self) -> None:
+        """Test iterating over the changes of several shared spaces in one event loop."""
+
+        async def watch(s: AsyncSharedMemory) -> list:
+            return [value async for value in s.changes(interval=0.001)]
+
+        async def run() -> bool:
+            c = [SharedMemory("async" + str(i), 0, size=1024, client=True, silent=True) for i in range(2, 5)]
+            s = [AsyncSharedMemory(SharedMemory("async" + str(i), client=False, silent=True)) for i in range(2, 5)]
+            tasks = [asyncio.create_task(watch(w)) for w in s]
+            await asyncio.sleep(0.01)
+
+            for i in range(1, 4):
+                for m in c:
+                    m.setValue(i)
+
+                await asyncio.sleep(0.02)
+
+            for m in c:
+                m.close()
+
+            res1 = all(r == [1, 2, 3] for r in await asyncio.gather(*tasks))
+            res2 = await s[0].waitForChange(0, timeout=0.01) is None
+
+            for w in s:
+                w.memory.close()
+
+            return res1 and res2
+
+        try:
+            self.assertTrue(asyncio.run(run()))
+        except:
+            self.assertTrue(False)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestAsyncSharedMemory)
+    testResult = unittest.TextTestRunner(verbosity=2).run(suite)
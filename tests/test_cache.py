@@ -0,0 +1,136 @@
+"""
+File: test_cache.py
+Created Date: Sunday, October 18th 2026, 11:59:59 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file
+2026-10-18	Zen	Adding serializer and foreign shared space tests
+"""  # noqa
+
+from SharedMemory import SharedMemory, SharedCache, sharedCache
+from SharedMemory.SMError import SMAlreadyExist, SMUnsafeSerializer
+import unittest
+import time
+
+
+class TestSharedCache(unittest.TestCase):
+    """Test the SharedCache class."""
+
+    def test_cache(self) -> None:
+        """Test values and counters shared between two instances."""
+        try:
+            c = SharedCache("cache1", capacity=4096, entries=64, serializer="pickle", silent=True)
+            s = SharedCache("cache1", serializer="pickle", silent=True)
+
+            c["a"] = [1, 2, 3]
+            c.set((1, "b"), {"x": None})
+            res1 = s["a"] == [1, 2, 3] and s.get((1, "b")) == {"x": None} and s.get("c", 4) == 4 and (1, "b") in s and len(s) == 2
+
+            res2 = s.delete("a") and "a" not in c and not c.delete("a")
+
+            _stats = c.stats()
+            res3 = _stats["hits"] == 2 and _stats["misses"] == 1 and _stats["entries"] == 1
+
+            s.close()
+            c.close(remove=True)
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_eviction(self) -> None:
+        """Test LRU eviction within the byte budget and TTL expiration."""
+        try:
+            c = SharedCache("cache2", capacity=1000, entries=16, silent=True)
+
+            for i in range(40):
+                c.set(i, "v" * 50)
+                c.get(0)
+
+            _stats = c.stats()
+            res1 = 0 in c and 1 not in c and 39 in c and _stats["evictions"] > 0 and _stats["bytes"] <= 1000 and not c.set("big", "v" * 2000)
+
+            c.set("t", 1, ttl=0.05)
+            time.sleep(0.1)
+            res2 = "t" not in c and c.get("t") is None and c.stats()["expirations"] == 1
+
+            c.close(remove=True)
+            self.assertTrue(res1 and res2)
+        except:
+            self.assertTrue(False)
+
+    def test_decorator(self) -> None:
+        """Test a function computed once for every set of arguments."""
+        try:
+            _calls = []
+
+            @sharedCache("cache3", capacity=4096, entries=64)
+            def f(x: int, y: int = 1) -> int:
+                _calls.append(x)
+                return x * y
+
+            res1 = f(2) == 2 and f(2) == 2 and f(2, y=3) == 6 and f(2, y=3) == 6 and _calls == [2, 2]
+            res2 = f.cache.stats()["hits"] == 2 and f.cache.stats()["misses"] == 2
+
+            f.cache.close(remove=True)
+            self.assertTrue(res1 and res2)
+        except:
+            self.assertTrue(False)
+
+    def test_open(self) -> None:
+        """Test opening a pickle cache without pickle, and a shared space that isn't a cache."""
+        try:
+            c = SharedCache("cache4", capacity=4096, entries=64, serializer="pickle", silent=True)
+
+            try:
+                SharedCache("cache4", silent=True)
+                res1 = False
+            except SMUnsafeSerializer:
+                res1 = True
+
+            c.close(remove=True)
+
+            m = SharedMemory("cache5", {"a": 1}, client=True, silent=True)
+
+            try:
+                SharedCache("cache5", silent=True)
+                res2 = False
+            except SMAlreadyExist:
+                res2 = True
+
+            res2 = res2 and m.getValue() == {"a": 1}
+            m.close()
+            self.assertTrue(res1 and res2)
+        except:
+            self.assertTrue(False)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSharedCache)
+    testResult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -5,7 +5,7 @@ Author: Zentetsu
 
 ----
 
-Last Modified: Thu Nov 07 2024
+Last Modified: Sun Oct 18 2026
 Modified By: Zentetsu
 
 ----
@@ -42,15 +42,47 @@ HISTORY:
 2023-09-08	Zen	Adding numpy test
 2023-10-18	Zen	Updating test: checking manager
 2024-11-03	Zen	Updating docstring + unittest
+2026-10-18	Zen	Adding array mode test
+2026-10-18	Zen	Adding reader-writer lock test
+2026-10-18	Zen	Adding seqlock test
+2026-10-18	Zen	Adding generation test
+2026-10-18	Zen	Adding slotted layout test
+2026-10-18	Zen	Adding lazy view test
+2026-10-18	Zen	Adding segment header test
+2026-10-18	Zen	Adding transaction test
+2026-10-18	Zen	Adding triple buffer test
+2026-10-18	Zen	Adding statistics test
+2026-10-18	Zen	Adding growable shared space test
+2026-10-18	Zen	Adding compact encoding test
+2026-10-18	Zen	Adding serializer test
+2026-10-18	Zen	Adding compression test
+2026-10-18	Zen	Adding registry test
+2026-10-18	Zen	Updating seqlock test: releasing the lock on failing item writes
+2026-10-18	Zen	Updating compression test: stored payloads reusing the encode buffer
+2026-10-18	Zen	Updating header test: version 2
+2026-10-18	Zen	Updating transaction test: int keys of a dict
+2026-10-18	Zen	Updating registry test: server instances closing the space
+2026-10-18	Zen	Updating serializer test: pickle given explicitly to server instances
+2026-10-18	Zen	Updating serializer test: incomplete serializers
+2026-10-18	Zen	Updating transaction test: list membership
 """  # noqa
 
 # import sys
 
 # sys.path.insert(0, "../")
 
-from SharedMemory.SharedMemory import SharedMemory
+from SharedMemory.SharedMemory import SharedMemory, _SHM_NAME_PREFIX
+from SharedMemory.SMCodec import encode, decode
+from SharedMemory.SMError import SMUnsafeSerializer
+from SharedMemory.SMSerializer import SMSerializer
+from fractions import Fraction
 import numpy as np
+import threading
 import unittest
+import posix_ipc
+import struct
+import mmap
+import os
 
 
 class TestSharedMemoryClient(unittest.TestCase):
@@ -178,6 +210,460 @@ class TestSharedMemoryClient(unittest.TestCase):
         except:
             self.assertTrue(False)
 
+    def test_array(self) -> None:
+        """Test client creation in zero-copy array mode."""
+        try:
+            _np_test = np.arange(24, dtype=np.float64).reshape((4, 6))
+            c = SharedMemory("test14", _np_test, client=True, silent=True, array=True)
+            s = SharedMemory("test14", client=False, silent=True, array=True)
+            res1 = not c.getValue().flags.writeable and (s.getValue() == _np_test).all()
+            c[1:3] = np.zeros((2, 6))
+            s[:, 3] = np.ones(4)
+            res2 = (s[1] == [0, 0, 0, 1, 0, 0]).all() and c.getValue()[0, 3] == 1
+
+            with s.lockedView() as v:
+                v[0, 0] = 42
+
+            res3 = c[0, 0] == 42 and s.getValue().shape == _np_test.shape
+            s.close()
+            c.close()
+            self.assertTrue("test14" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_rwlock(self) -> None:
+        """Test client creation with a reader-writer lock."""
+        try:
+            c = SharedMemory("test15", {"a": 1, "b": [1, 2]}, size=1024, client=True, silent=True, lock="rwlock")
+            s = SharedMemory("test15", client=False, silent=True)
+            c["a"] = 2
+            s["b"] = [3]
+            res1 = s["a"] == 2 and c.getValue() == {"a": 2, "b": [3]}
+            res2 = len(s) == 2 and "b" in c
+            del s["a"]
+            res3 = c.getValue() == {"b": [3]}
+            s.close()
+            c.close()
+            self.assertTrue("test15" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_seqlock(self) -> None:
+        """Test client creation with lock-free reads."""
+        try:
+            c = SharedMemory("test16", [1.5, 2.5], size=1024, client=True, silent=True, lock="seqlock")
+            s = SharedMemory("test16", client=False, silent=True)
+            c.setValue([3.5, 4.5])
+            res1 = s.getValue() == [3.5, 4.5] and s[1] == 4.5
+            s[0] = 0.5
+            res2 = c.getValue() == [0.5, 4.5] and len(c) == 2 and 0.5 in c
+
+            res3 = True
+
+            for _fail in (lambda: c.__setitem__(10, 5.5), lambda: c.__delitem__(10)):
+                try:
+                    _fail()
+                    res3 = False
+                except IndexError:
+                    pass
+
+                res3 = res3 and s.getValue() == [0.5, 4.5]
+
+            c[1] = 5.5
+            res3 = res3 and s.getValue() == [0.5, 5.5]
+            s.close()
+            c.close()
+            self.assertTrue("test16" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_generation(self) -> None:
+        """Test waiting for a change of the shared value."""
+        try:
+            c = SharedMemory("test17", 0, size=1024, client=True, silent=True)
+            s = SharedMemory("test17", client=False, silent=True)
+            _generation = s.getGeneration()
+            res1 = s.waitForChange(_generation, timeout=0.05) == _generation
+            threading.Timer(0.05, c.setValue, args=(1,)).start()
+            res2 = s.waitForChange(_generation, timeout=5) == _generation + 1 and s.getValue() == 1
+            c[0] = 2
+            res3 = c.getGeneration() == _generation + 2
+            s.close()
+            c.close()
+            self.assertTrue("test17" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_slack(self) -> None:
+        """Test in-place updates of dict and list entries."""
+        try:
+            c = SharedMemory("test18", {"a": 1, "b": "xy"}, size=1024, client=True, silent=True, slack=8)
+            s = SharedMemory("test18", client=False, silent=True)
+            c["a"] = 5
+            c["b"] = "longer than the slot"
+            s["c"] = [1, 2]
+            res1 = s.getValue() == {"a": 5, "b": "longer than the slot", "c": [1, 2]}
+            del s["a"]
+            res2 = c.getValue() == {"b": "longer than the slot", "c": [1, 2]} and c["c"] == [1, 2]
+            c.close()
+            s.close()
+            c = SharedMemory("test18", [1, "a", 2.5], size=1024, client=True, silent=True, slack=4)
+            c[-1] = 3.5
+            c[1] = "bcd"
+            res3 = c.getValue() == [1, "bcd", 3.5] and len(c) == 3
+            c.close()
+            self.assertTrue("test18" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_view(self) -> None:
+        """Test lazy views over slotted dict and list."""
+        try:
+            c = SharedMemory("test19", {str(i): i for i in range(100)}, client=True, silent=True, slack=0)
+            s = SharedMemory("test19", client=False, silent=True)
+            v = s.getValue(lazy=True)
+            res1 = len(v) == 100 and "42" in v and "100" not in v and v["42"] == 42 and list(v)[:2] == ["0", "1"]
+            c["42"] = -42
+            res2 = v["42"] == -42 and s[42] == -42 and "99" in s and len(s) == 100
+            c.close()
+            s.close()
+            c = SharedMemory("test19", [0, "a", [1, 2]], size=1024, client=True, silent=True, slack=0)
+            v = c.view()
+            res3 = len(v) == 3 and v[-1] == [1, 2] and v[0:2] == [0, "a"]
+            c.close()
+            self.assertTrue("test19" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_header(self) -> None:
+        """Test the segment header fields."""
+        try:
+            c = SharedMemory("test20", "abc", size=1024, client=True, silent=True)
+            s = SharedMemory("test20", client=False, silent=True)
+            m = posix_ipc.SharedMemory(_SHM_NAME_PREFIX + "test20")
+            h = mmap.mmap(m.fd, m.size)
+            m.close_fd()
+            res1 = h[0:4] == b"PSHM" and h[4] == 2 and h[5] == 1 and struct.unpack_from(">Q", h, 8)[0] == 6
+            res2 = struct.unpack_from(">Q", h, 24)[0] == 1 and struct.unpack_from(">I", h, 40)[0] == os.getpid()
+            c.close()
+            res3 = h[5] == 2 and not s.getAvailability() and s.getValue() is None
+            h.close()
+            s.close()
+            c = SharedMemory("test20", np.zeros(8), client=True, silent=True, array=True)
+            res4 = c.getValue().ctypes.data % 64 == 0
+            c.close()
+            self.assertTrue("test20" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3 and res4)
+        except:
+            self.assertTrue(False)
+
+    def test_transaction(self) -> None:
+        """Test grouping reads and writes under a single lock acquisition."""
+        try:
+            c = SharedMemory("test21", {"a": 1, "b": [1, 2]}, size=1024, client=True, silent=True)
+            s = SharedMemory("test21", client=False, silent=True)
+            g = s.getGeneration()
+
+            with s.transaction() as v:
+                res1 = v["a"] == 1
+
+            res1 = res1 and s.getGeneration() == g
+
+            with s.transaction() as v:
+                v["a"] += 1
+                v["b"].append(3)
+                v["c"] = "new"
+
+            res2 = c.getValue() == {"a": 2, "b": [1, 2, 3], "c": "new"} and s.getGeneration() == g + 1
+
+            try:
+                with s.transaction() as v:
+                    v["a"] = 10
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+            res3 = c["a"] == 2
+            c.setValue({"1": 1})
+            s[1] = 5
+
+            with s.transaction() as v:
+                res3 = res3 and v[1] == 5
+                v[1] = 7
+
+            res3 = res3 and c.getValue() == {"1": 7}
+            c.close()
+            s.close()
+            c = SharedMemory("test21", {"a": 1, "b": [1, 2]}, size=1024, client=True, silent=True, slack=4)
+
+            with c.transaction() as v:
+                v["a"] = 5
+                v["b"].append(3)
+                res4 = "b" in v and len(v) == 2
+
+            with c.transaction() as v:
+                v["z"] = 0
+
+            c["1"] = 1
+
+            with c.transaction() as v:
+                v[1] = 2
+
+            res5 = c.getValue() == {"a": 5, "b": [1, 2, 3], "z": 0, "1": 2}
+            c.close()
+            c = SharedMemory("test21", [10, 20, 30], size=1024, client=True, silent=True, slack=4)
+
+            with c.transaction() as v:
+                v[0] = 15
+                res5 = res5 and 15 in v and 20 in v and 10 not in v and 1 not in v
+
+            c.close()
+            c = SharedMemory("test21", 7, size=1024, client=True, silent=True)
+
+            with c.transaction() as v:
+                v.value += 1
+
+            res5 = res5 and c.getValue() == 8
+            c.close()
+            self.assertTrue("test21" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3 and res4 and res5)
+        except:
+            self.assertTrue(False)
+
+    def test_buffers(self) -> None:
+        """Test readers taking the latest published buffer without waiting for the writer."""
+        try:
+            c = SharedMemory("test22", {"frame": 0, "data": [0.0] * 8}, client=True, silent=True, buffers=3)
+            s = SharedMemory("test22", client=False, silent=True)
+            res1 = True
+
+            for i in range(10):
+                c.setValue({"frame": i, "data": [float(i)] * 8})
+                res1 = res1 and s.getValue() == {"frame": i, "data": [float(i)] * 8}
+
+            with c.transaction() as v:
+                v["frame"] = 10
+                res2 = s["frame"] == 9
+
+            res2 = res2 and s["frame"] == 10 and len(s) == 2
+
+            try:
+                SharedMemory("test23", np.zeros(4), client=True, silent=True, array=True, buffers=3)
+                res3 = False
+            except ValueError:
+                res3 = True
+
+            c.close()
+            s.close()
+            self.assertTrue("test22" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_stats(self) -> None:
+        """Test runtime statistics and their publication into the monitoring segment."""
+        try:
+            c = SharedMemory("test24", {"a": 1, "b": [1, 2]}, client=True, silent=True, monitor=True)
+            s = SharedMemory("test24", client=False, silent=True, monitor=True)
+            c.stats(reset=True)
+            s.stats(reset=True)
+
+            for i in range(5):
+                c.setValue({"a": i, "b": [1, 2]})
+                s.getValue()
+
+            _stats = s.stats()
+            res1 = _stats["calls"]["getValue"] == 5 and _stats["bytes"]["read"] > 0 and _stats["decode"]["count"] == 5
+            res2 = _stats["wait"]["count"] == _stats["hold"]["count"] >= 5 and _stats["hold"]["p99_us"] >= _stats["hold"]["p50_us"] > 0
+
+            c.stats()
+            _monitor = SharedMemory.readMonitor("test24")
+            res3 = len(_monitor) == 2 and sorted(_stats["calls"]["setValue"] for _stats in _monitor) == [0, 5]
+
+            res4 = s.stats(reset=True)["calls"]["getValue"] == 5 and s.stats()["calls"]["getValue"] == 0
+
+            s.close()
+            c.close()
+            self.assertTrue("test24" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3 and res4 and SharedMemory.readMonitor("test24") == [])
+        except:
+            self.assertTrue(False)
+
+    def test_grow(self) -> None:
+        """Test growing the shared space past its initial size, remapping attached instances and shrinking it back."""
+        try:
+            c = SharedMemory("test25", [0] * 10, client=True, silent=True, grow=1 << 20)
+            s = SharedMemory("test25", client=False, silent=True)
+            _size = posix_ipc.SharedMemory(_SHM_NAME_PREFIX + "test25").size
+
+            res1 = c.setValue(list(range(10_000))) and s.getValue() == list(range(10_000))
+            res1 = res1 and posix_ipc.SharedMemory(_SHM_NAME_PREFIX + "test25").size > _size
+            res2 = not c.setValue(list(range(400_000))) and s[9_999] == 9_999
+
+            for i in range(64):
+                c.setValue([i] * 10)
+
+            res3 = posix_ipc.SharedMemory(_SHM_NAME_PREFIX + "test25").size < 1 << 16 and s.getValue() == [63] * 10
+
+            s[0] = 1
+            res3 = res3 and c.getValue() == [1] + [63] * 9
+
+            try:
+                SharedMemory("test26", np.zeros(4), client=True, silent=True, array=True, grow=1 << 20)
+                res4 = False
+            except ValueError:
+                res4 = True
+
+            c.close()
+            s.close()
+            self.assertTrue("test25" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3 and res4)
+        except:
+            self.assertTrue(False)
+
+    def test_compact(self) -> None:
+        """Test the compact encoding with long strings and big ints, and decoding the legacy framed format."""
+        try:
+            v = {"small": [0, -32, 95, True, False], "big": [1 << 100, -(1 << 70)], "text": "x" * 1000, "nested": ({"a": 1.5}, 2j)}
+            c = SharedMemory("test27", v, client=True, silent=True)
+            s = SharedMemory("test27", client=False, silent=True)
+            res1 = s.getValue() == v and len(encode([1] * 100)) == 103
+
+            legacy = b"\xaa\x06\x00\x00\x00\x00\x00\x00\x00\x27\xaa\x04\x01a\xbb\xaa\x05\x00\x00\x00\x00\x00\x00\x00\x17\xaa\x00\x08\x00\x00\x00\x00\x00\x00\x00\x01\xbb\xaa\x02\x01\x01\xbb\xaa\x04\x02xy\xbb\xbb\xbb"
+            res2 = decode(legacy) == {"a": [1, True, "xy"]}
+
+            c.close()
+            s.close()
+            self.assertTrue("test27" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2)
+        except:
+            self.assertTrue(False)
+
+    def test_serializer(self) -> None:
+        """Test the pickle and marshal serializers, server instances refusing pickle unless it is given."""
+        try:
+            v = {"frame": np.arange(16, dtype=np.float32), "ratio": Fraction(1, 3)}
+            c = SharedMemory("test28", v, client=True, silent=True, serializer="pickle")
+
+            try:
+                SharedMemory("test28", client=False, silent=True)
+                res1 = False
+            except SMUnsafeSerializer:
+                res1 = True
+
+            s = SharedMemory("test28", client=False, silent=True, serializer="pickle")
+            r = s.getValue()
+            res1 = res1 and (r["frame"] == v["frame"]).all() and not r["frame"].flags.writeable and r["ratio"] == Fraction(1, 3)
+
+            s["ratio"] = Fraction(2, 3)
+            res1 = res1 and c["ratio"] == Fraction(2, 3)
+            c.close()
+            s.close()
+
+            c = SharedMemory("test28", {"ids": {1, 2}, "raw": b"xy"}, client=True, silent=True, serializer="marshal")
+            s = SharedMemory("test28", client=False, silent=True, serializer="marshal")
+            res2 = s.getValue() == {"ids": {1, 2}, "raw": b"xy"}
+
+            res3 = True
+
+            for _serializer in (None, "pickle"):
+                try:
+                    SharedMemory("test28", client=False, silent=True, serializer=_serializer)
+                    res3 = False
+                except ValueError:
+                    pass
+
+            try:
+                SharedMemory("test29", np.zeros(4), client=True, silent=True, array=True, serializer="pickle")
+                res3 = False
+            except ValueError:
+                pass
+
+            class _Incomplete(SMSerializer):
+                ID = 200
+
+                def encodeInto(self, buffer: bytearray, value: any) -> int:
+                    return 0
+
+            try:
+                _Incomplete()
+                res3 = False
+            except TypeError:
+                pass
+
+            c.close()
+            s.close()
+            self.assertTrue("test28" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_compress(self) -> None:
+        """Test zlib and lzma compression, server instances using the codec of the client."""
+        try:
+            v = {str(i): {"id": i, "tag": "sensor", "pos": [0.0, 0.0]} for i in range(2000)}
+            c = SharedMemory("test30", v, client=True, silent=True)
+            _size = posix_ipc.SharedMemory(_SHM_NAME_PREFIX + "test30").size
+            c.close()
+
+            c = SharedMemory("test30", v, client=True, silent=True, compress="zlib", level=1)
+            s = SharedMemory("test30", client=False, silent=True)
+            res1 = posix_ipc.SharedMemory(_SHM_NAME_PREFIX + "test30").size < _size and s.getValue() == v
+
+            s["1"] = {"id": -1}
+            res1 = res1 and c["1"] == {"id": -1} and c.stats()["compression_ratio"] > 1 and s.stats()["decompress"]["count"] > 0
+            c.close()
+            s.close()
+
+            c = SharedMemory("test30", [1, 2, 3], client=True, silent=True, compress="lzma")
+            c.setValue(["x" * 10_000])
+            res2 = c.getValue() == ["x" * 10_000] and c.stats()["bytes"]["compressed"] > 0
+            _written = c.stats()["bytes"]["written"]
+
+            for i in range(100):
+                c.setValue([i])
+                res2 = res2 and c.getValue() == [i]
+
+            res2 = res2 and c.stats()["bytes"]["written"] - _written == sum(len(encode([i])) + 1 for i in range(100))
+            c.close()
+
+            try:
+                SharedMemory("test30", np.zeros(4), client=True, silent=True, array=True, compress="zlib")
+                res3 = False
+            except ValueError:
+                res3 = True
+
+            self.assertTrue("test30" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_registry(self) -> None:
+        """Test the registry entries, prefix listing and bulk creation."""
+        try:
+            c = SharedMemory("test31", {"a": 1}, client=True, silent=True)
+            _info = SharedMemory.getSharedMemoryInfo("test31")
+            res1 = list(_info) == ["test31"] and _info["test31"]["type"] == "dict" and _info["test31"]["pid"] == os.getpid() and _info["test31"]["size"] >= 4096
+            s = SharedMemory("test31", client=False, silent=True)
+            s.close()
+            res1 = res1 and "test31" not in SharedMemory.getSharedMemorySpace()
+            c.close()
+
+            _memories = SharedMemory.createMany({"t31_" + str(i): i for i in range(2000)}, silent=True)
+            res2 = len(SharedMemory.getSharedMemorySpace("t31_")) == 2000 and _memories["t31_7"].getValue() == 7
+            SharedMemory.closeMany(list(_memories.values()))
+
+            self.assertTrue("test31" not in SharedMemory.getSharedMemorySpace() and SharedMemory.getSharedMemorySpace("t31_") == [])
+            self.assertTrue(res1 and res2)
+        except:
+            self.assertTrue(False)
+
     def test_file(self) -> None:
         """Test client creation from a JSON file."""
         try:
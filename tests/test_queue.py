@@ -0,0 +1,109 @@
+"""
+File: test_queue.py
+Created Date: Sunday, October 18th 2026, 5:48:02 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file
+"""  # noqa
+
+from SharedMemory import SharedQueue
+import threading
+import unittest
+import queue
+
+
+class TestSharedQueue(unittest.TestCase):
+    """Test the SharedQueue class."""
+
+    def test_order(self) -> None:
+        """Test values are returned in queue order."""
+        try:
+            c = SharedQueue("queue1", 1024, client=True, silent=True)
+            s = SharedQueue("queue1", silent=True)
+            c.put(1)
+            c.put_nowait("abc")
+            c.put({"a": [1, 2]})
+            res1 = len(s) == 3 and s.get() == 1 and s.get_many(10) == ["abc", {"a": [1, 2]}] and s.empty()
+            s.close()
+            c.close()
+            self.assertTrue(res1)
+        except:
+            self.assertTrue(False)
+
+    def test_wrap(self) -> None:
+        """Test records wrapping around the end of the ring."""
+        try:
+            c = SharedQueue("queue2", 64, client=True, silent=True)
+            res1 = True
+
+            for i in range(100):
+                c.put("x" * (i % 20))
+                c.put(i)
+                res1 = res1 and c.get() == "x" * (i % 20) and c.get() == i
+
+            c.close()
+            self.assertTrue(res1)
+        except:
+            self.assertTrue(False)
+
+    def test_blocking(self) -> None:
+        """Test blocking on empty and full queue."""
+        try:
+            c = SharedQueue("queue3", 32, client=True, silent=True)
+
+            try:
+                c.get(timeout=0.05)
+                res1 = False
+            except queue.Empty:
+                res1 = True
+
+            c.put("a" * 20)
+
+            try:
+                c.put_nowait("b" * 20)
+                res2 = False
+            except queue.Full:
+                res2 = True
+
+            t = threading.Timer(0.05, c.get)
+            t.start()
+            c.put("b" * 20, timeout=5)
+            t.join()
+            res3 = c.get_nowait() == "b" * 20
+            c.close()
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSharedQueue)
+    testResult = unittest.TextTestRunner(verbosity=2).run(suite)
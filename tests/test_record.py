@@ -0,0 +1,149 @@
+"""
+File: test_record.py
+Created Date: Sunday, October 18th 2026, 11:59:40 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file
+2026-10-18	Zen	Adding consistent snapshot test
+2026-10-18	Zen	Adding wide record test
+"""  # noqa
+
+from SharedMemory import SharedMemory, SharedRecord
+from SharedMemory.SMError import SMNotDefined
+import multiprocessing
+import unittest
+import time
+
+
+def writeRecords(name: str, stop: multiprocessing.Event) -> None:
+    """Update every field of a record with the same counter until stopped.
+
+    Args:
+        name (str): record name
+        stop (multiprocessing.Event): stop signal
+
+    """
+    s = SharedRecord(name, silent=True)
+    i = 0
+
+    while not stop.is_set():
+        i += 1
+        s.update({"a": i, "b": i, "c": [i] * 4})
+
+
+class TestSharedRecord(unittest.TestCase):
+    """Test the SharedRecord class."""
+
+    def test_record(self) -> None:
+        """Test field reads and writes between a client and a server."""
+        try:
+            c = SharedRecord("record1", {"x": "f8", "n": "i4", "v": ("f4", (3,)), "tag": "U8"}, value={"x": 1.5, "tag": "a"}, client=True, silent=True)
+            s = SharedRecord("record1", silent=True)
+            res1 = s["x"] == 1.5 and s["tag"] == "a" and len(s) == 4 and s.dtype == c.dtype
+
+            _generation = c.memory.getGeneration()
+            s["n"] = 5
+            s.update({"x": 2.0, "v": [1, 2, 3]})
+            res2 = c.getValue()["n"] == 5 and c["x"] == 2.0 and list(c["v"]) == [1, 2, 3] and c.memory.getGeneration() == _generation + 2
+            res3 = not c.view().flags.writeable
+
+            c.close()
+            self.assertTrue("record1" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_table(self) -> None:
+        """Test a table updated row by row."""
+        try:
+            c = SharedRecord("record2", [("id", "i8"), ("px", "f8")], value=[{"id": 1}, (2, 0.5)], rows=4, client=True, silent=True)
+            s = SharedRecord("record2", schema={"id": "i8", "px": "f8"}, silent=True)
+            s[2] = {"id": 3, "px": 9.0}
+            s[3, "px"] = 4.0
+            res1 = c[1] == {"id": 2, "px": 0.5} and c[2, "id"] == 3 and list(c["px"]) == [0.0, 0.5, 9.0, 4.0] and len(c) == 4
+
+            try:
+                SharedRecord("record2", schema={"id": "i4"}, silent=True)
+                res2 = False
+            except ValueError:
+                res2 = True
+
+            c.close()
+
+            try:
+                SharedRecord("record2", silent=True)
+                res2 = False
+            except SMNotDefined:
+                pass
+
+            self.assertTrue(res1 and res2)
+        except:
+            self.assertTrue(False)
+
+    def test_snapshot(self) -> None:
+        """Test record snapshots taken while another process writes them."""
+        try:
+            c = SharedRecord("record3", {"a": "i8", "b": "i8", "c": ("i8", 4)}, client=True, silent=True, lock="seqlock")
+            _stop = multiprocessing.get_context("fork").Event()
+            _writer = multiprocessing.get_context("fork").Process(target=writeRecords, args=("record3", _stop))
+            _writer.start()
+
+            res1 = True
+            _end = time.time() + 0.5
+
+            while time.time() < _end:
+                _value = c.getValue()
+                res1 = res1 and _value["a"] == _value["b"] == _value["c"][0] == _value["c"][3]
+
+            _stop.set()
+            _writer.join()
+            c.close()
+            self.assertTrue(res1)
+        except:
+            self.assertTrue(False)
+
+    def test_wide(self) -> None:
+        """Test a record with a long structured dtype description."""
+        try:
+            _schema = {"field" + str(i).zfill(2): "f8" if i % 2 else "i4" for i in range(64)}
+            c = SharedRecord("record4", _schema, value={"field63": 2.5}, client=True, silent=True)
+            s = SharedRecord("record4", _schema, silent=True)
+            s["field10"] = 7
+            res1 = c["field63"] == 2.5 and c["field10"] == 7 and len(c) == 64 and c.dtype == s.dtype
+
+            c.close()
+            self.assertTrue(res1)
+        except:
+            self.assertTrue(False)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSharedRecord)
+    testResult = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -40,6 +40,8 @@ HISTORY:
 2020-07-01	Zen	Creating file
 2023-10-18	Zen	Updating test: checking manager
 2024-11-03	Zen	Updating docstring + unittest
+2026-10-18	Zen	Adding attach test
+2026-10-18	Zen	Updating attach test: pickle given explicitly
 """  # noqa
 
 # import sys
@@ -47,6 +49,8 @@ HISTORY:
 # sys.path.insert(0, "../")
 
 from SharedMemory.SharedMemory import SharedMemory
+from SharedMemory.SMError import SMNotDefined
+from fractions import Fraction
 import unittest
 
 
@@ -177,6 +181,32 @@ class TestSharedMemoryServer(unittest.TestCase):
         except:
             self.assertTrue(False)
 
+    def test_attach(self) -> None:
+        """Test attaching without decoding the value, the type coming from the header."""
+        try:
+            c = SharedMemory("test10", {"a": 1, "b": [1, 2]}, client=True, silent=True)
+            s = SharedMemory.attach("test10", silent=True)
+            res1 = s.getType() is dict and s.stats()["decode"]["count"] == 0 and s["a"] == 1
+            s.close()
+            c.close()
+
+            c = SharedMemory("test10", Fraction(1, 3), client=True, silent=True, serializer="pickle")
+            s = SharedMemory.attach("test10", silent=True, serializer="pickle")
+            res2 = s.stats()["decode"]["count"] == 0 and s.getType() is Fraction
+            s.close()
+            c.close()
+
+            try:
+                SharedMemory.attach("test10", silent=True)
+                res3 = False
+            except SMNotDefined:
+                res3 = True
+
+            self.assertTrue("test10" not in SharedMemory.getSharedMemorySpace())
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
 
 if __name__ == "__main__":
     suite = unittest.TestLoader().loadTestsFromTestCase(TestSharedMemoryServer)
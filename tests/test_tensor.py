@@ -0,0 +1,108 @@
+"""
+File: test_tensor.py
+Created Date: Sunday, October 18th 2026, 11:59:58 pm
+Author: Zentetsu
+
+----
+
+Last Modified: Sun Oct 18 2026
+Modified By: Zentetsu
+
+----
+
+Project: SharedMemory
+Copyright (c) 2020 Zentetsu
+
+----
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+----
+
+HISTORY:
+2026-10-18	Zen	Creating file
+"""  # noqa
+
+from SharedMemory import SharedTensorStore
+from SharedMemory.SMError import SMSizeError
+import numpy as np
+import unittest
+
+
+class TestSharedTensorStore(unittest.TestCase):
+    """Test the SharedTensorStore class."""
+
+    def test_views(self) -> None:
+        """Test aligned zero-copy views seen by another instance, arrays allocated later included."""
+        try:
+            c = SharedTensorStore("tensor1", size=1 << 20, client=True, silent=True)
+            _weights = c.allocate("weights", (3, 5), "float32")
+            _weights[...] = 1
+            c.put("bias", np.arange(7, dtype=np.int16))
+            c["table"] = np.zeros(2, dtype=[("a", "u1"), ("b", "f8", (2,))])
+
+            s = SharedTensorStore("tensor1", silent=True)
+            res1 = s.keys() == ["weights", "bias", "table"] and s["weights"].sum() == 15 and list(s["bias"]) == list(range(7)) and s["table"].dtype == c["table"].dtype
+            res2 = all(s[_name].ctypes.data % 64 == 0 and not s[_name].flags.writeable for _name in s.keys())
+
+            c.put("later", np.ones(3))
+            c["bias"] = np.zeros(7, dtype=np.int16)
+            res3 = "later" in s and len(s) == 4 and s["later"].sum() == 3 and s["bias"].sum() == 0
+
+            s.close()
+            c.close()
+            self.assertTrue(res1 and res2 and res3)
+        except:
+            self.assertTrue(False)
+
+    def test_errors(self) -> None:
+        """Test allocation errors."""
+        try:
+            c = SharedTensorStore("tensor2", size=4096, entries=2, client=True, silent=True)
+            c.allocate("a", 8)
+
+            try:
+                c.allocate("a", 8)
+                res1 = False
+            except KeyError:
+                res1 = True
+
+            try:
+                c["a"] = np.zeros(3)
+                res1 = False
+            except ValueError:
+                pass
+
+            try:
+                c.allocate("big", 1 << 20)
+                res1 = False
+            except SMSizeError:
+                pass
+
+            c.allocate("b", 8)
+
+            try:
+                c.allocate("c", 8)
+                res1 = False
+            except SMSizeError:
+                pass
+
+            c.close()
+            self.assertTrue(res1)
+        except:
+            self.assertTrue(False)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestSharedTensorStore)
+    testResult = unittest.TextTestRunner(verbosity=2).run(suite)